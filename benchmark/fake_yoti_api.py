@@ -0,0 +1,674 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+This module contains an offline stand-in of the Yoti API.
+
+It serves the profile endpoint used by the yoti connection, signed and
+encrypted like the real API, with configurable latency, errors and
+throttling, so that the connection can be load tested without Yoti
+credentials or quota. Point the connection at it with 'yoti_api_url'.
+
+Run it with:
+
+    python -m benchmark.fake_yoti_api --key-file key.pem --generate-key
+"""
+
+import argparse
+import asyncio
+import base64
+import datetime
+import hashlib
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import asn1
+from aiohttp import web
+from cryptography import x509
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import padding as symmetric_padding
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.x509.oid import NameOID
+from yoti_python_sdk.anchor import SOURCE_EXTENSION, VERIFIER_EXTENSION
+from yoti_python_sdk.config import X_YOTI_AUTH_DIGEST, X_YOTI_AUTH_KEY
+from yoti_python_sdk.protobuf.attribute_public_api import List_pb2
+from yoti_python_sdk.protobuf.common_public_api import EncryptedData_pb2
+from yoti_python_sdk.protobuf.protobuf import Protobuf
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8088
+API_PREFIX = "/api/v1"
+
+SCENARIO_AGE = "age"
+SCENARIO_IDENTITY = "identity"
+SCENARIOS = (SCENARIO_AGE, SCENARIO_IDENTITY)
+
+DEFAULT_USERS = 1000
+DEFAULT_ERROR_STATUSES = (500, 502, 503)
+DEFAULT_HANG_TIME = 60.0
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+GIVEN_NAMES = ("Jane", "John", "Alex", "Maria", "Wei", "Amara", "Oliver", "Priya")
+FAMILY_NAMES = ("Smith", "Jones", "Garcia", "Chen", "Okafor", "Novak", "Patel")
+NATIONALITIES = ("GBR", "USA", "FRA", "DEU", "IND", "NGA", "CHN")
+TOWNS = ("London", "Manchester", "Leeds", "Bristol", "Cambridge")
+
+
+class FaultProfile:
+    """
+    Latency and failures of the fake Yoti API.
+
+    The latency of a response follows a log-normal distribution with median
+    'latency' seconds, or is fixed when 'latency_sigma' is 0. Independently
+    of the latency, a request is answered with a random status of
+    'error_statuses' with probability 'error_rate', with 429 with
+    probability 'throttle_rate' or when it exceeds 'max_rps' requests per
+    second, and hangs for 'hang_time' seconds with probability 'hang_rate'.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_sigma: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = DEFAULT_ERROR_STATUSES,
+        throttle_rate: float = 0.0,
+        max_rps: Optional[float] = None,
+        hang_rate: float = 0.0,
+        hang_time: float = DEFAULT_HANG_TIME,
+    ) -> None:
+        """
+        Initialize the fault profile.
+
+        :param latency: the median number of seconds taken by a response.
+        :param latency_sigma: the shape of the log-normal latency, 0 for a fixed latency.
+        :param error_rate: the probability of answering with a server error.
+        :param error_statuses: the statuses of the server errors.
+        :param throttle_rate: the probability of answering with 429.
+        :param max_rps: the number of requests per second answered before throttling, None for no limit.
+        :param hang_rate: the probability of a request hanging.
+        :param hang_time: the number of seconds a hanging request takes before a 504.
+        """
+        for name, rate in (
+            ("error_rate", error_rate),
+            ("throttle_rate", throttle_rate),
+            ("hang_rate", hang_rate),
+        ):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1.")
+        if latency < 0 or latency_sigma < 0:
+            raise ValueError("latency and latency_sigma must not be negative.")
+        if max_rps is not None and max_rps <= 0:
+            raise ValueError("max_rps must be greater than 0.")
+        if error_rate > 0 and len(error_statuses) == 0:
+            raise ValueError("error_statuses must not be empty.")
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.throttle_rate = throttle_rate
+        self.max_rps = max_rps
+        self.hang_rate = hang_rate
+        self.hang_time = hang_time
+
+    def sample_latency(self, rand: random.Random) -> float:
+        """
+        Draw the latency of a response.
+
+        :param rand: the source of randomness.
+        :return: the number of seconds.
+        """
+        if self.latency == 0 or self.latency_sigma == 0:
+            return self.latency
+        return rand.lognormvariate(math.log(self.latency), self.latency_sigma)
+
+
+def generate_test_key(key_file_path: str, key_size: int = 2048) -> None:
+    """
+    Write a new RSA key usable as a Yoti key file.
+
+    :param key_file_path: the path of the key file.
+    :param key_size: the number of bits of the key.
+    :return: None
+    """
+    key = rsa.generate_private_key(
+        public_exponent=65537, key_size=key_size, backend=default_backend()
+    )
+    with open(key_file_path, "wb") as key_file:
+        key_file.write(
+            key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.TraditionalOpenSSL,
+                encryption_algorithm=serialization.NoEncryption(),
+            )
+        )
+
+
+def _anchor_extension_value(value: str) -> bytes:
+    """Encode the value of an anchor extension, a UTF8String in an OctetString."""
+    encoder = asn1.Encoder()
+    encoder.start()
+    encoder.write(value.encode("utf-8"), asn1.Numbers.UTF8String)
+    inner = encoder.output()
+    encoder = asn1.Encoder()
+    encoder.start()
+    encoder.write(inner, asn1.Numbers.OctetString)
+    return encoder.output()
+
+
+def _anchor_certificate(key: rsa.RSAPrivateKey, oid: str, value: str) -> bytes:
+    """Build the DER certificate of an anchor, read back by the SDK's Anchor."""
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, f"fake-yoti-{value}")])
+    now = datetime.datetime.utcnow()
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=365))
+        .add_extension(
+            x509.UnrecognizedExtension(
+                x509.ObjectIdentifier(oid), _anchor_extension_value(value)
+            ),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256(), default_backend())
+    )
+    return certificate.public_bytes(serialization.Encoding.DER)
+
+
+class FakeYotiApi:
+    """
+    Offline stand-in of the Yoti API.
+
+    Tokens are minted with 'make_token' for the 'age' or 'identity'
+    scenario and can be shared once, like the tokens of the Yoti redirect.
+    The profile endpoint checks the request signature with the public half
+    of the organisation key and answers with a receipt encrypted with it.
+    """
+
+    def __init__(
+        self,
+        key_file_path: str,
+        sdk_id: Optional[str] = None,
+        faults: Optional[FaultProfile] = None,
+        verify_signatures: bool = True,
+        single_use_tokens: bool = True,
+        users: int = DEFAULT_USERS,
+        selfie_size: int = 0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the fake Yoti API.
+
+        :param key_file_path: the path to the Yoti key file of the organisation.
+        :param sdk_id: the Yoti client sdk id accepted, None to accept any.
+        :param faults: the latency and failures of the responses.
+        :param verify_signatures: whether to check the signature of the requests.
+        :param single_use_tokens: whether a token can only be shared once.
+        :param users: the number of distinct users sharing their profile.
+        :param selfie_size: the number of bytes of the selfie of the 'identity' scenario, 0 for none.
+        :param seed: the seed of the randomness, None for a random one.
+        """
+        if users < 1:
+            raise ValueError("users must be at least 1.")
+        with open(key_file_path, "rb") as key_file:
+            key = serialization.load_pem_private_key(
+                key_file.read().strip(), password=None, backend=default_backend()
+            )
+        self._public_key = key.public_key()
+        self._auth_key = base64.b64encode(
+            self._public_key.public_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+        ).decode("utf-8")
+        self.sdk_id = sdk_id
+        self.faults = faults if faults is not None else FaultProfile()
+        self.verify_signatures = verify_signatures
+        self.single_use_tokens = single_use_tokens
+        self.users = users
+        self.selfie_size = selfie_size
+        self._rand = random.Random(seed)  # nosec
+        self._anchors = self._make_anchors()
+        self._profiles: Dict[Tuple[str, int], bytes] = {}
+        self._application_profile = self._make_application_profile()
+        self._used_tokens: set = set()
+        self._rps_tokens = self.faults.max_rps or 0.0
+        self._rps_updated_at = time.monotonic()
+        self.statuses: "Counter[int]" = Counter()
+        self._peers: set = set()
+        self._runner: Optional[web.AppRunner] = None
+        self._api_url: Optional[str] = None
+
+    @property
+    def requests(self) -> int:
+        """Get the number of profile requests answered."""
+        return sum(self.statuses.values())
+
+    @property
+    def connections(self) -> int:
+        """Get the number of distinct client connections served."""
+        return len(self._peers)
+
+    @property
+    def api_url(self) -> str:
+        """Get the url to set as 'yoti_api_url' of the connection."""
+        if self._api_url is None:
+            raise ValueError("Call start first!")
+        return self._api_url
+
+    def make_token(
+        self, scenario: str = SCENARIO_AGE, user: Optional[int] = None
+    ) -> str:
+        """
+        Mint a one-time token, as given to the redirect page of the organisation.
+
+        :param scenario: the scenario of the profile shared, 'age' or 'identity'.
+        :param user: the user sharing the profile, None for a random one.
+        :return: the token, encrypted with the organisation key.
+        """
+        if scenario not in SCENARIOS:
+            raise ValueError(f"Got scenario={scenario}, expected one of {SCENARIOS}.")
+        if user is None:
+            user = self._rand.randrange(self.users)
+        plain_token = f"{scenario}.{user}.{self._rand.getrandbits(64):016x}"
+        return base64.urlsafe_b64encode(
+            self._public_key.encrypt(plain_token.encode("utf-8"), padding.PKCS1v15())
+        ).decode("utf-8")
+
+    def make_tokens(self, count: int, scenario: str = SCENARIO_AGE) -> List[str]:
+        """
+        Mint one-time tokens.
+
+        :param count: the number of tokens.
+        :param scenario: the scenario of the profiles shared.
+        :return: the tokens.
+        """
+        return [self.make_token(scenario) for _ in range(count)]
+
+    def make_app(self) -> web.Application:
+        """
+        Build the web application of the fake Yoti API.
+
+        :return: the application.
+        """
+        app = web.Application(middlewares=[self._track_connections])
+        app.router.add_get(API_PREFIX + "/profile/{token}", self._handle_profile)
+        app.router.add_get("/fake/tokens", self._handle_tokens)
+        app.router.add_get("/fake/stats", self._handle_stats)
+        return app
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = 0) -> str:
+        """
+        Serve the fake Yoti API on the running event loop.
+
+        :param host: the host to listen on.
+        :param port: the port to listen on, 0 for a free one.
+        :return: the url to set as 'yoti_api_url' of the connection.
+        """
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self._api_url = f"http://{host}:{port}{API_PREFIX}"
+        return self._api_url
+
+    async def stop(self) -> None:
+        """Stop serving the fake Yoti API."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._api_url = None
+
+    def _make_anchors(self) -> Dict[str, Any]:
+        """
+        Build the source and verifier anchors attached to the attributes.
+
+        The anchors are made from an attribute list, as the SDK's List_pb2
+        imports its own copy of the Attribute_pb2 module.
+        """
+        holder = List_pb2.AttributeList().attributes.add()
+        key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048, backend=default_backend()
+        )
+        anchors = {}
+        for name, oid, value, sub_type in (
+            ("passport", SOURCE_EXTENSION, "PASSPORT", "OCR"),
+            ("user_provided", SOURCE_EXTENSION, "USER_PROVIDED", ""),
+            ("yoti_admin", VERIFIER_EXTENSION, "YOTI_ADMIN", ""),
+        ):
+            anchor = holder.anchors.add()
+            anchor.origin_server_certs.append(_anchor_certificate(key, oid, value))
+            anchor.sub_type = sub_type
+            anchors[name] = anchor
+        return anchors
+
+    def _add_attribute(
+        self,
+        attribute_list: List_pb2.AttributeList,
+        name: str,
+        value: bytes,
+        content_type: int = Protobuf.CT_STRING,
+        anchors: Sequence[str] = ("passport", "yoti_admin"),
+    ) -> None:
+        """Add an attribute with its anchors to an attribute list."""
+        attribute = attribute_list.attributes.add()
+        attribute.name = name
+        attribute.value = value
+        attribute.content_type = content_type
+        for anchor in anchors:
+            attribute.anchors.append(self._anchors[anchor])
+
+    def _make_application_profile(self) -> bytes:
+        """Build the serialised profile of the organisation."""
+        attribute_list = List_pb2.AttributeList()
+        for name, value in (
+            ("application_name", "Fake Yoti organisation"),
+            ("application_url", "http://localhost"),
+            ("application_receipt_bgcolor", "#2875bc"),
+        ):
+            self._add_attribute(attribute_list, name, value.encode("utf-8"), anchors=())
+        return attribute_list.SerializeToString()
+
+    def _make_profile(self, scenario: str, user: int) -> bytes:
+        """Build the serialised profile shared by a user, the same on every share."""
+        key = (scenario, user)
+        profile = self._profiles.get(key)
+        if profile is not None:
+            return profile
+        rand = random.Random(user)  # nosec
+        attribute_list = List_pb2.AttributeList()
+        if scenario == SCENARIO_AGE:
+            self._add_attribute(attribute_list, "age_over:18", b"true")
+        else:
+            given_names = rand.choice(GIVEN_NAMES)
+            family_name = rand.choice(FAMILY_NAMES)
+            date_of_birth = datetime.date(1950, 1, 1) + datetime.timedelta(
+                days=rand.randrange(50 * 365)
+            )
+            address = {
+                "address_format": 1,
+                "building_number": str(rand.randrange(1, 200)),
+                "address_line1": f"{rand.randrange(1, 200)} High Street",
+                "town_city": rand.choice(TOWNS),
+                "postal_code": f"AB{rand.randrange(10, 99)} {rand.randrange(1, 9)}CD",
+                "country_iso": "GBR",
+                "country": "United Kingdom",
+            }
+            for name, value, content_type in (
+                ("given_names", given_names, Protobuf.CT_STRING),
+                ("family_name", family_name, Protobuf.CT_STRING),
+                ("full_name", f"{given_names} {family_name}", Protobuf.CT_STRING),
+                ("date_of_birth", date_of_birth.isoformat(), Protobuf.CT_DATE),
+                ("gender", rand.choice(("FEMALE", "MALE")), Protobuf.CT_STRING),
+                ("nationality", rand.choice(NATIONALITIES), Protobuf.CT_STRING),
+                ("structured_postal_address", json.dumps(address), Protobuf.CT_JSON),
+            ):
+                self._add_attribute(
+                    attribute_list, name, value.encode("utf-8"), content_type
+                )
+            for name, value in (
+                ("email_address", f"user{user}@example.com"),
+                ("phone_number", f"+4477{user:08d}"),
+            ):
+                self._add_attribute(
+                    attribute_list,
+                    name,
+                    value.encode("utf-8"),
+                    anchors=("user_provided",),
+                )
+            if self.selfie_size > 0:
+                selfie = b"\xff\xd8\xff\xe0" + os.urandom(max(0, self.selfie_size - 6))
+                self._add_attribute(
+                    attribute_list, "selfie", selfie + b"\xff\xd9", Protobuf.CT_JPEG
+                )
+        profile = attribute_list.SerializeToString()
+        self._profiles[key] = profile
+        return profile
+
+    @staticmethod
+    def _encrypt(receipt_key: bytes, content: bytes) -> str:
+        """Encrypt content with a receipt key, as the Yoti API does."""
+        iv = os.urandom(16)
+        padder = symmetric_padding.PKCS7(128).padder()
+        padded = padder.update(content) + padder.finalize()
+        encryptor = Cipher(
+            algorithms.AES(receipt_key), modes.CBC(iv), backend=default_backend()
+        ).encryptor()
+        encrypted_data = EncryptedData_pb2.EncryptedData(
+            iv=iv, cipher_text=encryptor.update(padded) + encryptor.finalize()
+        )
+        return base64.b64encode(encrypted_data.SerializeToString()).decode("utf-8")
+
+    def _make_receipt(self, scenario: str, user: int) -> Dict[str, str]:
+        """Build the receipt of a profile share."""
+        receipt_key = os.urandom(32)
+        remember_me_id = hashlib.sha256(f"{self.sdk_id}.{user}".encode("utf-8"))
+        return {
+            "receipt_id": base64.b64encode(os.urandom(64)).decode("utf-8"),
+            "timestamp": datetime.datetime.utcnow().strftime(TIMESTAMP_FORMAT),
+            "remember_me_id": base64.b64encode(remember_me_id.digest()).decode("utf-8"),
+            "parent_remember_me_id": base64.b64encode(
+                hashlib.sha256(f"parent.{user}".encode("utf-8")).digest()
+            ).decode("utf-8"),
+            "sharing_outcome": "SUCCESS",
+            "wrapped_receipt_key": base64.b64encode(
+                self._public_key.encrypt(receipt_key, padding.PKCS1v15())
+            ).decode("utf-8"),
+            "profile_content": self._encrypt(receipt_key, self._application_profile),
+            "other_party_profile_content": self._encrypt(
+                receipt_key, self._make_profile(scenario, user)
+            ),
+        }
+
+    def _is_throttled(self) -> bool:
+        """Check whether a request exceeds the throttling of the fault profile."""
+        if self.faults.throttle_rate > 0 and (
+            self._rand.random() < self.faults.throttle_rate
+        ):
+            return True
+        if self.faults.max_rps is None:
+            return False
+        now = time.monotonic()
+        self._rps_tokens = min(
+            self.faults.max_rps,
+            self._rps_tokens + (now - self._rps_updated_at) * self.faults.max_rps,
+        )
+        self._rps_updated_at = now
+        if self._rps_tokens < 1:
+            return True
+        self._rps_tokens -= 1
+        return False
+
+    @web.middleware
+    async def _track_connections(
+        self, request: web.Request, handler: Callable[[web.Request], Awaitable[Any]]
+    ) -> Any:
+        """Record the client address and port of each request, one per connection."""
+        if request.transport is not None:
+            self._peers.add(request.transport.get_extra_info("peername"))
+        return await handler(request)
+
+    def _check_request(self, request: web.Request) -> Optional[web.Response]:
+        """Check the app id and signature of a profile request, like the Yoti API."""
+        if self.sdk_id is not None and request.query.get("appId") != self.sdk_id:
+            return web.Response(status=401, text="Unknown application.")
+        if not self.verify_signatures:
+            return None
+        if request.headers.get(X_YOTI_AUTH_KEY) != self._auth_key:
+            return web.Response(status=401, text="Unknown key.")
+        try:
+            self._public_key.verify(
+                base64.b64decode(request.headers.get(X_YOTI_AUTH_DIGEST, "")),
+                ("GET&" + request.raw_path[len(API_PREFIX) :]).encode("utf-8"),
+                padding.PKCS1v15(),
+                hashes.SHA256(),
+            )
+        except (InvalidSignature, ValueError):
+            return web.Response(status=401, text="Invalid signature.")
+        return None
+
+    def _parse_token(self, plain_token: str) -> Optional[Tuple[str, int]]:
+        """Get the scenario and user of a decrypted token."""
+        parts = plain_token.split(".")
+        if len(parts) != 3 or parts[0] not in SCENARIOS or not parts[1].isdigit():
+            return None
+        return parts[0], int(parts[1])
+
+    def _respond(self, status: int, text: str) -> web.Response:
+        """Answer with an error status."""
+        self.statuses[status] += 1
+        return web.Response(status=status, text=text)
+
+    async def _handle_profile(self, request: web.Request) -> web.Response:
+        """Answer a profile request."""
+        if self._is_throttled():
+            return self._respond(429, "Too many requests.")
+        latency = self.faults.sample_latency(self._rand)
+        if latency > 0:
+            await asyncio.sleep(latency)
+        if self.faults.hang_rate > 0 and self._rand.random() < self.faults.hang_rate:
+            await asyncio.sleep(self.faults.hang_time)
+            return self._respond(504, "Gateway timeout.")
+        if self.faults.error_rate > 0 and self._rand.random() < self.faults.error_rate:
+            return self._respond(
+                self._rand.choice(self.faults.error_statuses), "Injected error."
+            )
+        error = self._check_request(request)
+        if error is not None:
+            return self._respond(error.status, error.text)
+        plain_token = request.match_info["token"]
+        share = self._parse_token(plain_token)
+        if share is None:
+            return self._respond(404, "Unknown token.")
+        if self.single_use_tokens:
+            if plain_token in self._used_tokens:
+                return self._respond(404, "Token already used.")
+            self._used_tokens.add(plain_token)
+        self.statuses[200] += 1
+        return web.json_response({"receipt": self._make_receipt(*share)})
+
+    async def _handle_tokens(self, request: web.Request) -> web.Response:
+        """Mint tokens, e.g. /fake/tokens?scenario=identity&count=10."""
+        scenario = request.query.get("scenario", SCENARIO_AGE)
+        if scenario not in SCENARIOS:
+            return web.Response(status=400, text=f"Unknown scenario: {scenario}.")
+        try:
+            count = int(request.query.get("count", "1"))
+        except ValueError:
+            return web.Response(status=400, text="Invalid count.")
+        return web.json_response({"tokens": self.make_tokens(count, scenario)})
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        """Report the number of profile requests answered, by status."""
+        return web.json_response(
+            {
+                "requests": self.requests,
+                "connections": self.connections,
+                "statuses": {
+                    str(status): count
+                    for status, count in sorted(self.statuses.items())
+                },
+            }
+        )
+
+
+def main() -> None:
+    """Run the fake Yoti API from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--key-file", required=True, help="the Yoti key file of the organisation."
+    )
+    parser.add_argument(
+        "--generate-key",
+        action="store_true",
+        help="write a test key to --key-file if it does not exist.",
+    )
+    parser.add_argument("--sdk-id", default=None, help="the sdk id accepted.")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--error-statuses",
+        type=lambda value: [int(status) for status in value.split(",")],
+        default=list(DEFAULT_ERROR_STATUSES),
+    )
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--hang-time", type=float, default=DEFAULT_HANG_TIME)
+    parser.add_argument("--no-verify-signatures", action="store_true")
+    parser.add_argument("--reusable-tokens", action="store_true")
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS)
+    parser.add_argument("--selfie-size", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--tokens", type=int, default=0, help="the number of tokens to print."
+    )
+    parser.add_argument("--scenario", choices=SCENARIOS, default=SCENARIO_AGE)
+    args = parser.parse_args()
+
+    if args.generate_key and not os.path.exists(args.key_file):
+        generate_test_key(args.key_file)
+    api = FakeYotiApi(
+        args.key_file,
+        sdk_id=args.sdk_id,
+        faults=FaultProfile(
+            latency=args.latency,
+            latency_sigma=args.latency_sigma,
+            error_rate=args.error_rate,
+            error_statuses=args.error_statuses,
+            throttle_rate=args.throttle_rate,
+            max_rps=args.max_rps,
+            hang_rate=args.hang_rate,
+            hang_time=args.hang_time,
+        ),
+        verify_signatures=not args.no_verify_signatures,
+        single_use_tokens=not args.reusable_tokens,
+        users=args.users,
+        selfie_size=args.selfie_size,
+        seed=args.seed,
+    )
+    for token in api.make_tokens(args.tokens, args.scenario):
+        print(token)
+    print(f"yoti_api_url: http://{args.host}:{args.port}{API_PREFIX}")
+    print(f"yoti_key_file_path: {os.path.abspath(args.key_file)}")
+    web.run_app(
+        api.make_app(), host=args.host, port=args.port, access_log=None, print=None
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+This module contains the benchmark of the compression of the yoti messages.
+
+The content of 'profile' and 'profiles' messages of several shapes is
+compressed with each available compression and level, and the bytes saved
+are reported with the time to compress and decompress, as JSON. The
+encoding and decoding of the messages with the default level of each
+compression is measured too.
+
+Run it with:
+
+    python -m benchmark.yoti_compression --batch 100 --selfie-size 100000
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from google.protobuf.internal import api_implementation
+
+import aea
+from aea.mail.base_pb2 import Message as ProtobufMessage
+
+from packages.fetchai.protocols.yoti.compression import (
+    COMPRESSION_ZLIB,
+    COMPRESSION_ZSTD,
+    DEFAULT_MIN_SIZE,
+    zstandard,
+)
+from packages.fetchai.protocols.yoti.custom_types import (
+    ProfileInfo,
+    ProfileResult,
+    ProfileResults,
+)
+from packages.fetchai.protocols.yoti.message import YotiMessage
+from packages.fetchai.protocols.yoti.serialization import YotiSerializer
+
+
+DEFAULT_BATCH = 100
+DEFAULT_SELFIE_SIZE = 100000
+DEFAULT_NUMBER = 20
+DEFAULT_REPEAT = 5
+ZLIB_LEVELS = (1, 6, 9)
+ZSTD_LEVELS = (1, 3, 10)
+
+DIALOGUE_REFERENCE = ("4d1f0c27a3b8e6f2", "9e8b2a61c0d4f7a5")
+GIVEN_NAMES = ("Alice", "Bob", "Charlotte", "David", "Emma", "Farid", "Grace")
+FAMILY_NAMES = ("Smith", "Jones", "Taylor", "Brown", "Williams", "Khan", "Davies")
+TOWNS = ("Cambridge", "London", "Manchester", "Leeds", "Bristol", "Glasgow")
+
+
+def make_info(rand: random.Random, selfie_size: int) -> ProfileInfo:
+    """
+    Make the info of an identity profile, with random values.
+
+    :param rand: the randomness.
+    :param selfie_size: the number of bytes of the selfie, 0 for none.
+    :return: the info.
+    """
+    given_names = rand.choice(GIVEN_NAMES)
+    family_name = rand.choice(FAMILY_NAMES)
+    building_number = str(rand.randint(1, 200))
+    town = rand.choice(TOWNS)
+    values: Dict[str, Any] = {
+        "remember_me_id": "%064x" % rand.getrandbits(256),
+        "given_names": given_names,
+        "family_name": family_name,
+        "full_name": "{} {}".format(given_names, family_name),
+        "date_of_birth": datetime.date(1950, 1, 1)
+        + datetime.timedelta(days=rand.randint(0, 20000)),
+        "gender": rand.choice(("FEMALE", "MALE")),
+        "nationality": "GBR",
+        "email_address": "{}.{}{}@example.com".format(
+            given_names.lower(), family_name.lower(), rand.randint(1, 999)
+        ),
+        "phone_number": "+4477{:08d}".format(rand.randint(0, 99999999)),
+        "age_over:18": True,
+        "structured_postal_address": {
+            "address_format": 1,
+            "building_number": building_number,
+            "address_line1": "{} Lotus Street".format(building_number),
+            "town_city": town,
+            "postal_code": "CB{} {}AB".format(rand.randint(1, 9), rand.randint(1, 9)),
+            "country_iso": "GBR",
+        },
+    }
+    if selfie_size > 0:
+        # a JPEG, like a selfie, is already compressed: random bytes stand for it
+        values["selfie"] = b"\xff\xd8\xff\xe0" + os.urandom(selfie_size - 4)
+    return ProfileInfo(values)
+
+
+def make_messages(
+    batch: int,
+    selfie_size: int,
+    compression: Optional[str] = None,
+    min_size: int = DEFAULT_MIN_SIZE,
+) -> Dict[str, YotiMessage]:
+    """
+    Make the messages of each shape.
+
+    :param batch: the number of profiles of a 'profiles' message.
+    :param selfie_size: the number of bytes of a selfie.
+    :param compression: the compression of the messages, None for none.
+    :param min_size: the minimum size, in bytes, of the content compressed.
+    :return: the messages, by shape.
+    """
+    rand = random.Random(0)  # nosec
+    reply: Dict[str, Any] = dict(
+        dialogue_reference=DIALOGUE_REFERENCE, message_id=2, target=1,
+    )
+    # as set by the connection, for a request accepting the compression
+    if compression is not None:
+        reply.update(compression=compression, compression_min_size=min_size)
+    return {
+        "profile": YotiMessage(
+            performative=YotiMessage.Performative.PROFILE,
+            info=make_info(rand, 0),
+            **reply
+        ),
+        "profile_selfie": YotiMessage(
+            performative=YotiMessage.Performative.PROFILE,
+            info=make_info(rand, selfie_size),
+            **reply
+        ),
+        "profiles": YotiMessage(
+            performative=YotiMessage.Performative.PROFILES,
+            results=ProfileResults(
+                [
+                    ProfileResult("token-{}".format(index), info=make_info(rand, 0))
+                    for index in range(batch)
+                ]
+            ),
+            **reply
+        ),
+        "profiles_selfie": YotiMessage(
+            performative=YotiMessage.Performative.PROFILES,
+            results=ProfileResults(
+                [
+                    ProfileResult(
+                        "token-{}".format(index), info=make_info(rand, selfie_size)
+                    )
+                    for index in range(batch)
+                ]
+            ),
+            **reply
+        ),
+    }
+
+
+def get_codecs() -> List[Tuple[str, int, Callable[[bytes], bytes], Callable]]:
+    """
+    Get the compressions and levels measured.
+
+    :return: the name, level, compress and decompress functions of each.
+    """
+    codecs: List[Tuple[str, int, Callable[[bytes], bytes], Callable]] = [
+        (
+            COMPRESSION_ZLIB,
+            level,
+            lambda data, level=level: zlib.compress(data, level),
+            zlib.decompress,
+        )
+        for level in ZLIB_LEVELS
+    ]
+    if zstandard is not None:
+        codecs.extend(
+            (
+                COMPRESSION_ZSTD,
+                level,
+                zstandard.ZstdCompressor(level=level).compress,
+                zstandard.ZstdDecompressor().decompress,
+            )
+            for level in ZSTD_LEVELS
+        )
+    return codecs
+
+
+def measure(operation: Callable[[], Any], number: int, repeat: int) -> float:
+    """
+    Measure the time of an operation.
+
+    :param operation: the operation.
+    :param number: the number of operations per measure.
+    :param repeat: the number of measures, the fastest one being kept.
+    :return: the time per operation, in seconds.
+    """
+    return min(timeit.repeat(operation, number=number, repeat=repeat)) / number
+
+
+def measure_serializer(
+    message: YotiMessage, number: int, repeat: int
+) -> Dict[str, Any]:
+    """
+    Measure the encoding and decoding of a message.
+
+    :param message: the message.
+    :param number: the number of operations per measure.
+    :param repeat: the number of measures.
+    :return: the size of the encoded message and the time per operation.
+    """
+    encoded = YotiSerializer.encode(message)
+    return {
+        "size": len(encoded),
+        "encode": measure(lambda: YotiSerializer.encode(message), number, repeat),
+        "decode": measure(lambda: YotiSerializer.decode(encoded), number, repeat),
+    }
+
+
+def run(
+    batch: int,
+    selfie_size: int,
+    number: int,
+    repeat: int,
+    min_size: int = DEFAULT_MIN_SIZE,
+) -> Dict[str, Any]:
+    """
+    Measure the compressions on each message shape.
+
+    :param batch: the number of profiles of a 'profiles' message.
+    :param selfie_size: the number of bytes of a selfie.
+    :param number: the number of operations per measure.
+    :param repeat: the number of measures.
+    :param min_size: the minimum size, in bytes, of the content compressed.
+    :return: the results, with the environment and settings of the run.
+    """
+    results: List[Dict[str, Any]] = []
+    codecs = get_codecs()
+    compressions = [None, COMPRESSION_ZLIB] + (
+        [COMPRESSION_ZSTD] if zstandard is not None else []
+    )
+    messages_by_compression = {
+        compression: make_messages(batch, selfie_size, compression, min_size)
+        for compression in compressions
+    }
+    for shape, message in messages_by_compression[None].items():
+        # the serializer compresses the content of the envelope message
+        message_pb = ProtobufMessage()
+        message_pb.ParseFromString(YotiSerializer.encode(message))
+        content = message_pb.dialogue_message.content
+        size = len(content)
+        shape_result: Dict[str, Any] = {
+            "shape": shape,
+            "size": size,
+            "codecs": [],
+            "serializer": {
+                str(compression): measure_serializer(
+                    messages_by_compression[compression][shape], number, repeat
+                )
+                for compression in compressions
+            },
+        }
+        for name, level, compress, decompress in codecs:
+            compressed = compress(content)
+            codec_result = {
+                "compression": name,
+                "level": level,
+                "size": len(compressed),
+                "saved": 1 - len(compressed) / size,
+                "compress": measure(lambda: compress(content), number, repeat),
+                "decompress": measure(lambda: decompress(compressed), number, repeat),
+            }
+            print(
+                "{shape:>16} {name:>4}-{level:<2} size={size:>9} -> {compressed:>9} "
+                "saved={saved:6.1%} compress={compress_us:10.1f}us "
+                "decompress={decompress_us:9.1f}us".format(
+                    shape=shape,
+                    name=name,
+                    level=level,
+                    size=size,
+                    compressed=codec_result["size"],
+                    saved=codec_result["saved"],
+                    compress_us=codec_result["compress"] * 1e6,
+                    decompress_us=codec_result["decompress"] * 1e6,
+                ),
+                file=sys.stderr,
+            )
+            shape_result["codecs"].append(codec_result)
+        for compression, serializer_result in shape_result["serializer"].items():
+            print(
+                "{shape:>16} serializer {compression:>4} size={size:>9} "
+                "encode={encode_us:10.1f}us decode={decode_us:9.1f}us".format(
+                    shape=shape,
+                    compression=compression,
+                    size=serializer_result["size"],
+                    encode_us=serializer_result["encode"] * 1e6,
+                    decode_us=serializer_result["decode"] * 1e6,
+                ),
+                file=sys.stderr,
+            )
+        results.append(shape_result)
+    return {
+        "benchmark": "yoti_compression",
+        "created_at": datetime.datetime.utcnow().isoformat() + "Z",
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "aea": aea.__version__,
+            "protobuf": api_implementation.Type(),
+            "zlib": zlib.ZLIB_RUNTIME_VERSION,
+            "zstandard": zstandard.__version__ if zstandard is not None else None,
+        },
+        "settings": {
+            "batch": batch,
+            "selfie_size": selfie_size,
+            "number": number,
+            "repeat": repeat,
+            "compression_min_size": min_size,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=DEFAULT_BATCH,
+        help="the number of profiles of a 'profiles' message.",
+    )
+    parser.add_argument(
+        "--selfie-size",
+        type=int,
+        default=DEFAULT_SELFIE_SIZE,
+        help="the number of bytes of a selfie.",
+    )
+    parser.add_argument(
+        "--compression-min-size",
+        type=int,
+        default=DEFAULT_MIN_SIZE,
+        help="the minimum size, in bytes, of the content compressed by the serializer.",
+    )
+    parser.add_argument("--number", type=int, default=DEFAULT_NUMBER)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", default=None, help="the file of the results.")
+    args = parser.parse_args()
+
+    results = run(
+        args.batch,
+        args.selfie_size,
+        args.number,
+        args.repeat,
+        args.compression_min_size,
+    )
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as file:
+            file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,631 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+This module contains the throughput and latency benchmark of the yoti connection.
+
+Synthetic 'get_profile' envelopes are sent to a YotiConnection with a fixed
+number of requests in flight, each reply triggering the next request. For
+each concurrency level the throughput, the latency percentiles and the
+memory allocated by the connection are reported as JSON.
+
+Run it with:
+
+    python -m benchmark.yoti_connection --concurrency 1,10,100,1000,10000
+"""
+
+import argparse
+import asyncio
+import datetime
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aea
+from aea.configurations.base import ConnectionConfig
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from aea.protocols.base import Address, Message
+from aea.protocols.dialogue.base import Dialogue
+
+from packages.fetchai.connections.yoti.client import BaseYotiClient
+from packages.fetchai.connections.yoti.config import CLIENT_MODE_ASYNC, CLIENT_MODE_SDK
+from packages.fetchai.connections.yoti.connection import CONNECTION_ID, YotiConnection
+from packages.fetchai.protocols.yoti.dialogues import YotiDialogue
+from packages.fetchai.protocols.yoti.dialogues import YotiDialogues as BaseYotiDialogues
+from packages.fetchai.protocols.yoti.message import YotiMessage
+
+from benchmark.fake_yoti_api import (
+    FakeYotiApi,
+    FaultProfile,
+    SCENARIOS,
+    generate_test_key,
+)
+
+
+BACKEND_STUB = "stub"
+BACKENDS = (BACKEND_STUB, CLIENT_MODE_SDK, CLIENT_MODE_ASYNC)
+
+DEFAULT_CONCURRENCY = (1, 10, 100, 1000, 10000)
+DEFAULT_REQUESTS = 20000
+DEFAULT_WARMUP = 100
+DEFAULT_TOLERANCE = 0.2
+AGENT_ADDRESS = "benchmark_agent"
+PERCENTILES = (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("p999", 0.999))
+
+
+class StubAttribute:
+    """Attribute of a stub profile."""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str, value: str) -> None:
+        """
+        Initialize the attribute.
+
+        :param name: the name.
+        :param value: the value.
+        """
+        self.name = name
+        self.value = value
+
+
+class StubProfile:
+    """Profile returned by the stub client, with the attributes of an 'age' share."""
+
+    def __init__(self) -> None:
+        """Initialize the profile."""
+        self.attributes = {"age_over:18": StubAttribute("age_over:18", "true")}
+
+    def get_attribute(self, name: str) -> Optional[StubAttribute]:
+        """
+        Get an attribute.
+
+        :param name: the name of the attribute.
+        :return: the attribute, if any.
+        """
+        return self.attributes.get(name)
+
+
+class StubActivityDetails:
+    """Activity details returned by the stub client."""
+
+    def __init__(self, user_id: str) -> None:
+        """
+        Initialize the activity details.
+
+        :param user_id: the remember me id of the user.
+        """
+        self.user_id = user_id
+        self.profile = StubProfile()
+
+
+class StubYotiClient(BaseYotiClient):
+    """
+    Client answering every token with the same profile after a fixed latency.
+
+    It takes the Yoti API and the crypto out of the measurement, so that the
+    benchmark measures the dispatcher, the receive loop and the dialogues.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """
+        Initialize the client.
+
+        :param latency: the number of seconds taken by a call, 0 to answer straight away.
+        """
+        super().__init__()
+        self.latency = latency
+        self._activity_details = StubActivityDetails("stub_remember_me_id")
+
+    async def get_activity_details(
+        self, encrypted_request_token: str
+    ) -> StubActivityDetails:
+        """
+        Get the activity details shared with a one-time token.
+
+        :param encrypted_request_token: the token.
+        :return: the activity details.
+        """
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return self._activity_details
+
+
+class AgentDialogues(BaseYotiDialogues):
+    """The dialogues of the agent sending the requests."""
+
+    def __init__(self) -> None:
+        """Initialize the dialogues."""
+
+        def role_from_first_message(  # pylint: disable=unused-argument
+            message: Message, receiver_address: Address
+        ) -> Dialogue.Role:
+            """Infer the role of the agent from an outgoing first message."""
+            return YotiDialogue.Role.AGENT
+
+        BaseYotiDialogues.__init__(
+            self,
+            self_address=AGENT_ADDRESS,
+            role_from_first_message=role_from_first_message,
+        )
+
+
+def make_connection(
+    config: Dict[str, Any], stub_client: Optional[StubYotiClient] = None
+) -> YotiConnection:
+    """
+    Build a yoti connection.
+
+    :param config: the configuration of the connection.
+    :param stub_client: the client replacing the one configured, if any.
+    :return: the connection.
+    """
+    configuration = ConnectionConfig(connection_id=CONNECTION_ID, **config)
+    configuration.config.update(config)
+    connection = YotiConnection(
+        configuration=configuration,
+        identity=Identity(AGENT_ADDRESS, address=AGENT_ADDRESS),
+    )
+    if stub_client is not None:
+        for member in connection.clients.members:
+            member.client = stub_client
+    return connection
+
+
+def make_envelopes(tokens: Sequence[str]) -> List[Envelope]:
+    """
+    Build the 'get_profile' envelopes of some tokens.
+
+    :param tokens: the tokens.
+    :return: the envelopes.
+    """
+    dialogues = AgentDialogues()
+    envelopes = []
+    for token in tokens:
+        message, _ = dialogues.create(
+            counterparty=str(CONNECTION_ID),
+            performative=YotiMessage.Performative.GET_PROFILE,
+            token=token,
+            dotted_path="",
+            args=(),
+        )
+        envelopes.append(
+            Envelope(
+                to=str(CONNECTION_ID),
+                sender=AGENT_ADDRESS,
+                protocol_id=message.protocol_id,
+                message=message,
+            )
+        )
+    return envelopes
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Get a percentile of some values, by nearest rank.
+
+    :param sorted_values: the values, sorted.
+    :param fraction: the fraction of the values below the percentile, in (0, 1].
+    :return: the percentile, 0 if there are no values.
+    """
+    if len(sorted_values) == 0:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def drive(
+    connection: YotiConnection, envelopes: Sequence[Envelope], concurrency: int
+) -> Dict[str, Any]:
+    """
+    Send envelopes to a connection, keeping 'concurrency' requests in flight.
+
+    :param connection: the connected connection.
+    :param envelopes: the envelopes.
+    :param concurrency: the number of requests in flight.
+    :return: the elapsed time, latencies and errors of the run.
+    """
+    count = len(envelopes)
+    index = {
+        envelope.message.dialogue_reference[0]: i
+        for i, envelope in enumerate(envelopes)
+    }
+    sent_at = array("d", bytes(8 * count))
+    latencies = array("d", bytes(8 * count))
+    errors: "Counter[str]" = Counter()
+    next_index = 0
+    started_at = time.perf_counter()
+    while next_index < min(concurrency, count):
+        sent_at[next_index] = time.perf_counter()
+        await connection.send(envelopes[next_index])
+        next_index += 1
+    for _ in range(count):
+        response = await connection.receive()
+        now = time.perf_counter()
+        if response is None:
+            errors["no_response"] += 1
+        else:
+            message = response.message
+            i = index[message.dialogue_reference[0]]
+            latencies[i] = now - sent_at[i]
+            if message.performative == YotiMessage.Performative.ERROR:
+                errors[str(message.error_code)] += 1
+        if next_index < count:
+            sent_at[next_index] = time.perf_counter()
+            await connection.send(envelopes[next_index])
+            next_index += 1
+    return {
+        "elapsed": time.perf_counter() - started_at,
+        "latencies": latencies,
+        "errors": errors,
+    }
+
+
+class Benchmark:
+    """Benchmark of a yoti connection at increasing concurrency."""
+
+    def __init__(
+        self,
+        backend: str = BACKEND_STUB,
+        requests: int = DEFAULT_REQUESTS,
+        warmup: int = DEFAULT_WARMUP,
+        latency: float = 0.0,
+        faults: Optional[FaultProfile] = None,
+        scenario: str = SCENARIOS[0],
+        config: Optional[Dict[str, Any]] = None,
+        trace_memory: bool = True,
+    ) -> None:
+        """
+        Initialize the benchmark.
+
+        :param backend: 'stub' to answer from a stub client, or the client_mode used against the fake Yoti API.
+        :param requests: the number of requests measured at each concurrency level.
+        :param warmup: the number of requests sent before measuring.
+        :param latency: the number of seconds taken by the stub client.
+        :param faults: the latency and failures of the fake Yoti API.
+        :param scenario: the scenario of the profiles of the fake Yoti API.
+        :param config: the configuration overriding the one of the connection.
+        :param trace_memory: whether to measure the memory allocated, in an extra run at each level.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Got backend={backend}, expected one of {BACKENDS}.")
+        self.backend = backend
+        self.requests = requests
+        self.warmup = warmup
+        self.latency = latency
+        self.faults = faults
+        self.scenario = scenario
+        self.config = config if config is not None else {}
+        self.trace_memory = trace_memory
+        self._key_file_path = os.path.join(tempfile.mkdtemp(), "yoti_key.pem")
+        generate_test_key(self._key_file_path)
+        self._api: Optional[FakeYotiApi] = None
+
+    def _make_tokens(self, count: int) -> List[str]:
+        """Mint the tokens of a run."""
+        if self._api is None:
+            return [f"token_{i}" for i in range(count)]
+        return self._api.make_tokens(count, self.scenario)
+
+    def _make_connection(self, concurrency: int) -> YotiConnection:
+        """Build the connection of a concurrency level."""
+        config: Dict[str, Any] = {
+            "yoti_client_sdk_id": "benchmark",
+            "yoti_key_file_path": self._key_file_path,
+            "max_pending_requests": concurrency,
+            "max_queue_size": concurrency,
+        }
+        stub_client = None
+        if self._api is None:
+            stub_client = StubYotiClient(self.latency)
+        else:
+            config["client_mode"] = self.backend
+            config["yoti_api_url"] = self._api.api_url
+        config.update(self.config)
+        return make_connection(config, stub_client)
+
+    async def _trace_memory(
+        self, connection: YotiConnection, count: int, concurrency: int
+    ) -> Tuple[int, int]:
+        """
+        Measure the memory allocated by the connection during a run.
+
+        The run is separate from the timed one, as tracing the allocations
+        slows it down several times.
+
+        :param connection: the connected connection.
+        :param count: the number of requests.
+        :param concurrency: the number of requests in flight.
+        :return: the peak memory allocated and the memory still allocated after the run.
+        """
+        envelopes = make_envelopes(self._make_tokens(count))
+        gc.collect()
+        tracemalloc.start()
+        try:
+            await drive(connection, envelopes, concurrency)
+            del envelopes
+            gc.collect()
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak, retained
+
+    async def run_level(self, concurrency: int) -> Dict[str, Any]:
+        """
+        Measure the connection at a concurrency level.
+
+        :param concurrency: the number of requests in flight.
+        :return: the results of the level.
+        """
+        count = max(self.requests, concurrency)
+        connection = self._make_connection(concurrency)
+        await connection.connect()
+        try:
+            if self.warmup > 0:
+                await drive(
+                    connection,
+                    make_envelopes(self._make_tokens(self.warmup)),
+                    concurrency,
+                )
+            envelopes = make_envelopes(self._make_tokens(count))
+            gc.collect()
+            run = await drive(connection, envelopes, concurrency)
+            del envelopes
+            memory: Dict[str, Optional[int]] = {"peak": None, "retained": None}
+            if self.trace_memory:
+                memory["peak"], memory["retained"] = await self._trace_memory(
+                    connection, count, concurrency
+                )
+            open_dialogues = connection.open_dialogues
+        finally:
+            await connection.disconnect()
+        latencies = sorted(run["latencies"])
+        return {
+            "concurrency": concurrency,
+            "requests": count,
+            "elapsed": run["elapsed"],
+            "throughput": count / run["elapsed"],
+            "latency": {
+                "mean": sum(latencies) / count,
+                **{name: percentile(latencies, q) for name, q in PERCENTILES},
+                "max": latencies[-1],
+            },
+            "errors": dict(run["errors"]),
+            "memory": {
+                "peak": memory["peak"],
+                "retained": memory["retained"],
+                "peak_per_request_in_flight": (
+                    memory["peak"] // concurrency
+                    if memory["peak"] is not None
+                    else None
+                ),
+            },
+            "open_dialogues": open_dialogues,
+        }
+
+    async def run(self, concurrency_levels: Sequence[int]) -> Dict[str, Any]:
+        """
+        Measure the connection at each concurrency level.
+
+        :param concurrency_levels: the numbers of requests in flight.
+        :return: the results, with the environment and settings of the run.
+        """
+        if self.backend != BACKEND_STUB:
+            self._api = FakeYotiApi(
+                self._key_file_path,
+                sdk_id="benchmark",
+                faults=self.faults,
+                single_use_tokens=False,
+            )
+            await self._api.start()
+        try:
+            results = []
+            for concurrency in concurrency_levels:
+                results.append(await self.run_level(concurrency))
+                print(format_result(results[-1]), file=sys.stderr)
+        finally:
+            if self._api is not None:
+                await self._api.stop()
+                self._api = None
+        return {
+            "benchmark": "yoti_connection",
+            "created_at": datetime.datetime.utcnow().isoformat() + "Z",
+            "environment": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "aea": aea.__version__,
+            },
+            "settings": {
+                "backend": self.backend,
+                "requests": self.requests,
+                "warmup": self.warmup,
+                "latency": self.latency,
+                "scenario": self.scenario,
+                "faults": vars(self.faults) if self.faults is not None else None,
+                "config": self.config,
+                "trace_memory": self.trace_memory,
+            },
+            "results": results,
+        }
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """
+    Summarise the results of a concurrency level on one line.
+
+    :param result: the results of the level.
+    :return: the summary.
+    """
+    latency = result["latency"]
+    return (
+        "concurrency={concurrency:>6} throughput={throughput:>9.1f}/s "
+        "p50={p50:.4f}s p99={p99:.4f}s p999={p999:.4f}s "
+        "peak_memory={peak} errors={errors}".format(
+            concurrency=result["concurrency"],
+            throughput=result["throughput"],
+            p50=latency["p50"],
+            p99=latency["p99"],
+            p999=latency["p999"],
+            peak=result["memory"]["peak"],
+            errors=result["errors"],
+        )
+    )
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """
+    Find the regressions of a run against a baseline run.
+
+    A concurrency level regresses when its throughput drops, or its p99
+    latency or peak memory grows, by more than 'tolerance'.
+
+    :param baseline: the results of the baseline run.
+    :param current: the results of the current run.
+    :param tolerance: the relative change tolerated.
+    :return: the descriptions of the regressions.
+    """
+    baseline_results = {result["concurrency"]: result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        concurrency = result["concurrency"]
+        before = baseline_results.get(concurrency)
+        if before is None:
+            continue
+        checks = (
+            ("throughput", before["throughput"], result["throughput"], -1),
+            ("p99", before["latency"]["p99"], result["latency"]["p99"], 1),
+            ("peak memory", before["memory"]["peak"], result["memory"]["peak"], 1),
+        )
+        for name, old, new, direction in checks:
+            if old is None or new is None or old == 0:
+                continue
+            change = (new - old) / old
+            if change * direction > tolerance:
+                regressions.append(
+                    f"concurrency={concurrency}: {name} went from {old:.6g} to {new:.6g} ({change:+.1%})."
+                )
+    return regressions
+
+
+def parse_config_override(value: str) -> Dict[str, Any]:
+    """
+    Parse a 'key=value' override of the connection configuration.
+
+    :param value: the override, its value JSON encoded or a plain string.
+    :return: the override as a dictionary.
+    """
+    key, separator, raw = value.partition("=")
+    if separator == "":
+        raise argparse.ArgumentTypeError(f"Expected key=value, got {value!r}.")
+    try:
+        return {key: json.loads(raw)}
+    except ValueError:
+        return {key: raw}
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(level) for level in value.split(",")],
+        default=list(DEFAULT_CONCURRENCY),
+        help="the comma separated numbers of requests in flight.",
+    )
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--backend", choices=BACKENDS, default=BACKEND_STUB)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="the median latency of the stub client or fake Yoti API.",
+    )
+    parser.add_argument("--latency-sigma", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--scenario", choices=SCENARIOS, default=SCENARIOS[0])
+    parser.add_argument(
+        "--config",
+        type=parse_config_override,
+        action="append",
+        default=[],
+        help="a key=value override of the connection configuration.",
+    )
+    parser.add_argument("--no-trace-memory", action="store_true")
+    parser.add_argument("--output", default=None, help="the file of the results.")
+    parser.add_argument(
+        "--baseline", default=None, help="the results to check for regressions."
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    config: Dict[str, Any] = {}
+    for override in args.config:
+        config.update(override)
+    benchmark = Benchmark(
+        backend=args.backend,
+        requests=args.requests,
+        warmup=args.warmup,
+        latency=args.latency,
+        faults=FaultProfile(
+            latency=args.latency,
+            latency_sigma=args.latency_sigma,
+            error_rate=args.error_rate,
+        )
+        if args.backend != BACKEND_STUB
+        else None,
+        scenario=args.scenario,
+        config=config,
+        trace_memory=not args.no_trace_memory,
+    )
+    loop = asyncio.get_event_loop()
+    results = loop.run_until_complete(benchmark.run(args.concurrency))
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as output_file:
+            output_file.write(output + "\n")
+    if args.baseline is not None:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(json.load(baseline_file), results, args.tolerance)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+This module contains the micro-benchmark of the serializer of the yoti protocol.
+
+Each message shape is encoded and decoded in a loop, and the time per
+operation is reported as JSON. 'decode_info' also reads the info of the
+decoded messages, as a 'profile' message's info is parsed on first access.
+
+Run it with:
+
+    python -m benchmark.yoti_serialization --attributes 20 --repeat 5
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Dict, List
+
+from google.protobuf.internal import api_implementation
+
+import aea
+
+from packages.fetchai.protocols.yoti.custom_types import (
+    AttributeValue,
+    ProfileInfo,
+    ProfileResult,
+    ProfileResults,
+)
+from packages.fetchai.protocols.yoti.message import YotiMessage
+from packages.fetchai.protocols.yoti.serialization import YotiSerializer
+
+
+DEFAULT_ATTRIBUTES = 20
+DEFAULT_BATCH = 10
+DEFAULT_NUMBER = 2000
+DEFAULT_REPEAT = 5
+
+DIALOGUE_REFERENCE = ("4d1f0c27a3b8e6f2", "9e8b2a61c0d4f7a5")
+
+
+def make_info(attributes: int) -> ProfileInfo:
+    """
+    Make the info of a profile.
+
+    Besides string attributes, the profile has a date of birth, an age
+    verification and a structured postal address, like a real one.
+
+    :param attributes: the number of attributes.
+    :return: the info.
+    """
+    typed_attributes: Dict[str, AttributeValue] = {
+        "date_of_birth": datetime.date(1980, 1, 31),
+        "age_over:18": True,
+        "structured_postal_address": {
+            "address_format": 1,
+            "building_number": "15",
+            "address_line1": "15 Lotus Street",
+            "town_city": "Cambridge",
+            "postal_code": "CB1 2AB",
+            "country_iso": "GBR",
+        },
+    }
+    return ProfileInfo(
+        {
+            **{
+                "attribute_{}".format(index): "value of the attribute {}".format(index)
+                for index in range(max(0, attributes - len(typed_attributes)))
+            },
+            **dict(list(typed_attributes.items())[:attributes]),
+        }
+    )
+
+
+def make_messages(attributes: int, batch: int) -> Dict[str, YotiMessage]:
+    """
+    Make a message of each shape.
+
+    :param attributes: the number of attributes of a profile.
+    :param batch: the number of tokens of a 'get_profiles' message.
+    :return: the messages, by shape.
+    """
+    info = make_info(attributes)
+    tokens = ["token-{}".format(index) for index in range(batch)]
+    reply = dict(dialogue_reference=DIALOGUE_REFERENCE, message_id=2, target=1)
+    return {
+        "get_profile": YotiMessage(
+            dialogue_reference=(DIALOGUE_REFERENCE[0], ""),
+            performative=YotiMessage.Performative.GET_PROFILE,
+            token=tokens[0],
+            dotted_path="get_activity_details",
+            args=("profile",),
+        ),
+        "profile": YotiMessage(
+            performative=YotiMessage.Performative.PROFILE, info=info, **reply
+        ),
+        "get_profiles": YotiMessage(
+            dialogue_reference=(DIALOGUE_REFERENCE[0], ""),
+            performative=YotiMessage.Performative.GET_PROFILES,
+            tokens=tuple(tokens),
+            dotted_path="get_activity_details",
+            args=("profile",),
+        ),
+        "profiles": YotiMessage(
+            performative=YotiMessage.Performative.PROFILES,
+            results=ProfileResults(
+                [ProfileResult(token, info=info) for token in tokens]
+            ),
+            **reply
+        ),
+        "error": YotiMessage(
+            performative=YotiMessage.Performative.ERROR,
+            error_code=502,
+            error_msg="Yoti API unavailable.",
+            **reply
+        ),
+    }
+
+
+def read_info(message: YotiMessage) -> None:
+    """
+    Read the info of a decoded message, like its recipient would.
+
+    :param message: the message.
+    :return: None
+    """
+    if message.performative == YotiMessage.Performative.PROFILE:
+        dict(message.info)
+    elif message.performative == YotiMessage.Performative.PROFILES:
+        for result in message.results:
+            if result.info is not None:
+                dict(result.info)
+
+
+def measure(operation: Callable[[], Any], number: int, repeat: int) -> float:
+    """
+    Measure the time of an operation.
+
+    :param operation: the operation.
+    :param number: the number of operations per measure.
+    :param repeat: the number of measures, the fastest one being kept.
+    :return: the time per operation, in seconds.
+    """
+    return min(timeit.repeat(operation, number=number, repeat=repeat)) / number
+
+
+def run(attributes: int, batch: int, number: int, repeat: int) -> Dict[str, Any]:
+    """
+    Measure the serializer on each message shape.
+
+    :param attributes: the number of attributes of a profile.
+    :param batch: the number of tokens of a batch.
+    :param number: the number of operations per measure.
+    :param repeat: the number of measures.
+    :return: the results, with the environment and settings of the run.
+    """
+    results: List[Dict[str, Any]] = []
+    for shape, message in make_messages(attributes, batch).items():
+        encoded = YotiSerializer.encode(message)
+        result = {
+            "shape": shape,
+            "size": len(encoded),
+            "encode": measure(lambda: YotiSerializer.encode(message), number, repeat),
+            "decode": measure(lambda: YotiSerializer.decode(encoded), number, repeat),
+            "decode_info": measure(
+                lambda: read_info(YotiSerializer.decode(encoded)), number, repeat
+            ),
+        }
+        print(
+            "{shape:>12} size={size:>6} encode={encode_us:8.2f}us "
+            "decode={decode_us:8.2f}us decode_info={decode_info_us:8.2f}us".format(
+                shape=shape,
+                size=result["size"],
+                encode_us=result["encode"] * 1e6,
+                decode_us=result["decode"] * 1e6,
+                decode_info_us=result["decode_info"] * 1e6,
+            ),
+            file=sys.stderr,
+        )
+        results.append(result)
+    return {
+        "benchmark": "yoti_serialization",
+        "created_at": datetime.datetime.utcnow().isoformat() + "Z",
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "aea": aea.__version__,
+            "protobuf": api_implementation.Type(),
+        },
+        "settings": {
+            "attributes": attributes,
+            "batch": batch,
+            "number": number,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--attributes",
+        type=int,
+        default=DEFAULT_ATTRIBUTES,
+        help="the number of attributes of a profile.",
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=DEFAULT_BATCH,
+        help="the number of tokens of a batch.",
+    )
+    parser.add_argument("--number", type=int, default=DEFAULT_NUMBER)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", default=None, help="the file of the results.")
+    args = parser.parse_args()
+
+    results = run(args.attributes, args.batch, args.number, args.repeat)
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as file:
+            file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,736 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the Yoti API clients used by the yoti connection."""
+
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures._base import Executor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+import aiohttp
+import requests
+import yoti_python_sdk
+import yoti_python_sdk.version
+from requests.adapters import HTTPAdapter
+from yoti_python_sdk import Client as YotiClient
+from yoti_python_sdk.activity_details import ActivityDetails
+from yoti_python_sdk.config import X_YOTI_AUTH_KEY
+from yoti_python_sdk.crypto import Crypto
+from yoti_python_sdk.endpoint import Endpoint
+from yoti_python_sdk.http import RequestHandler, SignedRequest, YotiResponse
+from yoti_python_sdk.protobuf import protobuf
+
+from packages.fetchai.connections.yoti.executor import (
+    BoundedThreadPoolExecutor,
+    WorkerPoolFullError,
+)
+from packages.fetchai.connections.yoti.metrics import (
+    STAGE_DECRYPT_RECEIPT,
+    STAGE_DECRYPT_TOKEN,
+    STAGE_QUEUE,
+    STAGE_YOTI_API,
+    YotiMetrics,
+)
+
+
+UNSUCCESSFUL_CALL_ERROR = "Unsuccessful Yoti API call: {} {}"
+# build_profile_request and decrypt_receipt_content repeat the private steps
+# of the SDK's Client.get_activity_details as of this version; check them
+# against the SDK before moving the pin in connection.yaml
+YOTI_SDK_VERSION = "2.14.0"
+DEFAULT_WARMUP_TIMEOUT = 10.0
+DEFAULT_CRYPTO_QUEUE_SIZE = 100
+# the worker processes start from a fresh interpreter, not from a fork of
+# the agent holding threads, sockets and locks
+CRYPTO_PROCESS_START_METHOD = "spawn"
+
+ReceiptContent = Tuple[bytes, bytes, Optional[bytes]]
+T = TypeVar("T")
+
+_worker_crypto: Optional[Crypto] = None
+
+
+class YotiApiError(RuntimeError):
+    """Exception raised when the Yoti API answers with an error status."""
+
+    def __init__(self, status_code: int, text: str) -> None:
+        """
+        Initialize the error.
+
+        :param status_code: the HTTP status code of the response.
+        :param text: the body of the response.
+        """
+        super().__init__(UNSUCCESSFUL_CALL_ERROR.format(status_code, text))
+        self.status_code = status_code
+        self.text = text
+
+
+def check_response(status_code: int, text: str) -> None:
+    """
+    Check that a response of the Yoti API is successful.
+
+    :param status_code: the HTTP status code of the response.
+    :param text: the body of the response.
+    :return: None
+    :raises YotiApiError: if the status is not a 2xx one.
+    """
+    if not 200 <= status_code < 300:
+        raise YotiApiError(status_code, text)
+
+
+def check_sdk_version() -> None:
+    """
+    Check that the installed Yoti SDK is the one the copied SDK steps follow.
+
+    :return: None
+    :raises RuntimeError: if another version is installed.
+    """
+    version = yoti_python_sdk.version.__version__
+    if version != YOTI_SDK_VERSION:
+        raise RuntimeError(
+            "Yoti SDK {} installed, the yoti connection requires {}.".format(
+                version, YOTI_SDK_VERSION
+            )
+        )
+
+
+def make_request_handler(
+    timeout: Optional[float] = None,
+    api_url: Optional[str] = None,
+    metrics: Optional[YotiMetrics] = None,
+    session: Optional[requests.Session] = None,
+) -> Type[RequestHandler]:
+    """
+    Build a Yoti SDK request handler with a timeout and a custom API url.
+
+    The SDK's default handler waits on the Yoti API for as long as it takes,
+    which keeps a worker thread busy after the request deadline has passed.
+    The SDK also always calls its global endpoint, so requests to it are
+    redirected to 'api_url', e.g. a local stand-in of the Yoti API. Error
+    responses raise a YotiApiError carrying their status code, before the
+    SDK turns them into a plain RuntimeError.
+
+    :param timeout: the number of seconds to wait for the Yoti API, None to wait indefinitely.
+    :param api_url: the url of the Yoti API, None for the SDK's endpoint.
+    :param metrics: the metrics recording the duration of the requests, if any.
+    :param session: the session sending the requests, pooling its connections, if any.
+    :return: the request handler class.
+    """
+
+    def get_url(url: str) -> str:
+        endpoint = yoti_python_sdk.YOTI_API_ENDPOINT
+        if api_url is not None and url.startswith(endpoint):
+            return api_url + url[len(endpoint) :]
+        return url
+
+    class CustomRequestHandler(RequestHandler):
+        """Request handler passing a timeout and url to the requests library."""
+
+        @staticmethod
+        def execute(request: SignedRequest) -> YotiResponse:
+            """Execute the HTTP request supplied."""
+            started_at = time.perf_counter()
+            try:
+                response = (session if session is not None else requests).request(
+                    url=get_url(request.url),
+                    method=request.method,
+                    data=request.data,
+                    headers=request.headers,
+                    timeout=timeout,
+                )
+            finally:
+                if metrics is not None:
+                    metrics.observe_stage(
+                        STAGE_YOTI_API, time.perf_counter() - started_at
+                    )
+            check_response(response.status_code, response.text)
+            return YotiResponse(
+                status_code=response.status_code,
+                text=response.text,
+                headers=response.headers,
+                content=response.content,
+            )
+
+    return CustomRequestHandler
+
+
+def build_profile_request(
+    crypto: Crypto, sdk_id: str, api_url: str, encrypted_request_token: str
+) -> SignedRequest:
+    """
+    Decrypt a token and build the signed profile request.
+
+    :param crypto: the crypto holding the Yoti key.
+    :param sdk_id: the Yoti client sdk id.
+    :param api_url: the url of the Yoti API.
+    :param encrypted_request_token: the token.
+    :return: the signed request.
+    """
+    decrypted_token = crypto.decrypt_token(encrypted_request_token).decode("utf-8")
+    path = Endpoint(sdk_id).get_activity_details_request_path(
+        decrypted_token, no_params=True
+    )
+    return (
+        SignedRequest.builder()
+        .with_get()
+        .with_pem_file(crypto)
+        .with_base_url(api_url)
+        .with_endpoint(path)
+        .with_param("appId", sdk_id)
+        .with_header(X_YOTI_AUTH_KEY, crypto.get_public_key())
+        .build()
+    )
+
+
+def decrypt_receipt_content(
+    crypto: Crypto, receipt: Dict[str, Any]
+) -> Optional[ReceiptContent]:
+    """
+    Decrypt the profile, application profile and extra data of a receipt.
+
+    :param crypto: the crypto holding the Yoti key.
+    :param receipt: the receipt.
+    :return: the decrypted content, or None if the receipt has no profile.
+    """
+    proto = protobuf.Protobuf()
+    encrypted_data = proto.current_user(receipt)
+    if not encrypted_data:
+        return None
+    encrypted_application_profile = proto.current_application(receipt)
+    encrypted_extra_data = proto.extra_data(receipt)
+
+    unwrapped_key = crypto.decrypt_token(receipt["wrapped_receipt_key"])
+    decrypted_profile_data = crypto.decipher(
+        unwrapped_key, encrypted_data.iv, encrypted_data.cipher_text
+    )
+    decrypted_application_data = crypto.decipher(
+        unwrapped_key,
+        encrypted_application_profile.iv,
+        encrypted_application_profile.cipher_text,
+    )
+    decrypted_extra_data = None
+    if encrypted_extra_data:
+        decrypted_extra_data = crypto.decipher(
+            unwrapped_key, encrypted_extra_data.iv, encrypted_extra_data.cipher_text
+        )
+    return decrypted_profile_data, decrypted_application_data, decrypted_extra_data
+
+
+def make_activity_details(
+    receipt: Dict[str, Any], content: Optional[ReceiptContent]
+) -> ActivityDetails:
+    """
+    Build the activity details of a receipt, like the SDK client does.
+
+    :param receipt: the receipt.
+    :param content: the decrypted content of the receipt.
+    :return: the activity details.
+    """
+    if content is None:
+        return ActivityDetails(receipt)
+    proto = protobuf.Protobuf()
+    decrypted_profile_data, decrypted_application_data, decrypted_extra_data = content
+    return ActivityDetails(
+        receipt=receipt,
+        decrypted_profile=proto.attribute_list(decrypted_profile_data),
+        decrypted_application_profile=proto.attribute_list(decrypted_application_data),
+        decrypted_extra_data=decrypted_extra_data,
+    )
+
+
+def count_warmed_up(results: List[Any]) -> int:
+    """
+    Count the warm-up requests which reached the Yoti API.
+
+    Any response opens a connection; only the requests which failed with
+    an exception did not.
+
+    :param results: the outcomes of the warm-up requests.
+    :return: the number of connections opened.
+    :raises Exception: the failure of the first request, if none succeeded.
+    """
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if len(failures) == len(results) and len(failures) > 0:
+        raise failures[0]
+    return len(results) - len(failures)
+
+
+def init_crypto_worker(pem_file_path: str) -> None:
+    """
+    Load the Yoti key of a crypto worker process, once.
+
+    :param pem_file_path: the path to the Yoti key file.
+    :return: None
+    """
+    global _worker_crypto  # pylint: disable=global-statement
+    _worker_crypto = Crypto.read_pem_file(
+        pem_file_path, "argument specified in AsyncYotiClient()"
+    )
+
+
+def _get_worker_crypto() -> Crypto:
+    """Get the Yoti key of a crypto worker process."""
+    if _worker_crypto is None:
+        raise ValueError("Crypto worker not initialized.")
+    return _worker_crypto
+
+
+def build_profile_request_in_worker(
+    sdk_id: str, api_url: str, encrypted_request_token: str
+) -> SignedRequest:
+    """
+    Decrypt a token and build the signed profile request in a crypto worker process.
+
+    :param sdk_id: the Yoti client sdk id.
+    :param api_url: the url of the Yoti API.
+    :param encrypted_request_token: the token.
+    :return: the signed request.
+    """
+    return build_profile_request(
+        _get_worker_crypto(), sdk_id, api_url, encrypted_request_token
+    )
+
+
+def decrypt_receipt_content_in_worker(
+    receipt: Dict[str, Any]
+) -> Optional[ReceiptContent]:
+    """
+    Decrypt the content of a receipt in a crypto worker process.
+
+    :param receipt: the receipt.
+    :return: the decrypted content, or None if the receipt has no profile.
+    """
+    return decrypt_receipt_content(_get_worker_crypto(), receipt)
+
+
+class BaseYotiClient(ABC):
+    """Interface of a client fetching Yoti activity details."""
+
+    def __init__(self, metrics: Optional[YotiMetrics] = None) -> None:
+        """
+        Initialize the client.
+
+        :param metrics: the metrics of the connection.
+        """
+        self._executor: Optional[Executor] = None
+        self.metrics = metrics if metrics is not None else YotiMetrics()
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """Get the executor running the blocking work of the client."""
+        return self._executor
+
+    async def connect(self, executor: Optional[Executor] = None) -> None:
+        """
+        Set up the client.
+
+        :param executor: the executor running the blocking work of the client.
+        :return: None
+        """
+        self._executor = executor
+
+    async def disconnect(self) -> None:
+        """
+        Tear down the client.
+
+        :return: None
+        """
+        self._executor = None
+
+    async def warmup(self, connections: int) -> int:
+        """
+        Open connections to the Yoti API ahead of the first requests.
+
+        :param connections: the number of connections to open.
+        :return: the number of connections opened.
+        """
+        return 0
+
+    async def _run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking function on the executor, recording the wait for a worker.
+
+        :param func: the function.
+        :param args: the arguments of the function.
+        :return: the result of the function.
+        """
+        submitted_at = time.perf_counter()
+
+        def run() -> T:
+            self.metrics.observe_stage(STAGE_QUEUE, time.perf_counter() - submitted_at)
+            return func(*args)
+
+        return await asyncio.get_event_loop().run_in_executor(self._executor, run)
+
+    @abstractmethod
+    async def get_activity_details(
+        self, encrypted_request_token: str
+    ) -> Optional[ActivityDetails]:
+        """
+        Get the activity details shared with a one-time token.
+
+        :param encrypted_request_token: the token.
+        :return: the activity details.
+        """
+
+
+class SdkYotiClient(BaseYotiClient):
+    """
+    Client running the Yoti SDK's blocking calls in an executor.
+
+    The worker threads share a requests session which keeps up to
+    'pool_size' connections to the Yoti API alive, instead of the SDK
+    opening a connection, and doing the TLS handshake, for every call.
+    """
+
+    def __init__(
+        self,
+        sdk_id: str,
+        pem_file_path: str,
+        request_timeout: Optional[float] = None,
+        api_url: Optional[str] = None,
+        metrics: Optional[YotiMetrics] = None,
+        pool_size: int = 10,
+    ) -> None:
+        """
+        Initialize the client.
+
+        :param sdk_id: the Yoti client sdk id.
+        :param pem_file_path: the path to the Yoti key file.
+        :param request_timeout: the number of seconds to wait for the Yoti API.
+        :param api_url: the url of the Yoti API, defaults to the SDK's endpoint.
+        :param metrics: the metrics of the connection.
+        :param pool_size: the number of connections to the Yoti API kept alive.
+        """
+        super().__init__(metrics)
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1.")
+        self._api_url = api_url
+        self._request_timeout = request_timeout
+        self._pool_size = pool_size
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        request_handler = make_request_handler(
+            request_timeout, api_url, self.metrics, self._session
+        )
+        self._client = YotiClient(
+            sdk_id, pem_file_path, request_handler=request_handler
+        )
+
+    async def disconnect(self) -> None:
+        """
+        Tear down the client.
+
+        :return: None
+        """
+        self._session.close()
+        await super().disconnect()
+
+    async def warmup(self, connections: int) -> int:
+        """
+        Open connections to the Yoti API ahead of the first requests.
+
+        The requests are held until they are all on a worker thread, so that
+        each opens its own connection instead of reusing the previous one.
+        They are therefore never more than the free worker threads, which
+        would otherwise wait on the others, and hold up the first requests,
+        until the warm-up timeout.
+
+        :param connections: the number of connections to open, at most the pool size and the free workers.
+        :return: the number of connections opened.
+        """
+        connections = min(connections, self._pool_size, self._free_workers())
+        if connections < 1:
+            return 0
+        url = (
+            self._api_url
+            if self._api_url is not None
+            else yoti_python_sdk.YOTI_API_ENDPOINT
+        )
+        timeout = (
+            self._request_timeout
+            if self._request_timeout is not None
+            else DEFAULT_WARMUP_TIMEOUT
+        )
+        barrier = threading.Barrier(connections, timeout=timeout)
+
+        def open_connection() -> None:
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            self._session.get(url, timeout=timeout).close()
+
+        loop = asyncio.get_event_loop()
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(self._executor, open_connection)
+                for _ in range(connections)
+            ],
+            return_exceptions=True,
+        )
+        return count_warmed_up(results)
+
+    def _free_workers(self) -> int:
+        """Get the number of worker threads of the executor not running or queued calls."""
+        executor = self._executor
+        if isinstance(executor, BoundedThreadPoolExecutor):
+            return executor.max_workers - executor.active - executor.queued
+        max_workers = getattr(executor, "_max_workers", None)
+        return max_workers if max_workers is not None else 1
+
+    async def get_activity_details(
+        self, encrypted_request_token: str
+    ) -> Optional[ActivityDetails]:
+        """
+        Get the activity details shared with a one-time token.
+
+        :param encrypted_request_token: the token.
+        :return: the activity details.
+        """
+        return await self._run_in_executor(
+            self._client.get_activity_details, encrypted_request_token
+        )
+
+
+class AsyncYotiClient(BaseYotiClient):
+    """
+    Client doing the Yoti API round trip with aiohttp.
+
+    Only the token decryption, the request signing and the receipt decryption
+    run in the executor; the HTTP request does not hold a thread. With
+    'crypto_processes' set, the decryption and signing run on a pool of
+    processes instead, each loading the Yoti key once, so that they are not
+    serialised by the GIL. Like the worker pool, the process pool takes at
+    most 'crypto_queue_size' calls waiting for a process, and raises a
+    WorkerPoolFullError beyond that.
+    """
+
+    def __init__(
+        self,
+        sdk_id: str,
+        pem_file_path: str,
+        api_url: Optional[str] = None,
+        crypto_processes: int = 0,
+        crypto_queue_size: int = DEFAULT_CRYPTO_QUEUE_SIZE,
+        metrics: Optional[YotiMetrics] = None,
+        pool_size: int = 100,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: Optional[float] = 60.0,
+    ) -> None:
+        """
+        Initialize the client.
+
+        :param sdk_id: the Yoti client sdk id.
+        :param pem_file_path: the path to the Yoti key file.
+        :param api_url: the url of the Yoti API, defaults to the SDK's endpoint.
+        :param crypto_processes: the number of crypto worker processes, 0 to use the executor.
+        :param crypto_queue_size: the number of calls which can wait for a crypto worker process.
+        :param metrics: the metrics of the connection.
+        :param pool_size: the maximum number of connections to the Yoti API.
+        :param keepalive_timeout: the number of seconds an idle connection is kept alive.
+        :param dns_cache_ttl: the number of seconds the address of the Yoti API is cached, None to cache it forever.
+        """
+        super().__init__(metrics)
+        check_sdk_version()
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1.")
+        self._pool_size = pool_size
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        if crypto_processes < 0:
+            raise ValueError("crypto_processes must not be negative.")
+        if crypto_queue_size < 0:
+            raise ValueError("crypto_queue_size must not be negative.")
+        self.sdk_id = sdk_id
+        self._pem_file_path = pem_file_path
+        self._crypto = Crypto.read_pem_file(
+            pem_file_path, "argument specified in AsyncYotiClient()"
+        )
+        self._api_url = (
+            api_url if api_url is not None else yoti_python_sdk.YOTI_API_ENDPOINT
+        )
+        self._crypto_processes = crypto_processes
+        self._crypto_queue_size = crypto_queue_size
+        self._crypto_pending = 0
+        self._crypto_executor: Optional[ProcessPoolExecutor] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Get the http session."""
+        if self._session is None:
+            raise ValueError("Call connect first!")
+        return self._session
+
+    async def connect(self, executor: Optional[Executor] = None) -> None:
+        """
+        Set up the client.
+
+        :param executor: the executor running the decryption of the client.
+        :return: None
+        """
+        await super().connect(executor)
+        if self._crypto_processes > 0:
+            self._crypto_executor = ProcessPoolExecutor(
+                max_workers=self._crypto_processes,
+                mp_context=multiprocessing.get_context(CRYPTO_PROCESS_START_METHOD),
+                initializer=init_crypto_worker,
+                initargs=(self._pem_file_path,),
+            )
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self._pool_size,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._dns_cache_ttl,
+            )
+        )
+
+    async def warmup(self, connections: int) -> int:
+        """
+        Open connections to the Yoti API ahead of the first requests.
+
+        The requests are made at the same time, so that each opens its own
+        connection, and resolve the address of the Yoti API into the cache.
+
+        :param connections: the number of connections to open, at most the pool size.
+        :return: the number of connections opened.
+        """
+        connections = min(connections, self._pool_size)
+
+        async def open_connection() -> None:
+            async with self.session.get(self._api_url) as response:
+                await response.read()
+
+        results = await asyncio.gather(
+            *[open_connection() for _ in range(connections)], return_exceptions=True
+        )
+        return count_warmed_up(results)
+
+    async def disconnect(self) -> None:
+        """
+        Tear down the client.
+
+        :return: None
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._crypto_executor is not None:
+            self._crypto_executor.shutdown(wait=False)
+            self._crypto_executor = None
+        await super().disconnect()
+
+    async def get_activity_details(
+        self, encrypted_request_token: str
+    ) -> Optional[ActivityDetails]:
+        """
+        Get the activity details shared with a one-time token.
+
+        :param encrypted_request_token: the token.
+        :return: the activity details.
+        """
+        started_at = time.perf_counter()
+        if self._crypto_executor is not None:
+            request = await self._run_in_crypto_executor(
+                build_profile_request_in_worker,
+                self.sdk_id,
+                self._api_url,
+                encrypted_request_token,
+            )
+        else:
+            request = await self._run_in_executor(
+                build_profile_request,
+                self._crypto,
+                self.sdk_id,
+                self._api_url,
+                encrypted_request_token,
+            )
+        now = time.perf_counter()
+        self.metrics.observe_stage(STAGE_DECRYPT_TOKEN, now - started_at)
+        started_at = now
+        try:
+            async with self.session.request(
+                request.method, request.url, headers=request.headers, data=request.data
+            ) as response:
+                text = await response.text()
+                status = response.status
+        finally:
+            now = time.perf_counter()
+            self.metrics.observe_stage(STAGE_YOTI_API, now - started_at)
+            started_at = now
+        check_response(status, text)
+        receipt = json.loads(text).get("receipt")
+        if self._crypto_executor is None:
+            activity_details = await self._run_in_executor(
+                self._decrypt_receipt, receipt
+            )
+        else:
+            content = await self._run_in_crypto_executor(
+                decrypt_receipt_content_in_worker, receipt
+            )
+            activity_details = await self._run_in_executor(
+                make_activity_details, receipt, content
+            )
+        self.metrics.observe_stage(
+            STAGE_DECRYPT_RECEIPT, time.perf_counter() - started_at
+        )
+        return activity_details
+
+    async def _run_in_crypto_executor(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a function on the crypto worker processes, if they can take it.
+
+        :param func: the function.
+        :param args: the arguments of the function.
+        :return: the result of the function.
+        :raises WorkerPoolFullError: if 'crypto_queue_size' calls already wait for a process.
+        """
+        if self._crypto_pending >= self._crypto_processes + self._crypto_queue_size:
+            raise WorkerPoolFullError(
+                "Crypto worker pool is full: {} calls pending.".format(
+                    self._crypto_pending
+                )
+            )
+        self._crypto_pending += 1
+        try:
+            return await asyncio.get_event_loop().run_in_executor(
+                self._crypto_executor, func, *args
+            )
+        finally:
+            self._crypto_pending -= 1
+
+    def _decrypt_receipt(self, receipt: Dict[str, Any]) -> ActivityDetails:
+        """
+        Decrypt a receipt into activity details.
+
+        :param receipt: the receipt.
+        :return: the activity details.
+        """
+        return make_activity_details(
+            receipt, decrypt_receipt_content(self._crypto, receipt)
+        )
@@ -0,0 +1,466 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the configuration of the yoti connection."""
+
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
+
+from packages.fetchai.protocols.yoti.compression import DEFAULT_MIN_SIZE
+
+
+CLIENT_MODE_SDK = "sdk"
+CLIENT_MODE_ASYNC = "async"
+CLIENT_MODES = (CLIENT_MODE_SDK, CLIENT_MODE_ASYNC)
+
+DEFAULT_CLIENT_MODE = CLIENT_MODE_SDK
+DEFAULT_CRYPTO_PROCESSES = 0
+DEFAULT_MAX_WORKERS = 10
+DEFAULT_MAX_QUEUE_SIZE = 100
+DEFAULT_THREAD_NAME_PREFIX = "yoti_worker"
+DEFAULT_MAX_PENDING_REQUESTS = 1000
+DEFAULT_REQUEST_TIMEOUT = 30.0
+DEFAULT_TOKEN_CACHE_TTL = 60.0
+DEFAULT_TOKEN_CACHE_SIZE = 32
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY = 0.1
+DEFAULT_RETRY_MAX_DELAY = 2.0
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RESET_TIMEOUT = 30.0
+DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS = 2
+DEFAULT_RATE_LIMIT_BURST = 10
+DEFAULT_STATELESS_DIALOGUES = False
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_BATCH_CONCURRENCY = 10
+DEFAULT_ASYNC_HTTP_POOL_SIZE = 100
+DEFAULT_HTTP_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_DNS_CACHE_TTL = 60.0
+DEFAULT_WARMUP_CONNECTIONS = 1
+DEFAULT_DRAIN_TIMEOUT = None
+DEFAULT_BLOB_MIN_SIZE = 16384
+DEFAULT_BLOB_MAX_AGE = 86400.0
+DEFAULT_BLOB_PRUNE_INTERVAL = 3600.0
+DEFAULT_COMPRESSION_MIN_SIZE = DEFAULT_MIN_SIZE
+DEFAULT_METRICS_HOST = "127.0.0.1"
+DEFAULT_METRICS_PORT = None
+
+MAX_PORT = 65535
+
+_INT = (int,)
+_FLOAT = (int, float)
+_STR = (str,)
+_BOOL = (bool,)
+_LIST = (list, tuple)
+
+Number = Union[int, float]
+
+
+def get_config_value(
+    config: Dict[str, Any],
+    name: str,
+    default: Any,
+    types: Tuple[Type, ...],
+    minimum: Optional[Number] = None,
+    maximum: Optional[Number] = None,
+    exclusive_minimum: bool = False,
+    optional: bool = False,
+) -> Any:
+    """
+    Get a value of a configuration and check its type and range.
+
+    :param config: the configuration.
+    :param name: the name of the value.
+    :param default: the value if the configuration has none.
+    :param types: the types the value may have.
+    :param minimum: the lowest value allowed, if any.
+    :param maximum: the highest value allowed, if any.
+    :param exclusive_minimum: whether the minimum itself is not allowed.
+    :param optional: whether the value may be None.
+    :return: the value.
+    """
+    value = config.get(name, default)
+    if value is None:
+        if optional:
+            return None
+        raise ValueError(f"{name} must be set.")
+    if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+        expected = " or ".join(type_.__name__ for type_ in types)
+        raise ValueError(f"Got {name}={value!r}, expected {expected}.")
+    if minimum is not None:
+        if exclusive_minimum and value <= minimum:
+            raise ValueError(f"{name} must be greater than {minimum}.")
+        if value < minimum:
+            raise ValueError(f"{name} must be at least {minimum}.")
+    if maximum is not None and value > maximum:
+        raise ValueError(f"{name} must be at most {maximum}.")
+    return value
+
+
+class YotiClientConfig:
+    """Configuration of a Yoti client of the connection, i.e. of a Yoti application."""
+
+    def __init__(
+        self, config: Dict[str, Any], defaults: "YotiConnectionConfig"
+    ) -> None:
+        """
+        Read the configuration of a Yoti client.
+
+        :param config: an item of the 'yoti_clients' of the connection.
+        :param defaults: the configuration of the connection, for the settings the client does not override.
+        """
+        self.sdk_id = cast(
+            str, get_config_value(config, "yoti_client_sdk_id", None, _STR)
+        )
+        self.key_file_path = cast(
+            str, get_config_value(config, "yoti_key_file_path", None, _STR)
+        )
+        self.name = cast(str, get_config_value(config, "name", self.sdk_id, _STR))
+        self.api_url = cast(
+            Optional[str],
+            get_config_value(
+                config, "yoti_api_url", defaults.yoti_api_url, _STR, optional=True
+            ),
+        )
+        self.rate_limit = cast(
+            Optional[float],
+            get_config_value(
+                config,
+                "rate_limit",
+                defaults.rate_limit,
+                _FLOAT,
+                minimum=0,
+                exclusive_minimum=True,
+                optional=True,
+            ),
+        )
+        self.rate_limit_burst = cast(
+            int,
+            get_config_value(
+                config, "rate_limit_burst", defaults.rate_limit_burst, _INT, minimum=1
+            ),
+        )
+        self.scenarios = cast(
+            Optional[List[str]],
+            get_config_value(config, "scenarios", None, _LIST, optional=True),
+        )
+
+
+class YotiConnectionConfig:
+    """Configuration of the yoti connection, read and checked once."""
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        """
+        Read the configuration of the connection.
+
+        :param config: the 'config' of the connection configuration.
+        """
+        self.client_mode = cast(
+            str, get_config_value(config, "client_mode", DEFAULT_CLIENT_MODE, _STR)
+        )
+        if self.client_mode not in CLIENT_MODES:
+            raise ValueError(
+                f"Got client_mode={self.client_mode}, expected one of {CLIENT_MODES}."
+            )
+        self.request_timeout = cast(
+            Optional[float],
+            get_config_value(
+                config,
+                "request_timeout",
+                DEFAULT_REQUEST_TIMEOUT,
+                _FLOAT,
+                minimum=0,
+                exclusive_minimum=True,
+                optional=True,
+            ),
+        )
+        self.yoti_api_url = cast(
+            Optional[str],
+            get_config_value(config, "yoti_api_url", None, _STR, optional=True),
+        )
+        self.crypto_processes = cast(
+            int,
+            get_config_value(
+                config, "crypto_processes", DEFAULT_CRYPTO_PROCESSES, _INT, minimum=0
+            ),
+        )
+        if self.crypto_processes > 0 and self.client_mode != CLIENT_MODE_ASYNC:
+            raise ValueError(
+                f"crypto_processes requires client_mode={CLIENT_MODE_ASYNC}."
+            )
+        self.max_workers = cast(
+            int,
+            get_config_value(
+                config, "max_workers", DEFAULT_MAX_WORKERS, _INT, minimum=1
+            ),
+        )
+        self.max_queue_size = cast(
+            int,
+            get_config_value(
+                config, "max_queue_size", DEFAULT_MAX_QUEUE_SIZE, _INT, minimum=0
+            ),
+        )
+        self.thread_name_prefix = cast(
+            str,
+            get_config_value(
+                config, "thread_name_prefix", DEFAULT_THREAD_NAME_PREFIX, _STR
+            ),
+        )
+        self.max_pending_requests = cast(
+            int,
+            get_config_value(
+                config,
+                "max_pending_requests",
+                DEFAULT_MAX_PENDING_REQUESTS,
+                _INT,
+                minimum=1,
+            ),
+        )
+        self.http_pool_size = cast(
+            Optional[int],
+            get_config_value(
+                config, "http_pool_size", None, _INT, minimum=1, optional=True
+            ),
+        )
+        self.http_keepalive_timeout = cast(
+            float,
+            get_config_value(
+                config,
+                "http_keepalive_timeout",
+                DEFAULT_HTTP_KEEPALIVE_TIMEOUT,
+                _FLOAT,
+                minimum=0,
+            ),
+        )
+        self.dns_cache_ttl = cast(
+            Optional[float],
+            get_config_value(
+                config,
+                "dns_cache_ttl",
+                DEFAULT_DNS_CACHE_TTL,
+                _FLOAT,
+                minimum=0,
+                optional=True,
+            ),
+        )
+        self.warmup_connections = cast(
+            int,
+            get_config_value(
+                config,
+                "warmup_connections",
+                DEFAULT_WARMUP_CONNECTIONS,
+                _INT,
+                minimum=0,
+            ),
+        )
+        drain_timeout = cast(
+            Optional[float],
+            get_config_value(
+                config,
+                "drain_timeout",
+                DEFAULT_DRAIN_TIMEOUT,
+                _FLOAT,
+                minimum=0,
+                optional=True,
+            ),
+        )
+        if drain_timeout is None:
+            drain_timeout = (
+                self.request_timeout
+                if self.request_timeout is not None
+                else DEFAULT_REQUEST_TIMEOUT
+            )
+        self.drain_timeout = drain_timeout
+        self.circuit_failure_threshold = cast(
+            int,
+            get_config_value(
+                config,
+                "circuit_failure_threshold",
+                DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+                _INT,
+                minimum=1,
+            ),
+        )
+        self.circuit_reset_timeout = cast(
+            float,
+            get_config_value(
+                config,
+                "circuit_reset_timeout",
+                DEFAULT_CIRCUIT_RESET_TIMEOUT,
+                _FLOAT,
+                minimum=0,
+            ),
+        )
+        self.circuit_half_open_max_calls = cast(
+            int,
+            get_config_value(
+                config,
+                "circuit_half_open_max_calls",
+                DEFAULT_CIRCUIT_HALF_OPEN_MAX_CALLS,
+                _INT,
+                minimum=1,
+            ),
+        )
+        self.rate_limit = cast(
+            Optional[float],
+            get_config_value(
+                config,
+                "rate_limit",
+                None,
+                _FLOAT,
+                minimum=0,
+                exclusive_minimum=True,
+                optional=True,
+            ),
+        )
+        self.rate_limit_burst = cast(
+            int,
+            get_config_value(
+                config, "rate_limit_burst", DEFAULT_RATE_LIMIT_BURST, _INT, minimum=1
+            ),
+        )
+        self.token_cache_ttl = cast(
+            float,
+            get_config_value(
+                config, "token_cache_ttl", DEFAULT_TOKEN_CACHE_TTL, _FLOAT, minimum=0
+            ),
+        )
+        self.token_cache_size = cast(
+            int,
+            get_config_value(
+                config, "token_cache_size", DEFAULT_TOKEN_CACHE_SIZE, _INT, minimum=0
+            ),
+        )
+        self.retry_max_attempts = cast(
+            int,
+            get_config_value(
+                config,
+                "retry_max_attempts",
+                DEFAULT_RETRY_MAX_ATTEMPTS,
+                _INT,
+                minimum=1,
+            ),
+        )
+        self.retry_base_delay = cast(
+            float,
+            get_config_value(
+                config, "retry_base_delay", DEFAULT_RETRY_BASE_DELAY, _FLOAT, minimum=0
+            ),
+        )
+        self.retry_max_delay = cast(
+            float,
+            get_config_value(
+                config, "retry_max_delay", DEFAULT_RETRY_MAX_DELAY, _FLOAT, minimum=0
+            ),
+        )
+        self.stateless_dialogues = cast(
+            bool,
+            get_config_value(
+                config, "stateless_dialogues", DEFAULT_STATELESS_DIALOGUES, _BOOL
+            ),
+        )
+        self.allowed_dotted_paths = cast(
+            Optional[List[str]],
+            get_config_value(
+                config, "allowed_dotted_paths", None, _LIST, optional=True
+            ),
+        )
+        self.max_batch_size = cast(
+            int,
+            get_config_value(
+                config, "max_batch_size", DEFAULT_MAX_BATCH_SIZE, _INT, minimum=1
+            ),
+        )
+        self.batch_concurrency = cast(
+            int,
+            get_config_value(
+                config, "batch_concurrency", DEFAULT_BATCH_CONCURRENCY, _INT, minimum=1
+            ),
+        )
+        self.blob_store_path = cast(
+            Optional[str],
+            get_config_value(config, "blob_store_path", None, _STR, optional=True),
+        )
+        self.blob_min_size = cast(
+            int,
+            get_config_value(
+                config, "blob_min_size", DEFAULT_BLOB_MIN_SIZE, _INT, minimum=0
+            ),
+        )
+        self.blob_max_age = cast(
+            float,
+            get_config_value(
+                config, "blob_max_age", DEFAULT_BLOB_MAX_AGE, _FLOAT, minimum=0
+            ),
+        )
+        self.blob_prune_interval = cast(
+            Optional[float],
+            get_config_value(
+                config,
+                "blob_prune_interval",
+                DEFAULT_BLOB_PRUNE_INTERVAL,
+                _FLOAT,
+                minimum=0,
+                exclusive_minimum=True,
+                optional=True,
+            ),
+        )
+        self.compression_min_size = cast(
+            int,
+            get_config_value(
+                config,
+                "compression_min_size",
+                DEFAULT_COMPRESSION_MIN_SIZE,
+                _INT,
+                minimum=0,
+            ),
+        )
+        self.metrics_host = cast(
+            str, get_config_value(config, "metrics_host", DEFAULT_METRICS_HOST, _STR)
+        )
+        self.metrics_port = cast(
+            Optional[int],
+            get_config_value(
+                config,
+                "metrics_port",
+                DEFAULT_METRICS_PORT,
+                _INT,
+                minimum=0,
+                maximum=MAX_PORT,
+                optional=True,
+            ),
+        )
+        yoti_clients = cast(
+            Optional[List[Dict[str, Any]]],
+            get_config_value(config, "yoti_clients", None, _LIST, optional=True),
+        )
+        if yoti_clients is None:
+            yoti_clients = [
+                {
+                    "yoti_client_sdk_id": config.get("yoti_client_sdk_id"),
+                    "yoti_key_file_path": config.get("yoti_key_file_path"),
+                }
+            ]
+        if len(yoti_clients) == 0 or any(
+            client_config.get("yoti_client_sdk_id") is None
+            or client_config.get("yoti_key_file_path") is None
+            for client_config in yoti_clients
+        ):
+            raise ValueError("Missing configuration.")
+        self.clients = [
+            YotiClientConfig(client_config, self) for client_config in yoti_clients
+        ]
@@ -21,15 +21,26 @@
 
 import asyncio
 import functools
-import json
+import time
 from abc import ABC
 from asyncio import Task
-from collections import deque
 from concurrent.futures._base import Executor
 from logging import Logger
-from typing import Any, Callable, Deque, Dict, List, Optional, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
 
-from yoti_python_sdk import Client as YotiClient
+from yoti_python_sdk.activity_details import ActivityDetails
 
 from aea.common import Address
 from aea.configurations.base import PublicId
@@ -37,32 +48,114 @@ from aea.connections.base import Connection, ConnectionStates
 from aea.helpers.async_utils import AsyncState
 from aea.mail.base import Envelope
 from aea.protocols.base import Message
-from aea.protocols.dialogue.base import Dialogue
+from aea.protocols.dialogue.base import Dialogue, Dialogues
 
+from packages.fetchai.connections.yoti.client import (
+    AsyncYotiClient,
+    BaseYotiClient,
+    SdkYotiClient,
+)
+from packages.fetchai.connections.yoti.config import (
+    CLIENT_MODE_ASYNC,
+    DEFAULT_ASYNC_HTTP_POOL_SIZE,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_BLOB_MIN_SIZE,
+    DEFAULT_COMPRESSION_MIN_SIZE,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_STATELESS_DIALOGUES,
+    DEFAULT_TOKEN_CACHE_SIZE,
+    DEFAULT_TOKEN_CACHE_TTL,
+    YotiConnectionConfig,
+)
+from packages.fetchai.connections.yoti.executor import (
+    BoundedThreadPoolExecutor,
+    WorkerPoolFullError,
+)
+from packages.fetchai.connections.yoti.extractors import (
+    Extractor,
+    ExtractorRegistry,
+    UnknownDottedPathError,
+)
+from packages.fetchai.connections.yoti.metrics import (
+    STAGE_DELIVERY,
+    STAGE_EXTRACTION,
+    STAGE_RATE_LIMIT,
+    MetricsServer,
+    YotiMetrics,
+)
+from packages.fetchai.connections.yoti.pool import (
+    PooledClient,
+    UnknownScenarioError,
+    YotiClientPool,
+)
+from packages.fetchai.connections.yoti.rate_limiter import TokenBucket
+from packages.fetchai.connections.yoti.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_retryable,
+)
+from packages.fetchai.connections.yoti.single_flight import SingleFlight
+from packages.fetchai.protocols.yoti.blob_store import (
+    BlobStore,
+    has_large_binary,
+    offload,
+)
+from packages.fetchai.protocols.yoti.compression import choose_compression
+from packages.fetchai.protocols.yoti.custom_types import (
+    ProfileInfo,
+    ProfileResult,
+    ProfileResults,
+)
 from packages.fetchai.protocols.yoti.dialogues import YotiDialogue
 from packages.fetchai.protocols.yoti.dialogues import YotiDialogues as BaseYotiDialogues
 from packages.fetchai.protocols.yoti.message import YotiMessage
 
 
-CONNECTION_ID = PublicId.from_str("fetchai/yoti:0.1.0")
+CONNECTION_ID = PublicId.from_str("fetchai/yoti:0.2.0")
 
+DEFAULT_WARMUP_TIMEOUT = 10.0
 
-def rgetattr(obj, attr, *args):
-    """Recursive getattr."""
+ERROR_CODE_BAD_REQUEST = 400
+ERROR_CODE_BUSY = 429
+ERROR_CODE_INTERNAL = 500
+ERROR_CODE_BAD_GATEWAY = 502
+ERROR_CODE_UNAVAILABLE = 503
+ERROR_CODE_TIMEOUT = 504
 
-    def _getattr(obj, attr):
-        return getattr(obj, attr, *args)
 
-    return functools.reduce(_getattr, [obj] + attr.split("."))
+class TrustedYotiMessage(YotiMessage):
+    """
+    A yoti message built by the connection, which skips checking the profile values.
+
+    The connection extracts the attribute values of a profile with types of
+    the 'yoti' protocol by construction, so checking every one of them
+    again only costs time. The other protocol checks still run, and the
+    messages received, from the skills or decoded, are checked in full.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def _is_info_consistent(  # pylint: disable=unused-argument
+        self, info: ProfileInfo
+    ) -> bool:
+        """Skip the checks of the attribute values."""
+        return True
 
 
 class YotiDialogues(BaseYotiDialogues):
-    """The dialogues class keeps track of all dialogues."""
+    """
+    The dialogues class keeps track of all dialogues.
+
+    A dialogue is forgotten as soon as the connection has replied to it.
+    """
 
-    def __init__(self, **kwargs) -> None:
+    def __init__(self, dialogue_class: Type[YotiDialogue] = YotiDialogue) -> None:
         """
         Initialize dialogues.
 
+        :param dialogue_class: the dialogue class used
         :return: None
         """
 
@@ -78,12 +171,103 @@ class YotiDialogues(BaseYotiDialogues):
             # The yoti connection maintains the dialogue on behalf of the yoti server
             return YotiDialogue.Role.YOTI_SERVER
 
-        BaseYotiDialogues.__init__(
+        # the generated initializer does not take keep_terminal_state_dialogues
+        Dialogues.__init__(
             self,
             self_address=str(CONNECTION_ID),
+            end_states=cast(FrozenSet[Dialogue.EndState], self.END_STATES),
+            message_class=TrustedYotiMessage,
+            dialogue_class=dialogue_class,
             role_from_first_message=role_from_first_message,
+            keep_terminal_state_dialogues=False,
+        )
+        self._open_dialogues = 0
+
+    @property
+    def open_dialogues(self) -> int:
+        """Get the number of dialogues kept track of."""
+        return self._open_dialogues
+
+    def update(self, message: Message) -> Optional[Dialogue]:
+        """
+        Update the state of dialogues with a new incoming message.
+
+        :param message: a new incoming message
+        :return: the new or existing dialogue the message is intended for, or None in case of any errors.
+        """
+        dialogue = super().update(message)
+        if dialogue is not None and message.message_id == Dialogue.STARTING_MESSAGE_ID:
+            self._open_dialogues += 1
+            dialogue.add_terminal_state_callback(self._on_dialogue_terminated)
+        return dialogue
+
+    def _on_dialogue_terminated(  # pylint: disable=unused-argument
+        self, dialogue: Dialogue
+    ) -> None:
+        """Count a dialogue which reached a terminal state as forgotten."""
+        self._open_dialogues -= 1
+
+
+class StatelessYotiDialogue:
+    """
+    Stand-in for a YotiDialogue answering a request without dialogue bookkeeping.
+
+    The yoti protocol is request/response: the connection replies once to a
+    'get_profile' or 'get_profiles' message and the dialogue is over, so
+    nothing needs storing.
+    """
+
+    __slots__ = ("_request", "_dialogue_reference")
+
+    def __init__(self, request: YotiMessage) -> None:
+        """
+        Initialize the dialogue.
+
+        :param request: the first message of the dialogue.
+        """
+        starter_reference, responder_reference = request.dialogue_reference
+        if (
+            request.performative not in YotiDialogue.INITIAL_PERFORMATIVES
+            or request.message_id != Dialogue.STARTING_MESSAGE_ID
+            or request.target != Dialogue.STARTING_TARGET
+            or starter_reference == Dialogue.UNASSIGNED_DIALOGUE_REFERENCE
+            or responder_reference != Dialogue.UNASSIGNED_DIALOGUE_REFERENCE
+        ):
+            raise ValueError(
+                "No dialogue created. Message={} not valid.".format(request)
+            )
+        self._request = request
+        self._dialogue_reference = (
+            starter_reference,
+            BaseYotiDialogues._generate_dialogue_nonce(),  # pylint: disable=protected-access
+        )
+
+    def reply(
+        self,
+        performative: YotiMessage.Performative,
+        target_message: Optional[Message] = None,
+        **kwargs: Any,
+    ) -> YotiMessage:
+        """
+        Reply to the request.
+
+        :param performative: the performative of the reply message.
+        :param target_message: the message to reply to, only the request is accepted.
+        :param kwargs: the content of the reply message.
+        :return: the reply message.
+        """
+        if target_message is not None and target_message is not self._request:
+            raise ValueError("The target message does not exist in this dialogue.")
+        reply = TrustedYotiMessage(
+            dialogue_reference=self._dialogue_reference,
+            message_id=self._request.message_id + 1,
+            target=self._request.message_id,
+            performative=performative,
             **kwargs,
         )
+        reply.sender = self._request.to
+        reply.to = self._request.sender
+        return reply
 
 
 class YotiRequestDispatcher(ABC):
@@ -91,42 +275,133 @@ class YotiRequestDispatcher(ABC):
 
     def __init__(
         self,
-        client: YotiClient,
+        clients: YotiClientPool,
         logger: Logger,
         connection_state: AsyncState,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        request_timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT,
+        token_cache_ttl: float = DEFAULT_TOKEN_CACHE_TTL,
+        token_cache_size: int = DEFAULT_TOKEN_CACHE_SIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        stateless_dialogues: bool = DEFAULT_STATELESS_DIALOGUES,
+        extractors: Optional[ExtractorRegistry] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        metrics: Optional[YotiMetrics] = None,
+        blob_store: Optional[BlobStore] = None,
+        blob_min_size: int = DEFAULT_BLOB_MIN_SIZE,
         executor: Optional[Executor] = None,
+        compression_min_size: int = DEFAULT_COMPRESSION_MIN_SIZE,
     ):
         """
         Initialize the request dispatcher.
 
+        :param clients: the pool of Yoti clients.
+        :param logger: the logger.
+        :param connection_state: the connection state.
         :param loop: the asyncio loop.
-        :param executor: an executor.
+        :param request_timeout: the default number of seconds a request may take.
+        :param token_cache_ttl: the number of seconds the outcome for a token is kept.
+        :param token_cache_size: the maximum number of token outcomes kept.
+        :param retry_policy: the retry policy of the Yoti API calls.
+        :param stateless_dialogues: whether to reply without keeping track of dialogues.
+        :param extractors: the registry of the profile extractors.
+        :param max_batch_size: the maximum number of tokens in a 'get_profiles' message.
+        :param batch_concurrency: the number of tokens of a batch resolved at the same time.
+        :param metrics: the metrics of the connection.
+        :param blob_store: the store of the large binary attributes, None to send them in the messages.
+        :param blob_min_size: the minimum size, in bytes, of the binary attributes kept in the blob store.
+        :param executor: the executor writing to the blob store.
+        :param compression_min_size: the minimum size, in bytes, of the encoded replies compressed.
         """
         self.connection_state = connection_state
         self.loop = loop if loop is not None else asyncio.get_event_loop()
-        self.executor = executor
         self.logger = logger
-        self.client = client
+        self.clients = clients
+        self.request_timeout = request_timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.stateless_dialogues = stateless_dialogues
+        self.extractors = extractors if extractors is not None else ExtractorRegistry()
+        self.max_batch_size = max_batch_size
+        self.batch_concurrency = batch_concurrency
+        self.metrics = metrics if metrics is not None else YotiMetrics()
+        self.blob_store = blob_store
+        self.blob_min_size = blob_min_size
+        self.executor = executor
+        self.compression_min_size = compression_min_size
         self.dialogues = YotiDialogues()
+        self.single_flight = SingleFlight(
+            ttl=token_cache_ttl,
+            max_size=token_cache_size,
+            is_cacheable=self._is_cacheable,
+        )
 
     async def run_async(
-        self, func: Callable[[Any], Task], message: YotiMessage, dialogue: YotiDialogue,
+        self,
+        func: Callable[[YotiMessage, YotiDialogue], Awaitable[YotiMessage]],
+        message: YotiMessage,
+        dialogue: YotiDialogue,
     ):
         """
-        Run a function in executor.
+        Run a handler and turn its failures into error messages.
 
-        :param func: the function to execute.
-        :param args: the arguments to pass to the function.
-        :return: the return value of the function.
+        :param func: the handler to run.
+        :param message: the Yoti message
+        :param dialogue: the Yoti dialogue
+        :return: the response message.
         """
+        timeout = self.get_timeout(message)
         try:
-            response = await self.loop.run_in_executor(
-                self.executor, func, message, dialogue
-            )
+            response = await asyncio.wait_for(func(message, dialogue), timeout)
             return response
+        except asyncio.TimeoutError:
+            return self.get_error_message(
+                Exception("Request timed out after {} seconds.".format(timeout)),
+                message,
+                dialogue,
+                error_code=ERROR_CODE_TIMEOUT,
+            )
+        except asyncio.CancelledError:  # pragma: nocover
+            raise
         except Exception as e:  # pylint: disable=broad-except
-            return self.get_error_message(e, message, dialogue)
+            return self.get_error_message(
+                e, message, dialogue, error_code=self.get_error_code(e)
+            )
+
+    def get_error_code(self, e: Exception) -> int:
+        """
+        Get the error code of a failed request.
+
+        :param e: the exception.
+        :return: the error code.
+        """
+        if isinstance(e, asyncio.TimeoutError):
+            return ERROR_CODE_TIMEOUT
+        if isinstance(e, (UnknownDottedPathError, UnknownScenarioError)):
+            return ERROR_CODE_BAD_REQUEST
+        if isinstance(e, CircuitOpenError):
+            return ERROR_CODE_UNAVAILABLE
+        if isinstance(e, WorkerPoolFullError):
+            self.logger.warning(str(e))
+            return ERROR_CODE_BUSY
+        return ERROR_CODE_BAD_GATEWAY if is_retryable(e) else ERROR_CODE_INTERNAL
+
+    def get_timeout(self, message: YotiMessage) -> Optional[float]:
+        """
+        Get the deadline of a request.
+
+        :param message: the Yoti message
+        :return: the number of seconds the request may take, or None for no deadline.
+        """
+        if message.performative == YotiMessage.Performative.GET_PROFILES:
+            # each token of a batch has its own deadline
+            return None
+        if (
+            message.performative == YotiMessage.Performative.GET_PROFILE
+            and message.timeout is not None
+        ):
+            return message.timeout
+        return self.request_timeout
 
     def dispatch(self, envelope: Envelope) -> Task:
         """
@@ -135,19 +410,124 @@ class YotiRequestDispatcher(ABC):
         :param envelope: the envelope.
         :return: an awaitable.
         """
+        message, dialogue = self._update_dialogue(envelope)
+        performative = message.performative
+        if (
+            performative == YotiMessage.Performative.GET_PROFILES
+            and len(message.tokens) > self.max_batch_size
+        ):
+            return self._done(
+                self.get_error_message(
+                    ValueError(
+                        "Got {} tokens, expected at most {}.".format(
+                            len(message.tokens), self.max_batch_size
+                        )
+                    ),
+                    message,
+                    dialogue,
+                    error_code=ERROR_CODE_BAD_REQUEST,
+                )
+            )
+        if performative in (
+            YotiMessage.Performative.GET_PROFILE,
+            YotiMessage.Performative.GET_PROFILES,
+        ):
+            try:
+                self.extractors.get(
+                    message.dotted_path, message.args, message.attributes
+                )
+                self.clients.get_candidates(message.scenario)
+            except (UnknownDottedPathError, UnknownScenarioError) as e:
+                return self._done(
+                    self.get_error_message(
+                        e, message, dialogue, error_code=ERROR_CODE_BAD_REQUEST
+                    )
+                )
+        handler = self.get_handler(performative.value)
+        return self.loop.create_task(self.run_async(handler, message, dialogue))
+
+    def reject(self, envelope: Envelope, error_code: int, error_msg: str) -> Task:
+        """
+        Answer a request with an error without handling it.
+
+        :param envelope: the envelope.
+        :param error_code: the error code.
+        :param error_msg: the error message.
+        :return: an awaitable, already done.
+        """
+        message, dialogue = self._update_dialogue(envelope)
+        response = self.get_error_message(
+            Exception(error_msg), message, dialogue, error_code=error_code
+        )
+        return self._done(response)
+
+    def fail(self, envelope: Envelope, error: BaseException) -> Optional[Task]:
+        """
+        Answer a request whose handling failed with an error, in its dialogue.
+
+        :param envelope: the envelope.
+        :param error: the exception raised by the handling of the request.
+        :return: an awaitable, already done, or None if the request has no dialogue in progress.
+        """
+        message = cast(YotiMessage, envelope.message)
+        if self.stateless_dialogues:
+            dialogue: Optional[YotiDialogue] = cast(
+                YotiDialogue, StatelessYotiDialogue(message)
+            )
+        else:
+            dialogue = cast(
+                Optional[YotiDialogue], self.dialogues.get_dialogue(message)
+            )
+        if dialogue is None:
+            return None
+        error_code = (
+            self.get_error_code(error)
+            if isinstance(error, Exception)
+            else ERROR_CODE_INTERNAL
+        )
+        return self._done(
+            self.get_error_message(
+                Exception("Request failed: {!r}".format(error)),
+                message,
+                dialogue,
+                error_code=error_code,
+            )
+        )
+
+    def _done(self, response: YotiMessage) -> Task:
+        """
+        Wrap a response in an awaitable which is already done.
+
+        :param response: the response message.
+        :return: the awaitable.
+        """
+        future = self.loop.create_future()
+        future.set_result(response)
+        return cast(Task, future)
+
+    def _update_dialogue(self, envelope: Envelope) -> Tuple[YotiMessage, YotiDialogue]:
+        """
+        Update the dialogues with the message of an envelope.
+
+        :param envelope: the envelope.
+        :return: the message and its dialogue.
+        """
         if not isinstance(envelope.message, Message):  # pragma: nocover
             raise ValueError("Yoti connection expects non-serialized messages.")
         message = cast(YotiMessage, envelope.message)
+        self.metrics.requests.labels(message.performative.value).inc()
+        if self.stateless_dialogues:
+            return message, cast(YotiDialogue, StatelessYotiDialogue(message))
         dialogue = cast(Optional[YotiDialogue], self.dialogues.update(message))
         if dialogue is None:
             raise ValueError(  # pragma: nocover
                 "No dialogue created. Message={} not valid.".format(message)
             )
-        performative = message.performative
-        handler = self.get_handler(performative.value)
-        return self.loop.create_task(self.run_async(handler, message, dialogue))
+        return message, dialogue
 
-    def get_handler(self, performative: str) -> Callable[[Any], Task]:
+    def get_handler(
+        self, performative: str
+    ) -> Callable[[YotiMessage, YotiDialogue], Awaitable[YotiMessage]]:
         """
         Get the handler method, given the message performative.
 
@@ -159,7 +539,9 @@ class YotiRequestDispatcher(ABC):
             raise Exception("Performative not recognized.")
         return handler
 
-    def get_profile(self, message: YotiMessage, dialogue: YotiDialogue) -> YotiMessage:
+    async def get_profile(
+        self, message: YotiMessage, dialogue: YotiDialogue
+    ) -> YotiMessage:
         """
         Send the request 'get_request'.
 
@@ -167,55 +549,237 @@ class YotiRequestDispatcher(ABC):
         :param dialogue: the Yoti dialogue
         :return: None
         """
-        activity_details = self.client.get_activity_details(message.token)
+        extractor = self.extractors.get(
+            message.dotted_path, message.args, message.attributes
+        )
+        result = await self.get_info(message.token, extractor, message.scenario)
+        response = cast(
+            YotiMessage,
+            dialogue.reply(
+                performative=YotiMessage.Performative.PROFILE,
+                target_message=message,
+                info=result,
+                **self._get_reply_compression(message),
+            ),
+        )
+        return response
+
+    async def get_profiles(
+        self, message: YotiMessage, dialogue: YotiDialogue
+    ) -> YotiMessage:
+        """
+        Send the request 'get_profiles'.
+
+        At most 'batch_concurrency' tokens are resolved at the same time, each
+        with its own deadline. The failure of a token does not fail the batch.
+
+        :param message: the Yoti message
+        :param dialogue: the Yoti dialogue
+        :return: the response message.
+        """
+        extractor = self.extractors.get(
+            message.dotted_path, message.args, message.attributes
+        )
+        timeout = (
+            message.timeout if message.timeout is not None else self.request_timeout
+        )
+        tokens = message.tokens
+        scenario = message.scenario
+        results: List[Optional[ProfileResult]] = [None] * len(tokens)
+        indexes = iter(range(len(tokens)))
+
+        async def resolve_tokens() -> None:
+            for index in indexes:
+                results[index] = await self._resolve_token(
+                    tokens[index], extractor, timeout, scenario
+                )
+
+        await asyncio.gather(
+            *[resolve_tokens() for _ in range(min(self.batch_concurrency, len(tokens)))]
+        )
+        response = cast(
+            YotiMessage,
+            dialogue.reply(
+                performative=YotiMessage.Performative.PROFILES,
+                target_message=message,
+                results=ProfileResults(cast(List[ProfileResult], results)),
+                **self._get_reply_compression(message),
+            ),
+        )
+        return response
+
+    def _get_reply_compression(self, message: YotiMessage) -> Dict[str, Any]:
+        """
+        Get the compression of the reply to a request, among the ones its sender accepts.
+
+        The reply is compressed if it is encoded, e.g. to cross a process or
+        network boundary, and at least 'compression_min_size' bytes.
+
+        :param message: the request.
+        :return: the contents of the reply setting its compression, none if no compression accepted is available.
+        """
+        compression = choose_compression(message.accept_compression)
+        if compression is None:
+            return {}
+        return {
+            "compression": compression,
+            "compression_min_size": self.compression_min_size,
+        }
+
+    async def _resolve_token(
+        self,
+        token: str,
+        extractor: Extractor,
+        timeout: Optional[float],
+        scenario: Optional[str] = None,
+    ) -> ProfileResult:
+        """
+        Resolve a token of a batch.
+
+        :param token: the one-time token.
+        :param extractor: the extractor of the profile info.
+        :param timeout: the number of seconds the token may take, or None for no deadline.
+        :param scenario: the scenario the token was shared in, if known.
+        :return: the outcome.
+        """
+        try:
+            info = await asyncio.wait_for(
+                self.get_info(token, extractor, scenario), timeout
+            )
+        except asyncio.TimeoutError:
+            return ProfileResult(
+                token,
+                error_code=ERROR_CODE_TIMEOUT,
+                error_msg="Request timed out after {} seconds.".format(timeout),
+            )
+        except asyncio.CancelledError:  # pragma: nocover
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            return ProfileResult(
+                token, error_code=self.get_error_code(e), error_msg=str(e)
+            )
+        return ProfileResult(token, info=info)
+
+    async def get_info(
+        self, token: str, extractor: Extractor, scenario: Optional[str] = None
+    ) -> ProfileInfo:
+        """
+        Get the profile info shared with a token.
+
+        All the values are of the types of the 'yoti' protocol,
+        'remember_me_id' being empty if the application does not ask for it,
+        so the reply carrying the info is a TrustedYotiMessage, which does not
+        check them again. With a blob store, the binary attributes of at least
+        'blob_min_size' bytes, like selfies and document images, are kept in
+        the store and the info carries references to them.
+
+        :param token: the one-time token.
+        :param extractor: the extractor of the profile info.
+        :param scenario: the scenario the token was shared in, if known.
+        :return: the profile info.
+        """
+        activity_details = await self.single_flight.do(
+            token, functools.partial(self.get_activity_details, token, scenario),
+        )
         if activity_details is None:
-            response = self.get_error_message(
-                ValueError("No activity_details returned"), message, dialogue
+            raise ValueError("No activity_details returned")
+        started_at = time.perf_counter()
+        values = {
+            "remember_me_id": activity_details.user_id or "",
+            **extractor(activity_details.profile),
+        }
+        self.metrics.observe_stage(STAGE_EXTRACTION, time.perf_counter() - started_at)
+        if self.blob_store is not None and has_large_binary(values, self.blob_min_size):
+            # hashing and writing megabytes must not block the event loop
+            values = await self.loop.run_in_executor(
+                self.executor, offload, values, self.blob_store, self.blob_min_size
             )
-            return response
-        try:
-            remember_me_id = activity_details.user_id
-            profile = activity_details.profile
-            if message.dotted_path == "":
-                attributes = {
-                    key: value.value
-                    if isinstance(value.value, str)
-                    else json.dumps(value.value)
-                    for key, value in profile.attributes.items()
-                }
-                result = {"remember_me_id": remember_me_id, **attributes}
+        return ProfileInfo(values)
+
+    async def get_activity_details(
+        self, token: str, scenario: Optional[str] = None
+    ) -> Optional[ActivityDetails]:
+        """
+        Get the activity details of a token, retrying transient failures.
+
+        Each attempt goes to the least busy client serving the scenario, so
+        a retry moves away from a client whose circuit opened.
+
+        :param token: the one-time token.
+        :param scenario: the scenario the token was shared in, if known.
+        :return: the activity details.
+        """
+        attempt = 0
+        while True:
+            member = self.clients.acquire(scenario)
+            circuit_breaker = member.circuit_breaker
+            attempt += 1
+            try:
+                if member.rate_limiter is not None:
+                    wait_time = await member.rate_limiter.acquire()
+                    self.metrics.observe_stage(STAGE_RATE_LIMIT, wait_time)
+                    if wait_time > 0:
+                        self.logger.debug(
+                            "Waited {:.3f} seconds for the rate limit of {}.".format(
+                                wait_time, member.name
+                            )
+                        )
+                self.metrics.client_calls.labels(member.name).inc()
+                activity_details = await member.client.get_activity_details(token)
+            except asyncio.CancelledError:
+                circuit_breaker.on_neutral()
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                if not is_retryable(e):
+                    circuit_breaker.on_neutral()
+                    raise
+                circuit_breaker.on_failure()
+                if attempt >= self.retry_policy.max_attempts or all(
+                    candidate.circuit_breaker.state != CircuitBreaker.State.CLOSED
+                    for candidate in self.clients.get_candidates(scenario)
+                ):
+                    raise
+                error = e
             else:
-                callable_ = rgetattr(profile, message.dotted_path, *message.args)
-                if len(message.args) != 0:
-                    intermediate = callable_(*message.args)
-                else:
-                    intermediate = callable_
-                result = {
-                    "remember_me_id": remember_me_id,
-                    "name": intermediate.name,
-                    "value": intermediate.value,
-                    "sources": ",".join(
-                        [source.value for source in intermediate.sources]
-                    ),
-                    "verifiers": ",".join(
-                        [verifier.value for verifier in intermediate.verifiers]
-                    ),
-                }
-            response = cast(
-                YotiMessage,
-                dialogue.reply(
-                    performative=YotiMessage.Performative.PROFILE,
-                    target_message=message,
-                    info=result,
-                ),
+                circuit_breaker.on_success()
+                return activity_details
+            finally:
+                self.clients.release(member)
+            delay = self.retry_policy.get_delay(attempt)
+            self.logger.debug(
+                "Yoti API call of {} failed: {}, retry {} in {:.3f} seconds.".format(
+                    member.name, error, attempt, delay
+                )
             )
-        except Exception as e:  # pylint: disable=broad-except
-            response = self.get_error_message(e, message, dialogue)
-        return response
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _is_cacheable(exception: BaseException) -> bool:
+        """
+        Check whether a failure to get activity details is kept for duplicate tokens.
+
+        Failures caused by the state of the connection or of the Yoti API rather
+        than by the token are not kept.
+
+        :param exception: the exception.
+        :return: whether the failure is kept.
+        """
+        return not isinstance(
+            exception,
+            (
+                WorkerPoolFullError,
+                CircuitOpenError,
+                UnknownScenarioError,
+                asyncio.TimeoutError,
+            ),
+        ) and not is_retryable(exception)
 
     @staticmethod
     def get_error_message(
-        e: Exception, message: YotiMessage, dialogue: YotiDialogue,
+        e: Exception,
+        message: YotiMessage,
+        dialogue: YotiDialogue,
+        error_code: int = ERROR_CODE_INTERNAL,
     ) -> YotiMessage:
         """
         Build an error message.
@@ -223,6 +787,7 @@ class YotiRequestDispatcher(ABC):
         :param e: the exception
         :param message: the received message.
         :param dialogue: the dialogue.
+        :param error_code: the error code.
         :return: an error message response.
         """
         response = cast(
@@ -230,7 +795,7 @@ class YotiRequestDispatcher(ABC):
             dialogue.reply(
                 performative=YotiMessage.Performative.ERROR,
                 target_message=message,
-                error_code=500,
+                error_code=error_code,
                 error_msg=str(e),
             ),
         )
@@ -240,7 +805,7 @@ class YotiRequestDispatcher(ABC):
 class YotiConnection(Connection):
     """Proxy to the functionality of the SDK or API."""
 
-    connection_id = PublicId.from_str("fetchai/yoti:0.1.0")
+    connection_id = PublicId.from_str("fetchai/yoti:0.2.0")
 
     def __init__(self, **kwargs):
         """
@@ -251,28 +816,136 @@ class YotiConnection(Connection):
         :param identity: the identity object.
         """
         super().__init__(**kwargs)  # pragma: no cover
-        yoti_client_sdk_id = cast(
-            Optional[str], self.configuration.config.get("yoti_client_sdk_id")
+        config = YotiConnectionConfig(self.configuration.config)
+        self._config = config
+        self._warmup_task: Optional[Task] = None
+        self._draining = False
+        self._metrics = YotiMetrics()
+        members: List[PooledClient] = []
+        for client_config in config.clients:
+            client: BaseYotiClient
+            if config.client_mode == CLIENT_MODE_ASYNC:
+                client = AsyncYotiClient(
+                    client_config.sdk_id,
+                    client_config.key_file_path,
+                    api_url=client_config.api_url,
+                    crypto_processes=config.crypto_processes,
+                    crypto_queue_size=config.max_queue_size,
+                    metrics=self._metrics,
+                    pool_size=config.http_pool_size
+                    if config.http_pool_size is not None
+                    else DEFAULT_ASYNC_HTTP_POOL_SIZE,
+                    keepalive_timeout=config.http_keepalive_timeout,
+                    dns_cache_ttl=config.dns_cache_ttl,
+                )
+            else:
+                client = SdkYotiClient(
+                    client_config.sdk_id,
+                    client_config.key_file_path,
+                    request_timeout=config.request_timeout,
+                    api_url=client_config.api_url,
+                    metrics=self._metrics,
+                    pool_size=config.http_pool_size
+                    if config.http_pool_size is not None
+                    else config.max_workers,
+                )
+            members.append(
+                PooledClient(
+                    name=client_config.name,
+                    client=client,
+                    circuit_breaker=CircuitBreaker(
+                        failure_threshold=config.circuit_failure_threshold,
+                        reset_timeout=config.circuit_reset_timeout,
+                        half_open_max_calls=config.circuit_half_open_max_calls,
+                    ),
+                    rate_limiter=TokenBucket(
+                        rate=client_config.rate_limit,
+                        burst=client_config.rate_limit_burst,
+                    )
+                    if client_config.rate_limit is not None
+                    else None,
+                    scenarios=client_config.scenarios,
+                )
+            )
+        self._clients = YotiClientPool(members)
+        self._retry_policy = RetryPolicy(
+            max_attempts=config.retry_max_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+        )
+        self._blob_store = (
+            BlobStore(config.blob_store_path)
+            if config.blob_store_path is not None
+            else None
         )
-        yoti_key_file_path = cast(
-            Optional[str], self.configuration.config.get("yoti_key_file_path")
+        self._prune_task: Optional[Task] = None
+        self._metrics_server = (
+            MetricsServer(
+                self._metrics.registry, config.metrics_host, config.metrics_port
+            )
+            if config.metrics_port is not None
+            else None
         )
-        if yoti_client_sdk_id is None or yoti_key_file_path is None:
-            raise ValueError("Missing configuration.")
-        self._client = YotiClient(yoti_client_sdk_id, yoti_key_file_path)
+        self._executor: Optional[BoundedThreadPoolExecutor] = None
         self._dispatcher: Optional[YotiRequestDispatcher] = None
-        self._event_new_receiving_task: Optional[asyncio.Event] = None
+        self._done_tasks: Optional[asyncio.Queue] = None
 
-        self.receiving_tasks: List[asyncio.Future] = []
+        self.receiving_tasks: Set[asyncio.Future] = set()
         self.task_to_request: Dict[asyncio.Future, Envelope] = {}
-        self.done_tasks: Deque[asyncio.Future] = deque()
+        # when a task was sent, then when its reply was ready
+        self._task_times: Dict[asyncio.Future, float] = {}
 
     @property
-    def event_new_receiving_task(self) -> asyncio.Event:
-        """Get the event to notify the 'receive' method of new receiving tasks."""
-        if self._event_new_receiving_task is None:
+    def executor(self) -> BoundedThreadPoolExecutor:
+        """Get the worker pool running the Yoti SDK calls."""
+        if self._executor is None:
             raise ValueError("Call connect first!")
-        return self._event_new_receiving_task
+        return self._executor
+
+    @property
+    def done_tasks(self) -> asyncio.Queue:
+        """Get the queue of receiving tasks, in order of completion."""
+        if self._done_tasks is None:
+            raise ValueError("Call connect first!")
+        return self._done_tasks
+
+    @property
+    def clients(self) -> YotiClientPool:
+        """Get the pool of Yoti clients, with their circuit breakers and rate limiters."""
+        return self._clients
+
+    @property
+    def metrics(self) -> YotiMetrics:
+        """Get the metrics of the connection."""
+        return self._metrics
+
+    @property
+    def metrics_server(self) -> Optional[MetricsServer]:
+        """Get the server of the metrics, if metrics_port is set."""
+        return self._metrics_server
+
+    @property
+    def blob_store(self) -> Optional[BlobStore]:
+        """Get the store of the large binary attributes, if any."""
+        return self._blob_store
+
+    @property
+    def pending_requests(self) -> int:
+        """Get the number of requests in progress or waiting to be received."""
+        queued = self._done_tasks.qsize() if self._done_tasks is not None else 0
+        return len(self.receiving_tasks) + queued
+
+    @property
+    def is_draining(self) -> bool:
+        """Check whether the connection refuses new requests to drain the ones in progress."""
+        return self._draining
+
+    @property
+    def open_dialogues(self) -> int:
+        """Get the number of dialogues the connection keeps track of."""
+        if self._dispatcher is None:
+            return 0
+        return self._dispatcher.dialogues.open_dialogues
 
     async def connect(self) -> None:
         """
@@ -283,16 +956,139 @@ class YotiConnection(Connection):
         if self.is_connected:  # pragma: nocover
             return
         self._state.set(ConnectionStates.connecting)
+        self._executor = BoundedThreadPoolExecutor(
+            max_workers=self._config.max_workers,
+            max_queue_size=self._config.max_queue_size,
+            thread_name_prefix=self._config.thread_name_prefix,
+        )
+        await self._clients.connect(self._executor)
+        if self._blob_store is not None:
+            self._prune_task = self.loop.create_task(self._prune_blobs())
         self._dispatcher = YotiRequestDispatcher(
-            self._client, self.logger, self._state, loop=self.loop,
+            self._clients,
+            self.logger,
+            self._state,
+            loop=self.loop,
+            request_timeout=self._config.request_timeout,
+            token_cache_ttl=self._config.token_cache_ttl,
+            token_cache_size=self._config.token_cache_size,
+            retry_policy=self._retry_policy,
+            stateless_dialogues=self._config.stateless_dialogues,
+            extractors=ExtractorRegistry(self._config.allowed_dotted_paths),
+            max_batch_size=self._config.max_batch_size,
+            batch_concurrency=self._config.batch_concurrency,
+            metrics=self._metrics,
+            blob_store=self._blob_store,
+            blob_min_size=self._config.blob_min_size,
+            executor=self._executor,
+            compression_min_size=self._config.compression_min_size,
         )
-        self._event_new_receiving_task = asyncio.Event(loop=self.loop)
+        self._done_tasks = asyncio.Queue()
+        self._set_gauge_functions()
+        if self._metrics_server is not None:
+            self._metrics_server.start()
+        if self._config.warmup_connections > 0:
+            self._warmup_task = self.loop.create_task(self._warmup())
         self._state.set(ConnectionStates.connected)
 
+    async def _warmup(self) -> None:
+        """
+        Open connections to the Yoti API in the background.
+
+        The first requests then skip the connection set up and TLS handshake.
+        A failed warm up is only logged: the requests open their own
+        connections as usual.
+
+        :return: None
+        """
+        try:
+            warmed_up = await asyncio.wait_for(
+                self._clients.warmup(self._config.warmup_connections),
+                timeout=self._config.request_timeout
+                if self._config.request_timeout is not None
+                else DEFAULT_WARMUP_TIMEOUT,
+            )
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(f"Could not warm up the Yoti API connections: {e!r}")
+            return
+        warmup_connections = self._config.warmup_connections * len(self._clients)
+        self.logger.debug(
+            f"Warmed up {warmed_up}/{warmup_connections} Yoti API connections."
+        )
+
+    async def _prune_blobs(self) -> None:
+        """
+        Prune the blob store now and then every 'blob_prune_interval' seconds.
+
+        A failed pruning is only logged and retried at the next interval.
+
+        :return: None
+        """
+        blob_store = cast(BlobStore, self._blob_store)
+        while True:
+            try:
+                pruned = await self.loop.run_in_executor(
+                    self._executor, blob_store.prune, self._config.blob_max_age
+                )
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.warning(f"Could not prune the blob store: {e!r}")
+            else:
+                self.logger.debug(
+                    f"Pruned {pruned} blobs older than {self._config.blob_max_age}s."
+                )
+            if self._config.blob_prune_interval is None:
+                return
+            await asyncio.sleep(self._config.blob_prune_interval)
+
+    async def drain(self, timeout: Optional[float] = None) -> int:
+        """
+        Stop admitting requests and wait for the ones in progress to finish.
+
+        From then on, new requests are answered straight away with an error
+        message with error code 503. The replies of the requests finishing in
+        time are received as usual, so call this before stopping the agent,
+        while its multiplexer still receives from the connection.
+
+        Call 'resume' to admit requests again.
+
+        :param timeout: the number of seconds to wait, None for 'drain_timeout'.
+        :return: the number of requests still in progress.
+        """
+        self._draining = True
+        timeout = timeout if timeout is not None else self._config.drain_timeout
+        in_progress = list(self.receiving_tasks)
+        if len(in_progress) > 0 and timeout > 0:
+            self.logger.info(
+                "Draining {} Yoti requests for at most {} seconds.".format(
+                    len(in_progress), timeout
+                )
+            )
+            await asyncio.wait(in_progress, timeout=timeout)
+        return len(self.receiving_tasks)
+
+    def resume(self) -> None:
+        """
+        Admit requests again after a drain.
+
+        :return: None
+        """
+        self._draining = False
+
     async def disconnect(self) -> None:
         """
         Tear down the connection.
 
+        The requests in progress are first given 'drain_timeout' seconds to
+        finish, the request timeout by default, so that their Yoti API calls
+        are not cut short. The multiplexer no longer receives their replies
+        by then, so call 'drain' beforehand to deliver them. Those still in
+        progress are then cancelled. The replies which were not
+        received are dropped and logged.
+
         In the implementation, remember to update 'connection_status' accordingly.
         """
         if self.is_disconnected:  # pragma: nocover
@@ -300,14 +1096,79 @@ class YotiConnection(Connection):
 
         self._state.set(ConnectionStates.disconnecting)
 
-        for task in self.receiving_tasks:
+        in_progress = await self.drain()
+        not_received = self._done_tasks.qsize() if self._done_tasks is not None else 0
+        if in_progress > 0 or not_received > 0:
+            self.logger.warning(
+                "Disconnecting with {} Yoti requests in progress and {} replies not "
+                "received, dropping the dialogues: {}".format(
+                    in_progress,
+                    not_received,
+                    ", ".join(
+                        str(cast(YotiMessage, envelope.message).dialogue_reference)
+                        for envelope in self.task_to_request.values()
+                    ),
+                )
+            )
+        for task in list(self.receiving_tasks):
             if not task.cancelled():  # pragma: nocover
                 task.cancel()
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        if self._prune_task is not None:
+            self._prune_task.cancel()
+            self._prune_task = None
+        await self._clients.disconnect()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self._dispatcher = None
-        self._event_new_receiving_task = None
+        self._done_tasks = None
+        self.task_to_request.clear()
+        self._task_times.clear()
+        for gauge in self._metrics.gauges:
+            gauge.set_function(lambda: 0)
+        if self._metrics_server is not None:
+            self._metrics_server.stop()
+        self._draining = False
 
         self._state.set(ConnectionStates.disconnected)
 
+    def _set_gauge_functions(self) -> None:
+        """
+        Read the gauges of the connection from its state.
+
+        The gauges are reset to 0 on disconnect.
+        """
+        executor = self.executor
+        circuit_states = {
+            CircuitBreaker.State.CLOSED: 0,
+            CircuitBreaker.State.HALF_OPEN: 1,
+            CircuitBreaker.State.OPEN: 2,
+        }
+        metrics = self._metrics
+        metrics.in_flight_requests.set_function(lambda: len(self.receiving_tasks))
+        metrics.queued_replies.set_function(
+            lambda: self._done_tasks.qsize() if self._done_tasks is not None else 0
+        )
+        metrics.active_workers.set_function(lambda: executor.active)
+        metrics.queued_tasks.set_function(lambda: executor.queued)
+        members = self._clients.members
+        metrics.rate_limiter_waiting.set_function(
+            lambda: sum(
+                member.rate_limiter.waiting
+                for member in members
+                if member.rate_limiter is not None
+            )
+        )
+        metrics.circuit_state.set_function(
+            lambda: max(
+                circuit_states[member.circuit_breaker.state] for member in members
+            )
+        )
+        metrics.open_dialogues.set_function(lambda: self.open_dialogues)
+
     async def send(self, envelope: "Envelope") -> None:
         """
         Send an envelope.
@@ -315,10 +1176,26 @@ class YotiConnection(Connection):
         :param envelope: the envelope to send.
         :return: None
         """
-        task = self._schedule_request(envelope)
-        self.receiving_tasks.append(task)
+        sent_at = time.perf_counter()
+        if self._draining:
+            task = self._reject_request(
+                envelope,
+                ERROR_CODE_UNAVAILABLE,
+                "Yoti connection is shutting down, try again later.",
+            )
+        elif self.pending_requests >= self._config.max_pending_requests:
+            self.logger.debug(
+                "Rejecting request, {} requests pending.".format(self.pending_requests)
+            )
+            task = self._reject_request(
+                envelope, ERROR_CODE_BUSY, "Yoti connection is busy, try again later."
+            )
+        else:
+            task = self._schedule_request(envelope)
+        self.receiving_tasks.add(task)
         self.task_to_request[task] = envelope
-        self.event_new_receiving_task.set()
+        self._task_times[task] = sent_at
+        task.add_done_callback(self._on_task_done)
 
     async def receive(self, *args, **kwargs) -> Optional["Envelope"]:
         """
@@ -326,26 +1203,7 @@ class YotiConnection(Connection):
 
         :return: the envelope received, or None.
         """
-        # if there are done tasks, return the result
-        if len(self.done_tasks) > 0:  # pragma: nocover
-            done_task = self.done_tasks.pop()
-            return self._handle_done_task(done_task)
-
-        if len(self.receiving_tasks) == 0:
-            self.event_new_receiving_task.clear()
-            await self.event_new_receiving_task.wait()
-
-        # wait for completion of at least one receiving task
-        done, _ = await asyncio.wait(
-            self.receiving_tasks, return_when=asyncio.FIRST_COMPLETED
-        )
-
-        # pick one done task
-        done_task = done.pop()
-
-        # update done tasks
-        self.done_tasks.extend([*done])
-
+        done_task = await self.done_tasks.get()
         return self._handle_done_task(done_task)
 
     def _schedule_request(self, envelope: Envelope) -> Task:
@@ -360,6 +1218,83 @@ class YotiConnection(Connection):
         task = self._dispatcher.dispatch(envelope)
         return task
 
+    def _reject_request(
+        self, envelope: Envelope, error_code: int, error_msg: str
+    ) -> Task:
+        """
+        Answer a request with an error without scheduling it.
+
+        :param envelope: the message.
+        :param error_code: the error code.
+        :param error_msg: the error message.
+        :return: the done task.
+        """
+        if self._dispatcher is None:  # pragma: nocover
+            raise ValueError("No dispatcher set.")
+        return self._dispatcher.reject(envelope, error_code, error_msg)
+
+    def _on_task_done(self, task: asyncio.Future) -> None:
+        """
+        Queue a receiving task once it is done.
+
+        A task which failed is replaced by an error reply to its request, so
+        that the request is answered and 'receive' only gets replies.
+
+        :param task: the done task.
+        :return: None
+        """
+        self.receiving_tasks.discard(task)
+        sent_at = self._task_times.pop(task, None)
+        request = self.task_to_request.pop(task, None)
+        if task.cancelled() or self._done_tasks is None or request is None:
+            return
+        error = task.exception()
+        if error is not None:
+            self.logger.error("Yoti request failed: {!r}".format(error), exc_info=error)
+            failed = (
+                self._dispatcher.fail(request, error)
+                if self._dispatcher is not None
+                else None
+            )
+            if failed is None:
+                self._metrics.errors.labels(str(ERROR_CODE_INTERNAL)).inc()
+                return
+            task = failed
+        now = time.perf_counter()
+        self._record_reply(request, task.result(), sent_at, now)
+        self.task_to_request[task] = request
+        self._task_times[task] = now
+        self._done_tasks.put_nowait(task)
+
+    def _record_reply(
+        self,
+        request: Envelope,
+        response: Optional[Message],
+        sent_at: Optional[float],
+        now: float,
+    ) -> None:
+        """
+        Record the duration and errors of a request whose reply is ready.
+
+        :param request: the request envelope.
+        :param response: the response message.
+        :param sent_at: when the request was sent.
+        :param now: when the reply was ready.
+        :return: None
+        """
+        if sent_at is not None and isinstance(request.message, YotiMessage):
+            self._metrics.request_duration.labels(
+                request.message.performative.value
+            ).observe(now - sent_at)
+        if not isinstance(response, YotiMessage):
+            return
+        if response.performative == YotiMessage.Performative.ERROR:
+            self._metrics.errors.labels(str(response.error_code)).inc()
+        elif response.performative == YotiMessage.Performative.PROFILES:
+            for result in response.results:
+                if result.error_code is not None:
+                    self._metrics.errors.labels(str(result.error_code)).inc()
+
     def _handle_done_task(self, task: asyncio.Future) -> Optional[Envelope]:
         """
         Process a done receiving task.
@@ -368,8 +1303,10 @@ class YotiConnection(Connection):
         :return: the reponse envelope.
         """
         request = self.task_to_request.pop(task)
-        self.receiving_tasks.remove(task)
         response_message: Optional[Message] = task.result()
+        done_at = self._task_times.pop(task, None)
+        if done_at is not None:
+            self._metrics.observe_stage(STAGE_DELIVERY, time.perf_counter() - done_at)
 
         response_envelope = None
         if response_message is not None:
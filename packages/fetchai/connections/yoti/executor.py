@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the bounded worker pool of the yoti connection."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class WorkerPoolFullError(Exception):
+    """Exception raised when the worker pool cannot accept more work."""
+
+
+class BoundedThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    A thread pool executor with a bounded work queue.
+
+    At most 'max_workers' calls run at the same time and at most
+    'max_queue_size' further calls wait for a free worker. Submitting
+    beyond that raises a WorkerPoolFullError instead of queueing.
+    """
+
+    def __init__(
+        self, max_workers: int, max_queue_size: int, thread_name_prefix: str = ""
+    ) -> None:
+        """
+        Initialize the executor.
+
+        :param max_workers: the number of worker threads.
+        :param max_queue_size: the number of calls which can wait for a worker.
+        :param thread_name_prefix: the prefix of the worker thread names.
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0.")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must not be negative.")
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._max_queue_size = max_queue_size
+        self._stats_lock = threading.Lock()
+        self._pending = 0
+        self._active = 0
+
+    @property
+    def max_workers(self) -> int:
+        """Get the number of worker threads."""
+        return self._max_workers  # type: ignore
+
+    @property
+    def max_queue_size(self) -> int:
+        """Get the number of calls which can wait for a worker."""
+        return self._max_queue_size
+
+    @property
+    def capacity(self) -> int:
+        """Get the number of calls the pool accepts at the same time."""
+        return self.max_workers + self.max_queue_size
+
+    @property
+    def active(self) -> int:
+        """Get the number of calls being run by a worker."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """Get the number of calls waiting for a worker."""
+        return self._pending - self._active
+
+    @property
+    def saturation(self) -> float:
+        """Get the fraction of the capacity in use, between 0 and 1."""
+        return self._pending / self.capacity
+
+    def submit(  # pylint: disable=arguments-differ
+        self, fn: Callable, *args: Any, **kwargs: Any
+    ) -> Future:
+        """
+        Submit a call to the pool.
+
+        :param fn: the callable.
+        :param args: the positional arguments.
+        :param kwargs: the keyword arguments.
+        :return: the future of the call.
+        """
+        with self._stats_lock:
+            if self._pending >= self.capacity:
+                raise WorkerPoolFullError(
+                    "Worker pool is full: {} active, {} queued.".format(
+                        self._active, self._pending - self._active
+                    )
+                )
+            self._pending += 1
+        try:
+            future = super().submit(self._run, fn, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _run(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a call on a worker and keep track of the active workers."""
+        with self._stats_lock:
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._active -= 1
+
+    def _release(self) -> None:
+        """Release the slot held by a finished or cancelled call."""
+        with self._stats_lock:
+            self._pending -= 1
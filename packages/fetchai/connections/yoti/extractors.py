@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the profile extractors of the yoti connection."""
+
+import datetime
+import operator
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Collection, Dict, FrozenSet, Optional, Tuple
+
+from yoti_python_sdk import config
+from yoti_python_sdk.document_details import DocumentDetails
+from yoti_python_sdk.image import Image
+from yoti_python_sdk.profile import Profile
+
+from packages.fetchai.protocols.yoti.custom_types import AttributeValue
+
+
+Extractor = Callable[[Profile], Dict[str, AttributeValue]]
+ExtractorKey = Tuple[str, Tuple[str, ...], Optional[Tuple[str, ...]]]
+
+PROFILE_MEMBERS = frozenset(
+    [name for name in dir(Profile) if not name.startswith("_")]
+    + ["attributes", "verifications"]
+)
+
+
+class UnknownDottedPathError(ValueError):
+    """Exception raised when a dotted path is not allowed."""
+
+
+DATE_ATTRIBUTES = frozenset([config.ATTRIBUTE_DATE_OF_BIRTH])
+AGE_VERIFICATION_PREFIXES = (config.ATTRIBUTE_AGE_OVER, config.ATTRIBUTE_AGE_UNDER)
+DOCUMENT_DETAILS_MEMBERS = (
+    "document_type",
+    "issuing_country",
+    "document_number",
+    "expiration_date",
+    "issuing_authority",
+)
+
+
+def to_attribute_value(value: Any) -> AttributeValue:
+    """
+    Convert a value of the Yoti SDK into a value of the 'yoti' protocol.
+
+    Images become their bytes, document details and dictionaries nested
+    structures, and sequences tuples. Values of other unsupported types
+    become their string representation.
+
+    :param value: the value.
+    :return: the typed value.
+    """
+    if isinstance(value, (str, bool, int, float, datetime.date, bytes)):
+        return value
+    if isinstance(value, Image):
+        return value.data
+    if isinstance(value, DocumentDetails):
+        return {
+            name: to_attribute_value(getattr(value, name))
+            for name in DOCUMENT_DETAILS_MEMBERS
+            if getattr(value, name, None) is not None
+        }
+    if isinstance(value, Mapping):
+        return {
+            str(key): to_attribute_value(element)
+            for key, element in value.items()
+            if element is not None
+        }
+    if isinstance(value, (list, tuple)):
+        return tuple(to_attribute_value(element) for element in value)
+    return str(value)
+
+
+def attribute_value(attribute: Any) -> AttributeValue:
+    """
+    Get the typed value of an attribute of a profile.
+
+    The Yoti SDK gives dates of birth and age verifications as strings,
+    which are converted to a date and a boolean.
+
+    :param attribute: the attribute.
+    :return: the value.
+    """
+    value = attribute.value
+    if isinstance(value, str):
+        if attribute.name in DATE_ATTRIBUTES:
+            try:
+                return datetime.date.fromisoformat(value)
+            except ValueError:
+                return value
+        if attribute.name.startswith(AGE_VERIFICATION_PREFIXES) and value in (
+            "true",
+            "false",
+        ):
+            return value == "true"
+        return value
+    return to_attribute_value(value)
+
+
+def extract_all_attributes(profile: Profile) -> Dict[str, AttributeValue]:
+    """
+    Extract the values of all the attributes of a profile.
+
+    :param profile: the profile.
+    :return: the values, by attribute name.
+    """
+    return {key: attribute_value(value) for key, value in profile.attributes.items()}
+
+
+def project_attributes(names: Tuple[str, ...]) -> Extractor:
+    """
+    Build the extraction of some attributes of a profile.
+
+    Attributes the profile does not have are left out.
+
+    :param names: the names of the attributes.
+    :return: the extractor.
+    """
+
+    def extract(profile: Profile) -> Dict[str, AttributeValue]:
+        attributes = profile.attributes
+        return {
+            name: attribute_value(attributes[name])
+            for name in names
+            if name in attributes
+        }
+
+    return extract
+
+
+def describe_attribute(attribute: Any) -> Dict[str, AttributeValue]:
+    """
+    Describe an attribute of a profile.
+
+    :param attribute: the attribute.
+    :return: the name, value, sources and verifiers of the attribute.
+    """
+    return {
+        "name": attribute.name,
+        "value": attribute_value(attribute),
+        "sources": ",".join([source.value for source in attribute.sources]),
+        "verifiers": ",".join([verifier.value for verifier in attribute.verifiers]),
+    }
+
+
+def compile_extractor(
+    dotted_path: str,
+    args: Tuple[str, ...],
+    attributes: Optional[Tuple[str, ...]] = None,
+) -> Extractor:
+    """
+    Compile the extraction of a dotted path from a profile.
+
+    An empty dotted path extracts the attributes named in 'attributes', or
+    all of them if not given. Otherwise the dotted path is looked up on the
+    profile, and called with 'args' if there are any.
+
+    :param dotted_path: the dotted path.
+    :param args: the arguments of the call.
+    :param attributes: the names of the attributes to extract for an empty dotted path.
+    :return: the extractor.
+    """
+    if dotted_path == "":
+        if attributes is not None:
+            return project_attributes(attributes)
+        return extract_all_attributes
+    getter = operator.attrgetter(dotted_path)
+    if len(args) == 0:
+        return lambda profile: describe_attribute(getter(profile))
+    return lambda profile: describe_attribute(getter(profile)(*args))
+
+
+class ExtractorRegistry:
+    """
+    Registry of the compiled extractors.
+
+    Each distinct (dotted path, args, attributes) request is compiled once.
+    Dotted paths are checked when first seen: a path must be in
+    'allowed_dotted_paths' if given, and otherwise start with a public
+    member of the Yoti profile.
+    """
+
+    def __init__(
+        self,
+        allowed_dotted_paths: Optional[Collection[str]] = None,
+        max_size: int = 128,
+    ) -> None:
+        """
+        Initialize the registry.
+
+        :param allowed_dotted_paths: the dotted paths allowed, None to allow the profile members.
+        :param max_size: the maximum number of extractors kept.
+        """
+        self._allowed_dotted_paths: Optional[FrozenSet[str]] = (
+            frozenset(allowed_dotted_paths)
+            if allowed_dotted_paths is not None
+            else None
+        )
+        self._max_size = max_size
+        self._extractors: "OrderedDict[ExtractorKey, Extractor]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of extractors kept."""
+        return len(self._extractors)
+
+    def is_allowed(self, dotted_path: str) -> bool:
+        """
+        Check whether a dotted path is allowed.
+
+        :param dotted_path: the dotted path.
+        :return: whether it is allowed.
+        """
+        if self._allowed_dotted_paths is not None:
+            return dotted_path in self._allowed_dotted_paths
+        if dotted_path == "":
+            return True
+        names = dotted_path.split(".")
+        return names[0] in PROFILE_MEMBERS and all(
+            name.isidentifier() and not name.startswith("_") for name in names
+        )
+
+    def get(
+        self,
+        dotted_path: str,
+        args: Tuple[str, ...],
+        attributes: Optional[Tuple[str, ...]] = None,
+    ) -> Extractor:
+        """
+        Get the extractor of a dotted path and args, compiling it if needed.
+
+        :param dotted_path: the dotted path.
+        :param args: the arguments of the call.
+        :param attributes: the names of the attributes to extract for an empty dotted path.
+        :return: the extractor.
+        :raises UnknownDottedPathError: if the dotted path is not allowed.
+        """
+        key: ExtractorKey = (
+            dotted_path,
+            tuple(args),
+            tuple(attributes) if attributes is not None else None,
+        )
+        extractor = self._extractors.get(key)
+        if extractor is not None:
+            self._extractors.move_to_end(key)
+            return extractor
+        if not self.is_allowed(dotted_path):
+            raise UnknownDottedPathError(
+                "Dotted path not allowed: {!r}.".format(dotted_path)
+            )
+        extractor = compile_extractor(dotted_path, key[1], key[2])
+        self._extractors[key] = extractor
+        if len(self._extractors) > self._max_size:
+            self._extractors.popitem(last=False)
+        return extractor
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the Prometheus metrics of the yoti connection."""
+
+import threading
+from http.server import ThreadingHTTPServer
+from typing import Optional, Tuple
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.exposition import MetricsHandler
+
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+STAGE_RATE_LIMIT = "rate_limit"
+STAGE_QUEUE = "queue"
+STAGE_DECRYPT_TOKEN = "decrypt_token"
+STAGE_YOTI_API = "yoti_api"
+STAGE_DECRYPT_RECEIPT = "decrypt_receipt"
+STAGE_EXTRACTION = "extraction"
+STAGE_DELIVERY = "delivery"
+
+
+class YotiMetrics:
+    """
+    The metrics recorded by the yoti connection.
+
+    Each connection records in its own registry, which it serves itself,
+    so that the metrics of connections of the same process do not mix.
+
+    The duration of a request is split into stages: the wait for the rate
+    limiter, the wait for a worker thread, the token decryption and request
+    signing, the Yoti API round trip, the receipt decryption, the extraction
+    of the profile info and the wait for the agent to receive the reply.
+    """
+
+    def __init__(self, registry: Optional[CollectorRegistry] = None) -> None:
+        """
+        Initialize the metrics.
+
+        :param registry: the registry of the metrics, a new one if None.
+        """
+        self.registry = registry if registry is not None else CollectorRegistry()
+        self.requests = Counter(
+            "yoti_connection_requests",
+            "Requests received by the yoti connection.",
+            ("performative",),
+            registry=self.registry,
+        )
+        self.errors = Counter(
+            "yoti_connection_errors",
+            "Errors returned by the yoti connection, tokens of batches included.",
+            ("code",),
+            registry=self.registry,
+        )
+        self.client_calls = Counter(
+            "yoti_connection_client_calls",
+            "Yoti API calls made by the yoti connection, retries included.",
+            ("client",),
+            registry=self.registry,
+        )
+        self.request_duration = Histogram(
+            "yoti_connection_request_duration_seconds",
+            "Time from receiving a request to its reply being ready.",
+            ("performative",),
+            buckets=DEFAULT_BUCKETS,
+            registry=self.registry,
+        )
+        self.stage_duration = Histogram(
+            "yoti_connection_stage_duration_seconds",
+            "Time spent by requests in each stage.",
+            ("stage",),
+            buckets=DEFAULT_BUCKETS,
+            registry=self.registry,
+        )
+        self.in_flight_requests = Gauge(
+            "yoti_connection_in_flight_requests",
+            "Requests in progress.",
+            registry=self.registry,
+        )
+        self.queued_replies = Gauge(
+            "yoti_connection_queued_replies",
+            "Replies ready and waiting to be received by the agent.",
+            registry=self.registry,
+        )
+        self.active_workers = Gauge(
+            "yoti_connection_active_workers",
+            "Worker threads running a task.",
+            registry=self.registry,
+        )
+        self.queued_tasks = Gauge(
+            "yoti_connection_queued_tasks",
+            "Tasks waiting for a worker thread.",
+            registry=self.registry,
+        )
+        self.rate_limiter_waiting = Gauge(
+            "yoti_connection_rate_limiter_waiting",
+            "Yoti API calls waiting for the rate limiter.",
+            registry=self.registry,
+        )
+        self.circuit_state = Gauge(
+            "yoti_connection_circuit_state",
+            "Worst state of the circuit breakers: 0 closed, 1 half open, 2 open.",
+            registry=self.registry,
+        )
+        self.open_dialogues = Gauge(
+            "yoti_connection_open_dialogues",
+            "Dialogues kept track of by the yoti connection.",
+            registry=self.registry,
+        )
+
+    @property
+    def gauges(self) -> Tuple[Gauge, ...]:
+        """Get the gauges of the connection."""
+        return (
+            self.in_flight_requests,
+            self.queued_replies,
+            self.active_workers,
+            self.queued_tasks,
+            self.rate_limiter_waiting,
+            self.circuit_state,
+            self.open_dialogues,
+        )
+
+    def observe_stage(self, stage: str, duration: float) -> None:
+        """
+        Record the time spent by a request in a stage.
+
+        :param stage: the stage.
+        :param duration: the number of seconds.
+        :return: None
+        """
+        self.stage_duration.labels(stage).observe(duration)
+
+
+class MetricsServer:
+    """HTTP server serving the metrics of a registry in Prometheus text format."""
+
+    def __init__(self, registry: CollectorRegistry, host: str, port: int) -> None:
+        """
+        Initialize the server.
+
+        :param registry: the registry of the metrics.
+        :param host: the address to listen on.
+        :param port: the port to listen on, 0 for any free port.
+        """
+        self._registry = registry
+        self._host = host
+        self._port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """Get the port the server listens on."""
+        if self._server is None:
+            return self._port
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        """
+        Start serving the metrics, on a daemon thread.
+
+        :return: None
+        """
+        server = ThreadingHTTPServer(
+            (self._host, self._port), MetricsHandler.factory(self._registry)
+        )
+        server.daemon_threads = True
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever, name="yoti_metrics", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop serving the metrics.
+
+        :return: None
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
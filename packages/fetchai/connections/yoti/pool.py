@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the pool of Yoti clients of the yoti connection."""
+
+import asyncio
+from concurrent.futures._base import Executor
+from typing import Collection, Dict, FrozenSet, List, Optional, Sequence, cast
+
+from packages.fetchai.connections.yoti.client import BaseYotiClient
+from packages.fetchai.connections.yoti.rate_limiter import TokenBucket
+from packages.fetchai.connections.yoti.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+class UnknownScenarioError(ValueError):
+    """Exception raised when no Yoti client serves the scenario of a request."""
+
+
+class PooledClient:
+    """A Yoti client of the pool, with its own circuit breaker and rate limiter."""
+
+    def __init__(
+        self,
+        name: str,
+        client: BaseYotiClient,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        scenarios: Optional[Collection[str]] = None,
+    ) -> None:
+        """
+        Initialize the pooled client.
+
+        :param name: the name of the client, e.g. the application it calls the Yoti API for.
+        :param client: the Yoti client.
+        :param circuit_breaker: the circuit breaker around the client's calls.
+        :param rate_limiter: the rate limiter of the client's calls, None for no limit.
+        :param scenarios: the scenarios the client serves, None or empty for the requests without a known scenario.
+        """
+        self.name = name
+        self.client = client
+        self.circuit_breaker = (
+            circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        )
+        self.rate_limiter = rate_limiter
+        self.scenarios: FrozenSet[str] = frozenset(
+            scenarios if scenarios is not None else ()
+        )
+        self.outstanding = 0
+
+    def __repr__(self) -> str:
+        """Get the string representation."""
+        return "PooledClient(name={!r}, outstanding={}, circuit={})".format(
+            self.name, self.outstanding, self.circuit_breaker.state
+        )
+
+
+class YotiClientPool:
+    """
+    Pool of Yoti clients, e.g. one per Yoti application.
+
+    A call goes to the client with the fewest calls in progress among the
+    ones serving the scenario of the request, ties taking turns. A request
+    with a scenario no client lists, or without a scenario, is served by
+    the clients listing no scenarios. Clients whose circuit is open are
+    skipped until it lets trial calls through.
+    """
+
+    def __init__(self, members: Sequence[PooledClient]) -> None:
+        """
+        Initialize the pool.
+
+        :param members: the clients of the pool.
+        """
+        if len(members) == 0:
+            raise ValueError("A Yoti client pool needs at least one client.")
+        names = [member.name for member in members]
+        if len(set(names)) != len(names):
+            raise ValueError("Got duplicate Yoti client names: {}.".format(names))
+        self.members = list(members)
+        self._defaults = [member for member in members if not member.scenarios]
+        self._by_scenario: Dict[str, List[PooledClient]] = {}
+        for member in members:
+            for scenario in member.scenarios:
+                self._by_scenario.setdefault(scenario, []).append(member)
+        self._turn = 0
+
+    def __len__(self) -> int:
+        """Get the number of clients."""
+        return len(self.members)
+
+    @property
+    def outstanding(self) -> int:
+        """Get the number of calls in progress."""
+        return sum(member.outstanding for member in self.members)
+
+    def get_candidates(self, scenario: Optional[str] = None) -> List[PooledClient]:
+        """
+        Get the clients which can serve a request.
+
+        :param scenario: the scenario of the request, if known.
+        :return: the clients.
+        :raises UnknownScenarioError: if no client serves the scenario.
+        """
+        candidates = (
+            self._by_scenario.get(scenario) if scenario is not None else None
+        ) or self._defaults
+        if len(candidates) == 0:
+            raise UnknownScenarioError(
+                "No Yoti client for scenario {!r}.".format(scenario)
+            )
+        return candidates
+
+    def acquire(self, scenario: Optional[str] = None) -> PooledClient:
+        """
+        Pick the client making the next call, and count the call as in progress.
+
+        The call must be released with 'release' once done.
+
+        :param scenario: the scenario of the request, if known.
+        :return: the client, whose circuit breaker let the call through.
+        :raises UnknownScenarioError: if no client serves the scenario.
+        :raises CircuitOpenError: if the circuits of all the clients are open.
+        """
+        candidates = self.get_candidates(scenario)
+        self._turn = (self._turn + 1) % len(candidates)
+        rotated = candidates[self._turn :] + candidates[: self._turn]
+        error: Optional[CircuitOpenError] = None
+        for member in sorted(rotated, key=lambda member: member.outstanding):
+            try:
+                member.circuit_breaker.before_call()
+            except CircuitOpenError as e:
+                error = e
+                continue
+            member.outstanding += 1
+            return member
+        raise cast(CircuitOpenError, error)
+
+    @staticmethod
+    def release(member: PooledClient) -> None:
+        """
+        Count a call of a client as done.
+
+        :param member: the client.
+        :return: None
+        """
+        member.outstanding -= 1
+
+    async def connect(self, executor: Optional[Executor] = None) -> None:
+        """
+        Set up the clients.
+
+        :param executor: the executor running the blocking work of the clients.
+        :return: None
+        """
+        await asyncio.gather(
+            *[member.client.connect(executor) for member in self.members]
+        )
+
+    async def disconnect(self) -> None:
+        """
+        Tear down the clients.
+
+        :return: None
+        """
+        await asyncio.gather(
+            *[member.client.disconnect() for member in self.members],
+            return_exceptions=True,
+        )
+
+    async def warmup(self, connections: int) -> int:
+        """
+        Open connections to the Yoti API for each client.
+
+        :param connections: the number of connections to open per client.
+        :return: the number of connections opened.
+        :raises Exception: the failure of the first client, if none succeeded.
+        """
+        results = await asyncio.gather(
+            *[member.client.warmup(connections) for member in self.members],
+            return_exceptions=True,
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if len(failures) == len(results):
+            raise failures[0]
+        return sum(result for result in results if isinstance(result, int))
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the rate limiter of the yoti connection."""
+
+import asyncio
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    The bucket holds at most 'burst' tokens and is refilled at 'rate' tokens
+    per second. Each call takes a token; when the bucket is empty, callers
+    wait on the event loop, in order of arrival, until their token is due.
+    """
+
+    def __init__(
+        self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize the token bucket.
+
+        :param rate: the number of tokens added per second.
+        :param burst: the maximum number of tokens in the bucket.
+        :param clock: the clock measuring the refill.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        if burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._waiting = 0
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Get the number of tokens added per second."""
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        """Get the maximum number of tokens in the bucket."""
+        return self._burst
+
+    @property
+    def waiting(self) -> int:
+        """Get the number of callers waiting for a token."""
+        return self._waiting
+
+    @property
+    def acquired(self) -> int:
+        """Get the number of tokens handed out."""
+        return self._acquired
+
+    @property
+    def delayed(self) -> int:
+        """Get the number of tokens handed out after waiting."""
+        return self._delayed
+
+    @property
+    def total_wait_time(self) -> float:
+        """Get the number of seconds spent waiting for tokens, in total."""
+        return self._total_wait_time
+
+    @property
+    def max_wait_time(self) -> float:
+        """Get the longest number of seconds spent waiting for a token."""
+        return self._max_wait_time
+
+    @property
+    def mean_wait_time(self) -> float:
+        """Get the mean number of seconds spent waiting for a token."""
+        return self._total_wait_time / self._acquired if self._acquired > 0 else 0.0
+
+    async def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available.
+
+        The token is reserved on arrival, so a later caller never overtakes
+        an earlier one; a caller cancelled while waiting gives it back.
+
+        :return: the number of seconds spent waiting.
+        """
+        self._refill()
+        self._tokens -= 1
+        delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            self._waiting += 1
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._tokens += 1
+                raise
+            finally:
+                self._waiting -= 1
+            self._delayed += 1
+        self._acquired += 1
+        self._total_wait_time += delay
+        self._max_wait_time = max(self._max_wait_time, delay)
+        return delay
+
+    def _refill(self) -> None:
+        """Add the tokens due since the last refill."""
+        now = self._clock()
+        self._tokens = min(
+            float(self._burst), self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the retry policy and circuit breaker of the yoti connection."""
+
+import asyncio
+import random
+import time
+from enum import Enum
+from typing import Callable, Optional
+
+import aiohttp
+import requests
+
+from packages.fetchai.connections.yoti.client import YotiApiError
+
+
+class CircuitOpenError(Exception):
+    """Exception raised when a call is refused because the circuit is open."""
+
+
+def get_http_status(exception: BaseException) -> Optional[int]:
+    """
+    Get the HTTP status code of a failed Yoti API call.
+
+    :param exception: the exception.
+    :return: the status code, or None if the exception is not an HTTP error.
+    """
+    if not isinstance(exception, YotiApiError):
+        return None
+    return exception.status_code
+
+
+def is_retryable(exception: BaseException) -> bool:
+    """
+    Check whether a failed Yoti API call is worth retrying.
+
+    Connection failures, timeouts, throttling and server errors are
+    transient; anything else, e.g. a token which cannot be decrypted or
+    has already been used, fails the same way on every attempt.
+
+    :param exception: the exception.
+    :return: whether the call is worth retrying.
+    """
+    if isinstance(
+        exception,
+        (
+            asyncio.TimeoutError,
+            ConnectionError,
+            aiohttp.ClientConnectionError,
+            requests.ConnectionError,
+            requests.Timeout,
+        ),
+    ):
+        return True
+    status = get_http_status(exception)
+    return status is not None and (status == 429 or status >= 500)
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """
+        Initialize the retry policy.
+
+        :param max_attempts: the maximum number of attempts of a call, retries included.
+        :param base_delay: the delay before the first retry is drawn from [0, base_delay].
+        :param max_delay: the cap of the backoff.
+        :param rand: the source of randomness, returning a number in [0, 1).
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rand = rand
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Get the delay before retrying a call.
+
+        :param attempt: the number of attempts made so far, starting at 1.
+        :return: the number of seconds to wait.
+        """
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return backoff * self._rand()
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker around the Yoti API.
+
+    After 'failure_threshold' consecutive failures the circuit opens and
+    calls are refused for 'reset_timeout' seconds. The circuit then lets
+    'half_open_max_calls' trial calls through; it closes when they all
+    succeed and opens again on the first failure.
+    """
+
+    class State(Enum):
+        """The states of the circuit."""
+
+        CLOSED = "closed"
+        OPEN = "open"
+        HALF_OPEN = "half_open"
+
+        def __str__(self):
+            """Get the string representation."""
+            return str(self.value)
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the circuit breaker.
+
+        :param failure_threshold: the number of consecutive failures opening the circuit.
+        :param reset_timeout: the number of seconds the circuit stays open.
+        :param half_open_max_calls: the number of trial calls made once the circuit is half open.
+        :param clock: the clock measuring the reset timeout.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CircuitBreaker.State.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._trial_successes = 0
+
+    @property
+    def state(self) -> "CircuitBreaker.State":
+        """Get the state of the circuit."""
+        if (
+            self._state == CircuitBreaker.State.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = CircuitBreaker.State.HALF_OPEN
+            self._trial_calls = 0
+            self._trial_successes = 0
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Get the number of seconds until the open circuit lets trial calls through."""
+        if self.state != CircuitBreaker.State.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def before_call(self) -> None:
+        """
+        Check that a call can be made.
+
+        :return: None
+        :raises CircuitOpenError: if the call is refused.
+        """
+        state = self.state
+        if state == CircuitBreaker.State.OPEN:
+            raise CircuitOpenError(
+                "Yoti API unavailable, retry in {:.0f} seconds.".format(
+                    self.retry_after
+                )
+            )
+        if state == CircuitBreaker.State.HALF_OPEN:
+            if self._trial_calls >= self.half_open_max_calls:
+                raise CircuitOpenError("Yoti API unavailable, trial calls in progress.")
+            self._trial_calls += 1
+
+    def on_success(self) -> None:
+        """Record a successful call."""
+        if self._state == CircuitBreaker.State.HALF_OPEN:
+            self._trial_successes += 1
+            if self._trial_successes >= self.half_open_max_calls:
+                self._state = CircuitBreaker.State.CLOSED
+        self._failures = 0
+
+    def on_failure(self) -> None:
+        """Record a call which failed because the Yoti API is unhealthy."""
+        if self._state == CircuitBreaker.State.HALF_OPEN:
+            self._open()
+            return
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._open()
+
+    def on_neutral(self) -> None:
+        """Record a call whose outcome says nothing about the health of the Yoti API."""
+        if self._state == CircuitBreaker.State.HALF_OPEN and self._trial_calls > 0:
+            self._trial_calls -= 1
+
+    def _open(self) -> None:
+        """Open the circuit."""
+        self._state = CircuitBreaker.State.OPEN
+        self._opened_at = self._clock()
+        self._failures = 0
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the request coalescing of the yoti connection."""
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class _Flight:
+    """A call in progress and the number of callers waiting for it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future) -> None:
+        """Initialize the flight."""
+        self.future = future
+        self.waiters = 0
+
+
+def _copy_exception(exception: BaseException) -> BaseException:
+    """
+    Copy an exception, without its traceback.
+
+    :param exception: the exception.
+    :return: the copy, or the exception itself if it cannot be copied.
+    """
+    try:
+        copied = copy.copy(exception)
+    except Exception:  # pylint: disable=broad-except
+        copied = exception
+    return copied.with_traceback(None)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one call.
+
+    The outcome of a call, result or exception, is kept for 'ttl' seconds so
+    that later calls for the same key get it without calling again. A kept
+    exception is raised as a copy, so that its traceback does not grow with
+    every later call.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0.0,
+        max_size: int = 0,
+        is_cacheable: Optional[Callable[[BaseException], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the single flight.
+
+        :param ttl: the number of seconds an outcome is kept, 0 to not keep outcomes.
+        :param max_size: the maximum number of outcomes kept.
+        :param is_cacheable: tells whether an exception outcome can be kept.
+        :param clock: the clock measuring the ttl.
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._is_cacheable = is_cacheable
+        self._clock = clock
+        self._in_flight: Dict[str, _Flight] = {}
+        self._outcomes: "OrderedDict[str, Tuple[float, asyncio.Future]]" = OrderedDict()
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of calls in progress."""
+        return len(self._in_flight)
+
+    @property
+    def cached(self) -> int:
+        """Get the number of outcomes kept."""
+        return len(self._outcomes)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Call 'func', unless a call for the same key is in progress or was done recently.
+
+        :param key: the key identifying the call.
+        :param func: the coroutine function making the call.
+        :return: the result of the call.
+        """
+        outcome = self._get_outcome(key)
+        if outcome is not None:
+            exception = outcome.exception()
+            if exception is not None:
+                raise _copy_exception(exception)
+            return outcome.result()
+
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(func()))
+            self._in_flight[key] = flight
+            flight.future.add_done_callback(lambda future: self._on_done(key, future))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.future)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.future.done():
+                flight.future.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _get_outcome(self, key: str) -> Optional[asyncio.Future]:
+        """Get the kept outcome for a key, if it has not expired."""
+        entry = self._outcomes.get(key)
+        if entry is None:
+            return None
+        expires_at, outcome = entry
+        if expires_at <= self._clock():
+            del self._outcomes[key]
+            return None
+        return outcome
+
+    def _on_done(self, key: str, future: asyncio.Future) -> None:
+        """Remove a finished call from the calls in progress and keep its outcome."""
+        self._in_flight.pop(key, None)
+        if future.cancelled() or self._ttl <= 0 or self._max_size <= 0:
+            return
+        exception = future.exception()
+        if (
+            exception is not None
+            and self._is_cacheable is not None
+            and not self._is_cacheable(exception)
+        ):
+            return
+
+        now = self._clock()
+        while self._outcomes:
+            oldest_key, (expires_at, _) = next(iter(self._outcomes.items()))
+            if expires_at > now and len(self._outcomes) < self._max_size:
+                break
+            del self._outcomes[oldest_key]
+        self._outcomes.pop(key, None)
+        self._outcomes[key] = (now + self._ttl, future)
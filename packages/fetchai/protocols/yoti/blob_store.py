@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the blob store keeping large binary attributes out of the yoti messages."""
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Set
+
+from packages.fetchai.protocols.yoti.custom_types import (
+    AttributeValue,
+    BlobRef,
+    DEFAULT_MEDIA_TYPE,
+)
+
+
+MEDIA_TYPE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+)
+
+# the directory of the pins, by holder, in the store
+PINS_DIRECTORY = "pins"
+
+_DIGEST_PATTERN = re.compile("^[0-9a-f]{64}$")
+
+
+class BlobNotFoundError(KeyError):
+    """The blob store does not have the content of a reference."""
+
+
+def _check_digest(digest: str) -> None:
+    """
+    Check that a digest is a hex encoded SHA-256 digest, so that it names a file of the store.
+
+    :param digest: the digest.
+    :return: None
+    :raises ValueError: if it is not.
+    """
+    if _DIGEST_PATTERN.match(digest) is None:
+        raise ValueError("Invalid blob digest: {!r}.".format(digest))
+
+
+def guess_media_type(data: bytes) -> str:
+    """
+    Guess the media type of binary data from its signature.
+
+    :param data: the data.
+    :return: the media type, 'application/octet-stream' if not recognised.
+    """
+    for signature, media_type in MEDIA_TYPE_SIGNATURES:
+        if data.startswith(signature):
+            return media_type
+    return DEFAULT_MEDIA_TYPE
+
+
+class BlobStore:
+    """
+    A content-addressed store of binary values on the local file system.
+
+    A value is kept in a file named after the SHA-256 digest of its content,
+    so storing the same selfie twice writes it once. The files are written
+    to a temporary file first and renamed, so a reader sees a whole value or
+    none.
+
+    The yoti connection owns the store: it is the only one configured with
+    its directory, writes the values and prunes the old ones. The references
+    it sends carry the directory, so the skills of the agent open the store
+    from them, to read the values and to pin the ones they keep referencing.
+    Pinned values are never pruned.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the blob store.
+
+        :param path: the directory of the store, created if missing.
+        """
+        self._path = os.path.abspath(path)
+        os.makedirs(self._path, exist_ok=True)
+
+    @property
+    def path(self) -> str:
+        """Get the directory of the store."""
+        return self._path
+
+    @classmethod
+    def of(cls, blob_ref: BlobRef) -> "BlobStore":
+        """
+        Open the store of a reference.
+
+        :param blob_ref: the reference.
+        :return: the store.
+        :raises BlobNotFoundError: if the reference has no store.
+        """
+        if blob_ref.store == "":
+            raise BlobNotFoundError(blob_ref.digest)
+        return cls(blob_ref.store)
+
+    def _get_path(self, digest: str) -> str:
+        """
+        Get the path of the file of a value.
+
+        :param digest: the SHA-256 digest of the value, hex encoded.
+        :return: the path.
+        """
+        _check_digest(digest)
+        return os.path.join(self._path, digest[:2], digest)
+
+    def put(self, data: bytes, media_type: Optional[str] = None) -> BlobRef:
+        """
+        Store a value.
+
+        :param data: the value.
+        :param media_type: the media type of the value, guessed if None.
+        :return: the reference to the value.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._get_path(digest)
+        if os.path.exists(path):
+            # refresh the age of the value, for prune
+            os.utime(path)
+        else:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+            try:
+                with os.fdopen(file_descriptor, "wb") as file:
+                    file.write(data)
+                os.replace(temporary_path, path)
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+        return BlobRef(
+            digest,
+            len(data),
+            media_type if media_type is not None else guess_media_type(data),
+            self._path,
+        )
+
+    def get(self, blob_ref: BlobRef) -> bytes:
+        """
+        Get the value of a reference.
+
+        :param blob_ref: the reference.
+        :return: the value.
+        """
+        try:
+            with open(self._get_path(blob_ref.digest), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            raise BlobNotFoundError(blob_ref.digest)
+        if len(data) != blob_ref.size:
+            raise BlobNotFoundError(blob_ref.digest)
+        return data
+
+    def __contains__(self, blob_ref: Any) -> bool:
+        """Check whether the store has the value of a reference."""
+        return isinstance(blob_ref, BlobRef) and os.path.exists(
+            self._get_path(blob_ref.digest)
+        )
+
+    def prune(self, max_age: float) -> int:
+        """
+        Remove the values stored, or stored again, more than 'max_age' seconds ago.
+
+        :param max_age: the number of seconds a value is kept.
+        :return: the number of values removed.
+        """
+        pinned = self.pinned()
+        oldest = time.time() - max_age
+        removed = 0
+        for directory, directory_names, file_names in os.walk(self._path):
+            if directory == self._path and PINS_DIRECTORY in directory_names:
+                directory_names.remove(PINS_DIRECTORY)
+            for file_name in file_names:
+                if file_name in pinned:
+                    continue
+                path = os.path.join(directory, file_name)
+                try:
+                    if os.path.getmtime(path) < oldest:
+                        os.unlink(path)
+                        removed += 1
+                except FileNotFoundError:  # pragma: nocover
+                    continue
+        return removed
+
+    def _get_pins_path(self, holder: str) -> str:
+        """
+        Get the directory of the pins of a holder.
+
+        :param holder: the holder of the pins.
+        :return: the path.
+        """
+        return os.path.join(
+            self._path,
+            PINS_DIRECTORY,
+            hashlib.sha256(holder.encode("utf-8")).hexdigest(),
+        )
+
+    def pin(self, blob_ref: BlobRef, holder: str) -> None:
+        """
+        Pin a value, so that it is not pruned until its holder unpins it.
+
+        The pins are kept in the directory of the store, so that they hold
+        across the processes sharing it. A holder pins a value once, however
+        many times it references it.
+
+        :param blob_ref: the reference to the value.
+        :param holder: the holder of the pin, e.g. the skill keeping the reference.
+        :return: None
+        """
+        _check_digest(blob_ref.digest)
+        directory = self._get_pins_path(holder)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, blob_ref.digest), "ab"):
+            pass
+
+    def unpin(self, blob_ref: BlobRef, holder: str) -> None:
+        """
+        Unpin a value.
+
+        :param blob_ref: the reference to the value.
+        :param holder: the holder of the pin.
+        :return: None
+        """
+        _check_digest(blob_ref.digest)
+        try:
+            os.unlink(os.path.join(self._get_pins_path(holder), blob_ref.digest))
+        except FileNotFoundError:
+            pass
+
+    def release(self, holder: str) -> None:
+        """
+        Unpin all the values of a holder, e.g. left by a previous run of it.
+
+        :param holder: the holder of the pins.
+        :return: None
+        """
+        shutil.rmtree(self._get_pins_path(holder), ignore_errors=True)
+
+    def pinned(self) -> Set[str]:
+        """
+        Get the digests of the values pinned, by any holder.
+
+        :return: the digests.
+        """
+        digests: Set[str] = set()
+        try:
+            holders = os.listdir(os.path.join(self._path, PINS_DIRECTORY))
+        except FileNotFoundError:
+            return digests
+        for holder in holders:
+            try:
+                digests.update(
+                    os.listdir(os.path.join(self._path, PINS_DIRECTORY, holder))
+                )
+            except FileNotFoundError:  # pragma: nocover
+                continue
+        return digests
+
+
+def iter_blob_refs(value: Any) -> Iterator[BlobRef]:
+    """
+    Iterate over the references of an attribute value, or of attribute values by name.
+
+    :param value: the attribute value, or the values.
+    :return: the references, in nested structures and lists too.
+    """
+    if isinstance(value, BlobRef):
+        yield value
+    elif isinstance(value, Mapping):
+        for element in value.values():
+            yield from iter_blob_refs(element)
+    elif isinstance(value, tuple):
+        for element in value:
+            yield from iter_blob_refs(element)
+
+
+def has_large_binary(value: AttributeValue, min_size: int) -> bool:
+    """
+    Check whether an attribute value has binary data of at least 'min_size' bytes.
+
+    :param value: the attribute value.
+    :param min_size: the minimum size, in bytes.
+    :return: whether the value has large binary data.
+    """
+    if isinstance(value, bytes):
+        return len(value) >= min_size
+    if isinstance(value, Mapping):
+        return any(has_large_binary(element, min_size) for element in value.values())
+    if isinstance(value, tuple):
+        return any(has_large_binary(element, min_size) for element in value)
+    return False
+
+
+def offload(
+    values: Dict[str, AttributeValue], blob_store: BlobStore, min_size: int
+) -> Dict[str, AttributeValue]:
+    """
+    Replace the binary data of at least 'min_size' bytes by references into a blob store.
+
+    Binary data in nested structures and lists is replaced too.
+
+    :param values: the attribute values.
+    :param blob_store: the blob store.
+    :param min_size: the minimum size, in bytes, of the binary data replaced.
+    :return: the attribute values, with references for the binary data replaced.
+    """
+    return {key: _offload(value, blob_store, min_size) for key, value in values.items()}
+
+
+def _offload(value: AttributeValue, blob_store: BlobStore, min_size: int) -> Any:
+    """Replace the large binary data of an attribute value by references into a blob store."""
+    if isinstance(value, bytes):
+        return blob_store.put(value) if len(value) >= min_size else value
+    if isinstance(value, Mapping):
+        return {
+            key: _offload(element, blob_store, min_size)
+            for key, element in value.items()
+        }
+    if isinstance(value, tuple):
+        return tuple(_offload(element, blob_store, min_size) for element in value)
+    return value
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2020 fetchai
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the compression of the content of encoded yoti messages."""
+
+import zlib
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: nocover
+    zstandard = None
+
+
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_ZSTD = "zstd"
+
+# no protobuf field has number 0, so an uncompressed content never starts with it
+COMPRESSED_FLAG = b"\x00"
+HEADER_SIZE = 2
+
+DEFAULT_MIN_SIZE = 16384
+MAX_DECOMPRESSED_SIZE = 64 * 1024 * 1024
+ZLIB_LEVEL = 1
+ZSTD_LEVEL = 3
+# zlib is probed on samples of the content before compressing all of it
+PROBE_SAMPLES = 4
+PROBE_SAMPLE_SIZE = 1024
+PROBE_MIN_SAVING = 0.1
+
+
+class Codec:
+    """A compression algorithm and its identifier in the encoded messages."""
+
+    __slots__ = ("name", "identifier", "compress", "decompress", "probe")
+
+    def __init__(
+        self,
+        name: str,
+        identifier: int,
+        compress: Callable[[bytes], bytes],
+        decompress: Callable[[bytes], bytes],
+        probe: bool = False,
+    ) -> None:
+        """
+        Initialize the codec.
+
+        :param name: the name of the codec, as negotiated in the requests.
+        :param identifier: the identifier of the codec in the encoded messages.
+        :param compress: compresses data.
+        :param decompress: decompresses data, at most MAX_DECOMPRESSED_SIZE bytes.
+        :param probe: whether to check that samples of the data compress first.
+        """
+        self.name = name
+        self.identifier = identifier
+        self.compress = compress
+        self.decompress = decompress
+        self.probe = probe
+
+
+def _zlib_decompress(data: bytes) -> bytes:
+    """Decompress zlib data, at most MAX_DECOMPRESSED_SIZE bytes."""
+    decompressor = zlib.decompressobj()
+    decompressed = decompressor.decompress(data, MAX_DECOMPRESSED_SIZE)
+    if decompressor.unconsumed_tail:
+        raise ValueError(
+            "Decompressed content over {} bytes.".format(MAX_DECOMPRESSED_SIZE)
+        )
+    return decompressed
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    """Compress data with zstd."""
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    """Decompress zstd data, at most MAX_DECOMPRESSED_SIZE bytes."""
+    if zstandard.frame_content_size(data) > MAX_DECOMPRESSED_SIZE:
+        raise ValueError(
+            "Decompressed content over {} bytes.".format(MAX_DECOMPRESSED_SIZE)
+        )
+    return zstandard.ZstdDecompressor().decompress(
+        data, max_output_size=MAX_DECOMPRESSED_SIZE
+    )
+
+
+_ZLIB_CODEC = Codec(
+    COMPRESSION_ZLIB,
+    1,
+    lambda data: zlib.compress(data, ZLIB_LEVEL),
+    _zlib_decompress,
+    probe=True,
+)
+# by order of preference
+CODECS: Tuple[Codec, ...] = (
+    (Codec(COMPRESSION_ZSTD, 2, _zstd_compress, _zstd_decompress), _ZLIB_CODEC)
+    if zstandard is not None
+    else (_ZLIB_CODEC,)
+)
+_CODECS_BY_NAME: Dict[str, Codec] = {codec.name: codec for codec in CODECS}
+_CODECS_BY_IDENTIFIER: Dict[int, Codec] = {codec.identifier: codec for codec in CODECS}
+
+
+def is_compressible(content: bytes) -> bool:
+    """
+    Check whether samples spread over the content compress.
+
+    Images, which are compressed already, make up most of the bytes of the
+    profiles with a selfie or document images. zlib takes milliseconds to
+    find out they do not compress, zstd detects it on its own.
+
+    :param content: the content, at least PROBE_SAMPLES * PROBE_SAMPLE_SIZE bytes.
+    :return: whether the samples get PROBE_MIN_SAVING smaller.
+    """
+    step = len(content) // PROBE_SAMPLES
+    sample = b"".join(
+        content[offset : offset + PROBE_SAMPLE_SIZE]
+        for offset in range(step // 2, len(content), step)
+    )
+    return len(zlib.compress(sample, 1)) < len(sample) * (1 - PROBE_MIN_SAVING)
+
+
+def available_compressions() -> Tuple[str, ...]:
+    """
+    Get the compressions this process can encode and decode, by order of preference.
+
+    zstd is only available if the 'zstandard' package is installed.
+
+    :return: the names of the compressions.
+    """
+    return tuple(codec.name for codec in CODECS)
+
+
+def choose_compression(accepted: Optional[Sequence[str]]) -> Optional[str]:
+    """
+    Choose the compression of a reply, among the ones its recipient accepts.
+
+    :param accepted: the compressions the recipient accepts, by order of preference.
+    :return: the first one available, None if none is.
+    """
+    if accepted is None:
+        return None
+    for name in accepted:
+        if name in _CODECS_BY_NAME:
+            return name
+    return None
+
+
+def compress(content: bytes, compression: str, min_size: int) -> bytes:
+    """
+    Compress the content of an encoded message, if it is worth it.
+
+    Content under 'min_size' bytes, content which would not get smaller,
+    like images, and content for a compression not available are left
+    uncompressed: recipients accepting a compression accept no compression.
+
+    :param content: the content.
+    :param compression: the name of the compression.
+    :param min_size: the minimum size, in bytes, of the content compressed.
+    :return: the content, compressed and flagged or as is.
+    """
+    if len(content) < min_size:
+        return content
+    codec = _CODECS_BY_NAME.get(compression)
+    if codec is None:
+        return content
+    if (
+        codec.probe
+        and len(content) >= PROBE_SAMPLES * PROBE_SAMPLE_SIZE * 2
+        and not is_compressible(content)
+    ):
+        return content
+    compressed = codec.compress(content)
+    if len(compressed) + HEADER_SIZE >= len(content):
+        return content
+    return COMPRESSED_FLAG + bytes([codec.identifier]) + compressed
+
+
+def decompress(content: bytes) -> bytes:
+    """
+    Decompress the content of an encoded message, if it is compressed.
+
+    :param content: the content.
+    :return: the uncompressed content.
+    """
+    if content[:1] != COMPRESSED_FLAG:
+        return content
+    codec = _CODECS_BY_IDENTIFIER.get(content[1]) if len(content) > 1 else None
+    if codec is None:
+        raise ValueError("Unsupported compression of the message content.")
+    return codec.decompress(content[HEADER_SIZE:])
@@ -0,0 +1,759 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2020 fetchai
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains class representations corresponding to every custom type in the protocol specification."""
+
+import datetime
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from aea.exceptions import enforce
+
+from packages.fetchai.protocols.yoti import yoti_pb2
+
+
+DEFAULT_MEDIA_TYPE = "application/octet-stream"
+
+# the fields of the 'profile' performative holding its info, its strings in 'info'
+PROFILE_INFO_FIELDS = frozenset(
+    ["info"]
+    + [
+        name
+        for name in yoti_pb2.YotiMessage.ProfileInfo.DESCRIPTOR.fields_by_name
+        if name != "string_values"
+    ]
+)
+# the fields of the 'profile' performative holding its other contents
+_PROFILE_CONTENT_FIELDS = tuple(
+    name
+    for name in yoti_pb2.YotiMessage.Profile_Performative.DESCRIPTOR.fields_by_name
+    if name not in PROFILE_INFO_FIELDS
+)
+
+
+class BlobRef:
+    """
+    A reference to a binary value kept out of the message, in a blob store.
+
+    The blob store is content addressed: the value is found by the SHA-256
+    digest of its content, in the directory of the store.
+    """
+
+    __slots__ = ("_digest", "_size", "_media_type", "_store")
+
+    def __init__(
+        self,
+        digest: str,
+        size: int,
+        media_type: str = DEFAULT_MEDIA_TYPE,
+        store: str = "",
+    ) -> None:
+        """
+        Initialise an instance of BlobRef.
+
+        :param digest: the SHA-256 digest of the value, hex encoded.
+        :param size: the size of the value, in bytes.
+        :param media_type: the media type of the value, e.g. 'image/jpeg'.
+        :param store: the directory of the blob store keeping the value.
+        """
+        self._digest = digest
+        self._size = size
+        self._media_type = media_type
+        self._store = store
+
+    @property
+    def digest(self) -> str:
+        """Get the SHA-256 digest of the value, hex encoded."""
+        return self._digest
+
+    @property
+    def size(self) -> int:
+        """Get the size of the value, in bytes."""
+        return self._size
+
+    @property
+    def media_type(self) -> str:
+        """Get the media type of the value."""
+        return self._media_type
+
+    @property
+    def store(self) -> str:
+        """Get the directory of the blob store keeping the value."""
+        return self._store
+
+    def __eq__(self, other):
+        """Check equality."""
+        return (
+            isinstance(other, BlobRef)
+            and self.digest == other.digest
+            and self.size == other.size
+            and self.media_type == other.media_type
+            and self.store == other.store
+        )
+
+    def __hash__(self) -> int:
+        """Get the hash."""
+        return hash((self.digest, self.size, self.media_type, self.store))
+
+    def __repr__(self) -> str:
+        """Get the representation."""
+        return "BlobRef(digest={}, size={}, media_type={}, store={})".format(
+            self.digest, self.size, self.media_type, self.store
+        )
+
+
+# a nested structure is a dictionary of values, a list a tuple of values
+AttributeValue = Union[
+    str,
+    int,
+    bool,
+    float,
+    datetime.date,
+    bytes,
+    BlobRef,
+    Dict[str, Any],
+    Tuple[Any, ...],
+]
+
+T = TypeVar("T")
+
+# dates are encoded as their number of days since the epoch
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def _is_valid_value(value: Any) -> bool:
+    """Check whether a value is an attribute value of the protocol."""
+    if isinstance(value, (str, int, float, datetime.date, bytes, BlobRef)):
+        return True
+    if isinstance(value, Mapping):
+        return _are_valid_values(value)
+    if isinstance(value, (list, tuple)):
+        return all(_is_valid_value(element) for element in value)
+    return False
+
+
+def _are_valid_values(values: Mapping) -> bool:
+    """Check whether a mapping holds attribute values of the protocol, by name."""
+    return all(
+        isinstance(key, str) and _is_valid_value(value) for key, value in values.items()
+    )
+
+
+def _encode_values(
+    profile_info_protobuf_object, values: Mapping, string_values: Any = None
+) -> None:
+    """
+    Encode attribute values into a 'ProfileInfo' protocol buffer object.
+
+    The values are encoded in the map of their type, so strings, the most
+    common values, are encoded in a plain map of strings.
+
+    :param profile_info_protobuf_object: the 'ProfileInfo' protocol buffer object, or the 'Profile_Performative' one.
+    :param values: the values, by name.
+    :param string_values: the map of the strings, 'string_values' by default.
+    :return: None
+    :raises TypeError: if a value is not of a supported type.
+    """
+    if string_values is None:
+        string_values = profile_info_protobuf_object.string_values
+    for key, value in values.items():
+        if type(value) is str:
+            string_values[key] = value
+        elif isinstance(value, str):
+            string_values[key] = str(value)
+        elif isinstance(value, bool):
+            profile_info_protobuf_object.bool_values[key] = value
+        elif isinstance(value, int):
+            profile_info_protobuf_object.int_values[key] = value
+        elif isinstance(value, float):
+            profile_info_protobuf_object.float_values[key] = value
+        elif isinstance(value, datetime.date):
+            profile_info_protobuf_object.date_values[key] = _encode_date(value)
+        elif isinstance(value, bytes):
+            profile_info_protobuf_object.bytes_values[key] = value
+        elif isinstance(value, BlobRef):
+            _encode_blob_ref(profile_info_protobuf_object.blob_values[key], value)
+        elif isinstance(value, Mapping):
+            _encode_values(profile_info_protobuf_object.struct_values[key], value)
+        elif isinstance(value, (list, tuple)):
+            _encode_list(profile_info_protobuf_object.list_values[key], value)
+        else:
+            raise TypeError(
+                "Unsupported type for attribute {!r}: '{}'.".format(key, type(value))
+            )
+
+
+def _decode_values(
+    profile_info_protobuf_object, string_values: Any = None
+) -> Dict[str, AttributeValue]:
+    """
+    Decode attribute values from a 'ProfileInfo' protocol buffer object.
+
+    The maps are read key by key, which is faster than dict(map) with both
+    implementations of protobuf, and only if they are not empty.
+
+    :param profile_info_protobuf_object: the 'ProfileInfo' protocol buffer object, or the 'Profile_Performative' one.
+    :param string_values: the map of the strings, 'string_values' by default.
+    :return: the values, by name.
+    """
+    if string_values is None:
+        string_values = profile_info_protobuf_object.string_values
+    values: Dict[str, AttributeValue] = {
+        key: string_values[key] for key in string_values
+    }
+    for scalar_values in (
+        profile_info_protobuf_object.int_values,
+        profile_info_protobuf_object.bool_values,
+        profile_info_protobuf_object.float_values,
+        profile_info_protobuf_object.bytes_values,
+    ):
+        if len(scalar_values) > 0:
+            for key in scalar_values:
+                values[key] = scalar_values[key]
+    date_values = profile_info_protobuf_object.date_values
+    if len(date_values) > 0:
+        for key in date_values:
+            values[key] = _decode_date(date_values[key])
+    struct_values = profile_info_protobuf_object.struct_values
+    if len(struct_values) > 0:
+        for key in struct_values:
+            values[key] = _decode_values(struct_values[key])
+    list_values = profile_info_protobuf_object.list_values
+    if len(list_values) > 0:
+        for key in list_values:
+            values[key] = _decode_list(list_values[key])
+    blob_values = profile_info_protobuf_object.blob_values
+    if len(blob_values) > 0:
+        for key in blob_values:
+            values[key] = _decode_blob_ref(blob_values[key])
+    return values
+
+
+def _encode_date(date: datetime.date) -> int:
+    """
+    Encode a date as its number of days since 1970-01-01.
+
+    :param date: the date.
+    :return: the number of days.
+    """
+    return date.toordinal() - EPOCH_ORDINAL
+
+
+def _decode_date(days: int) -> datetime.date:
+    """
+    Decode a date from its number of days since 1970-01-01.
+
+    :param days: the number of days.
+    :return: the date.
+    """
+    return datetime.date.fromordinal(days + EPOCH_ORDINAL)
+
+
+def _encode_blob_ref(blob_ref_protobuf_object, blob_ref: BlobRef) -> None:
+    """
+    Encode a blob reference into a 'ProfileInfo.BlobRef' protocol buffer object.
+
+    :param blob_ref_protobuf_object: the 'ProfileInfo.BlobRef' protocol buffer object.
+    :param blob_ref: the blob reference.
+    :return: None
+    """
+    blob_ref_protobuf_object.digest = blob_ref.digest
+    blob_ref_protobuf_object.size = blob_ref.size
+    blob_ref_protobuf_object.media_type = blob_ref.media_type
+    blob_ref_protobuf_object.store = blob_ref.store
+
+
+def _decode_blob_ref(blob_ref_protobuf_object) -> BlobRef:
+    """
+    Decode a blob reference from a 'ProfileInfo.BlobRef' protocol buffer object.
+
+    :param blob_ref_protobuf_object: the 'ProfileInfo.BlobRef' protocol buffer object.
+    :return: the blob reference.
+    """
+    return BlobRef(
+        blob_ref_protobuf_object.digest,
+        blob_ref_protobuf_object.size,
+        blob_ref_protobuf_object.media_type,
+        blob_ref_protobuf_object.store,
+    )
+
+
+def _encode_list(list_protobuf_object, elements: Sequence) -> None:
+    """
+    Encode a list of values into a 'ProfileInfo.List' protocol buffer object.
+
+    :param list_protobuf_object: the 'ProfileInfo.List' protocol buffer object.
+    :param elements: the values.
+    :return: None
+    :raises TypeError: if a value is not of a supported type.
+    """
+    list_protobuf_object.SetInParent()
+    for element in elements:
+        value_protobuf_object = list_protobuf_object.values.add()
+        if isinstance(element, str):
+            value_protobuf_object.string_value = element
+        elif isinstance(element, bool):
+            value_protobuf_object.bool_value = element
+        elif isinstance(element, int):
+            value_protobuf_object.int_value = element
+        elif isinstance(element, float):
+            value_protobuf_object.float_value = element
+        elif isinstance(element, datetime.date):
+            value_protobuf_object.date_value = _encode_date(element)
+        elif isinstance(element, bytes):
+            value_protobuf_object.bytes_value = element
+        elif isinstance(element, BlobRef):
+            _encode_blob_ref(value_protobuf_object.blob_value, element)
+        elif isinstance(element, Mapping):
+            value_protobuf_object.struct_value.SetInParent()
+            _encode_values(value_protobuf_object.struct_value, element)
+        elif isinstance(element, (list, tuple)):
+            _encode_list(value_protobuf_object.list_value, element)
+        else:
+            raise TypeError(
+                "Unsupported type for a list element: '{}'.".format(type(element))
+            )
+
+
+def _decode_list(list_protobuf_object) -> Tuple[AttributeValue, ...]:
+    """
+    Decode a list of values from a 'ProfileInfo.List' protocol buffer object.
+
+    :param list_protobuf_object: the 'ProfileInfo.List' protocol buffer object.
+    :return: the values.
+    """
+    elements = []
+    for value_protobuf_object in list_protobuf_object.values:
+        kind = value_protobuf_object.WhichOneof("value")
+        if kind == "date_value":
+            elements.append(_decode_date(value_protobuf_object.date_value))
+        elif kind == "struct_value":
+            elements.append(_decode_values(value_protobuf_object.struct_value))
+        elif kind == "list_value":
+            elements.append(_decode_list(value_protobuf_object.list_value))
+        elif kind == "blob_value":
+            elements.append(_decode_blob_ref(value_protobuf_object.blob_value))
+        elif kind is None:
+            raise ValueError("A list element is not set.")
+        else:
+            elements.append(getattr(value_protobuf_object, kind))
+    return tuple(elements)
+
+
+class ProfileInfo(Mapping):
+    """
+    This class represents an instance of ProfileInfo.
+
+    It maps the attribute names of a profile to their values: strings,
+    integers, booleans, floats, dates, bytes, references to binary values
+    kept in a blob store, dictionaries of values for nested structures and
+    tuples of values for lists. It is a read-only mapping: use dict(info)
+    for a dict.
+
+    The info of a decoded 'profile' message holds the encoded content of
+    the message, parsed on first access, so decoding a message whose info
+    is never read, e.g. one which is only forwarded, skips parsing it.
+    """
+
+    __slots__ = ("_values", "_content")
+
+    def __init__(self, values: Optional[Mapping] = None) -> None:
+        """
+        Initialise an instance of ProfileInfo.
+
+        :param values: the attribute values, by name.
+        """
+        self._values: Optional[Dict[str, AttributeValue]] = (
+            dict(values) if values is not None else {}
+        )
+        self._content: Optional[bytes] = None
+
+    @classmethod
+    def from_content(cls, content: bytes) -> "ProfileInfo":
+        """
+        Get the info of a 'profile' message without parsing it.
+
+        :param content: the encoded 'YotiMessage' holding the 'profile' performative.
+        :return: the info, parsed on first access.
+        """
+        info = cls.__new__(cls)
+        info._values = None
+        info._content = content
+        return info
+
+    @property
+    def is_parsed(self) -> bool:
+        """Check whether the info was parsed."""
+        return self._values is not None
+
+    def is_valid(self) -> bool:
+        """
+        Check whether the attribute values are of the types of the protocol.
+
+        An info which was not parsed was decoded from typed fields, so it is
+        valid without parsing it.
+
+        :return: whether the values are valid.
+        """
+        if self._values is None:
+            return True
+        return _are_valid_values(self._values)
+
+    def _get_values(self) -> Dict[str, AttributeValue]:
+        """Get the attribute values, parsing them the first time."""
+        if self._values is None:
+            profile_pb = self._parse_content(cast(bytes, self._content))
+            self._values = _decode_values(profile_pb, string_values=profile_pb.info)
+            self._content = None
+        return self._values
+
+    @staticmethod
+    def _parse_content(content: bytes):
+        """Parse the 'Profile_Performative' of an encoded 'profile' message."""
+        yoti_pb = yoti_pb2.YotiMessage()
+        yoti_pb.ParseFromString(content)
+        return yoti_pb.profile
+
+    def __getitem__(self, key: str) -> AttributeValue:
+        """Get the value of an attribute."""
+        return self._get_values()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the attribute names."""
+        return iter(self._get_values())
+
+    def __len__(self) -> int:
+        """Get the number of attributes."""
+        return len(self._get_values())
+
+    def _get_typed(
+        self, name: str, value_type: Type[T], default: Optional[T]
+    ) -> Optional[T]:
+        """
+        Get the value of an attribute, checking its type.
+
+        :param name: the name of the attribute.
+        :param value_type: the expected type of the value.
+        :param default: the value if the profile does not have the attribute.
+        :return: the value.
+        :raises TypeError: if the value is not of the expected type.
+        """
+        value = self._get_values().get(name, default)
+        if value is not default and (
+            not isinstance(value, value_type)
+            or (value_type is int and isinstance(value, bool))
+        ):
+            raise TypeError(
+                "Attribute {!r} is a '{}', not a '{}'.".format(
+                    name, type(value).__name__, value_type.__name__
+                )
+            )
+        return cast(Optional[T], value)
+
+    def get_str(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a string attribute, or 'default' if the profile does not have it."""
+        return self._get_typed(name, str, default)
+
+    def get_int(self, name: str, default: Optional[int] = None) -> Optional[int]:
+        """Get an integer attribute, or 'default' if the profile does not have it."""
+        return self._get_typed(name, int, default)
+
+    def get_bool(self, name: str, default: Optional[bool] = None) -> Optional[bool]:
+        """Get a boolean attribute, or 'default' if the profile does not have it."""
+        return self._get_typed(name, bool, default)
+
+    def get_float(self, name: str, default: Optional[float] = None) -> Optional[float]:
+        """Get a float attribute, or 'default' if the profile does not have it."""
+        return self._get_typed(name, float, default)
+
+    def get_date(
+        self, name: str, default: Optional[datetime.date] = None
+    ) -> Optional[datetime.date]:
+        """Get a date attribute, or 'default' if the profile does not have it."""
+        return self._get_typed(name, datetime.date, default)
+
+    def get_bytes(self, name: str, default: Optional[bytes] = None) -> Optional[bytes]:
+        """Get a binary attribute, or 'default' if the profile does not have it."""
+        return self._get_typed(name, bytes, default)
+
+    def get_blob(
+        self, name: str, default: Optional[BlobRef] = None
+    ) -> Optional[BlobRef]:
+        """Get a binary attribute kept in a blob store, or 'default' if the profile does not have it."""
+        return self._get_typed(name, BlobRef, default)
+
+    def get_struct(
+        self, name: str, default: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get a structured attribute, or 'default' if the profile does not have it."""
+        return self._get_typed(name, dict, default)
+
+    def get_list(
+        self, name: str, default: Optional[Tuple[Any, ...]] = None
+    ) -> Optional[Tuple[Any, ...]]:
+        """Get a list attribute, or 'default' if the profile does not have it."""
+        return self._get_typed(name, tuple, default)
+
+    @staticmethod
+    def encode(
+        profile_info_protobuf_object, profile_info_object: "ProfileInfo"
+    ) -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the profile_info_protobuf_object argument is matched with the instance of this class in the 'profile_info_object' argument.
+
+        :param profile_info_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param profile_info_object: an instance of this class to be encoded in the protocol buffer object.
+        :return: None
+        """
+        _encode_values(profile_info_protobuf_object, profile_info_object._get_values())
+
+    @classmethod
+    def decode(cls, profile_info_protobuf_object) -> "ProfileInfo":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the 'profile_info_protobuf_object' argument.
+
+        :param profile_info_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the 'profile_info_protobuf_object' argument.
+        """
+        return cls(_decode_values(profile_info_protobuf_object))
+
+    @staticmethod
+    def encode_profile(
+        profile_performative_protobuf_object, profile_info_object: "ProfileInfo"
+    ) -> None:
+        """
+        Encode an instance of this class into a 'Profile_Performative' protocol buffer object.
+
+        The performative holds the maps of a 'ProfileInfo' itself, its
+        strings in the 'info' map of 0.1.0, so that the agents of either
+        version read the string attributes. An info which was not parsed
+        is copied over as it was decoded, without the other contents of its
+        message.
+
+        :param profile_performative_protobuf_object: the 'Profile_Performative' protocol buffer object.
+        :param profile_info_object: an instance of this class to be encoded in the protocol buffer object.
+        :return: None
+        """
+        if profile_info_object._content is not None:
+            profile_performative_protobuf_object.CopyFrom(
+                ProfileInfo._parse_content(profile_info_object._content)
+            )
+            for name in _PROFILE_CONTENT_FIELDS:
+                profile_performative_protobuf_object.ClearField(name)
+            return
+        _encode_values(
+            profile_performative_protobuf_object,
+            profile_info_object._get_values(),
+            string_values=profile_performative_protobuf_object.info,
+        )
+
+    def __repr__(self) -> str:
+        """
+        Get the representation.
+
+        Messages are logged through their representation, so it only names
+        the attributes and their types: their values are personal data, and
+        images are hundreds of kB.
+        """
+        if self._values is None:
+            return "ProfileInfo(<{} bytes, not parsed>)".format(
+                len(cast(bytes, self._content))
+            )
+        return "ProfileInfo({})".format(
+            ", ".join(
+                "{}=<{}>".format(name, type(value).__name__)
+                for name, value in self._values.items()
+            )
+        )
+
+
+class ProfileResult:
+    """The outcome of resolving one token: either a profile info or an error."""
+
+    __slots__ = ("_token", "_info", "_error_code", "_error_msg")
+
+    def __init__(
+        self,
+        token: str,
+        info: Optional[Mapping] = None,
+        error_code: Optional[int] = None,
+        error_msg: Optional[str] = None,
+    ):
+        """
+        Initialise an instance of ProfileResult.
+
+        :param token: the token resolved.
+        :param info: the profile info, if the token was resolved.
+        :param error_code: the error code, if the token was not resolved.
+        :param error_msg: the error message, if the token was not resolved.
+        """
+        enforce(
+            (info is None) != (error_code is None),
+            "Exactly one of 'info' and 'error_code' must be set.",
+        )
+        enforce(error_code != 0, "'error_code' must not be 0.")
+        self._token = token
+        self._info = (
+            info if info is None or type(info) == ProfileInfo else ProfileInfo(info)
+        )
+        self._error_code = error_code
+        self._error_msg = error_msg if error_code is not None else None
+
+    @property
+    def token(self) -> str:
+        """Get the token."""
+        return self._token
+
+    @property
+    def info(self) -> Optional[ProfileInfo]:
+        """Get the profile info."""
+        return self._info
+
+    @property
+    def error_code(self) -> Optional[int]:
+        """Get the error code."""
+        return self._error_code
+
+    @property
+    def error_msg(self) -> Optional[str]:
+        """Get the error message."""
+        return self._error_msg
+
+    @property
+    def is_error(self) -> bool:
+        """Check whether the token was not resolved."""
+        return self._error_code is not None
+
+    def __eq__(self, other):
+        """Check equality."""
+        return (
+            isinstance(other, ProfileResult)
+            and self.token == other.token
+            and self.info == other.info
+            and self.error_code == other.error_code
+            and self.error_msg == other.error_msg
+        )
+
+    def __repr__(self) -> str:
+        """Get the representation."""
+        if self.is_error:
+            return "ProfileResult(token={}, error_code={}, error_msg={})".format(
+                self.token, self.error_code, self.error_msg
+            )
+        return "ProfileResult(token={}, info={})".format(self.token, self.info)
+
+
+class ProfileResults:
+    """This class represents an instance of ProfileResults."""
+
+    __slots__ = ("_results",)
+
+    def __init__(self, results: Sequence[ProfileResult] = ()):
+        """
+        Initialise an instance of ProfileResults.
+
+        :param results: the outcome of each token, in the order of the request.
+        """
+        self._results: Tuple[ProfileResult, ...] = tuple(results)
+
+    @property
+    def results(self) -> Tuple[ProfileResult, ...]:
+        """Get the outcome of each token."""
+        return self._results
+
+    def __iter__(self) -> Iterator[ProfileResult]:
+        """Iterate over the outcome of each token."""
+        return iter(self._results)
+
+    def __len__(self) -> int:
+        """Get the number of tokens."""
+        return len(self._results)
+
+    @staticmethod
+    def encode(
+        profile_results_protobuf_object, profile_results_object: "ProfileResults"
+    ) -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the profile_results_protobuf_object argument is matched with the instance of this class in the 'profile_results_object' argument.
+
+        :param profile_results_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param profile_results_object: an instance of this class to be encoded in the protocol buffer object.
+        :return: None
+        """
+        for result in profile_results_object.results:
+            result_protobuf_object = profile_results_protobuf_object.results.add()
+            result_protobuf_object.token = result.token
+            if result.is_error:
+                result_protobuf_object.error_code = result.error_code
+                result_protobuf_object.error_msg = result.error_msg or ""
+            else:
+                ProfileInfo.encode(
+                    result_protobuf_object.info, cast(ProfileInfo, result.info)
+                )
+
+    @classmethod
+    def decode(cls, profile_results_protobuf_object) -> "ProfileResults":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the 'profile_results_protobuf_object' argument.
+
+        :param profile_results_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the 'profile_results_protobuf_object' argument.
+        """
+        return cls(
+            [
+                ProfileResult(
+                    result_protobuf_object.token,
+                    error_code=result_protobuf_object.error_code,
+                    error_msg=result_protobuf_object.error_msg,
+                )
+                if result_protobuf_object.error_code != 0
+                else ProfileResult(
+                    result_protobuf_object.token,
+                    info=ProfileInfo.decode(result_protobuf_object.info),
+                )
+                for result_protobuf_object in profile_results_protobuf_object.results
+            ]
+        )
+
+    def __eq__(self, other):
+        """Check equality."""
+        return isinstance(other, ProfileResults) and self.results == other.results
+
+    def __repr__(self) -> str:
+        """Get the representation."""
+        return "ProfileResults({})".format(list(self.results))
@@ -37,16 +37,26 @@ from packages.fetchai.protocols.yoti.message import YotiMessage
 class YotiDialogue(Dialogue):
     """The yoti dialogue class maintains state of a dialogue and manages it."""
 
-    INITIAL_PERFORMATIVES = frozenset({YotiMessage.Performative.GET_PROFILE})
+    INITIAL_PERFORMATIVES = frozenset(
+        {YotiMessage.Performative.GET_PROFILE, YotiMessage.Performative.GET_PROFILES}
+    )
     TERMINAL_PERFORMATIVES = frozenset(
-        {YotiMessage.Performative.PROFILE, YotiMessage.Performative.ERROR}
+        {
+            YotiMessage.Performative.PROFILE,
+            YotiMessage.Performative.PROFILES,
+            YotiMessage.Performative.ERROR,
+        }
     )
     VALID_REPLIES = {
         YotiMessage.Performative.ERROR: frozenset(),
         YotiMessage.Performative.GET_PROFILE: frozenset(
             {YotiMessage.Performative.PROFILE, YotiMessage.Performative.ERROR}
         ),
+        YotiMessage.Performative.GET_PROFILES: frozenset(
+            {YotiMessage.Performative.PROFILES, YotiMessage.Performative.ERROR}
+        ),
         YotiMessage.Performative.PROFILE: frozenset(),
+        YotiMessage.Performative.PROFILES: frozenset(),
     }
 
     class Role(Dialogue.Role):
@@ -20,12 +20,19 @@
 """This module contains yoti's message definition."""
 
 import logging
-from typing import Dict, Set, Tuple, cast
+from typing import Optional, Set, Tuple, cast
 
 from aea.configurations.base import PublicId
 from aea.exceptions import AEAEnforceError, enforce
 from aea.protocols.base import Message
 
+from packages.fetchai.protocols.yoti.custom_types import (
+    ProfileInfo as CustomProfileInfo,
+)
+from packages.fetchai.protocols.yoti.custom_types import (
+    ProfileResults as CustomProfileResults,
+)
+
 
 _default_logger = logging.getLogger("aea.packages.fetchai.protocols.yoti.message")
 
@@ -35,24 +42,34 @@ DEFAULT_BODY_SIZE = 4
 class YotiMessage(Message):
     """A protocol for communication between yoti skills and yoti connection."""
 
-    protocol_id = PublicId.from_str("fetchai/yoti:0.1.0")
+    protocol_id = PublicId.from_str("fetchai/yoti:0.2.0")
+
+    ProfileInfo = CustomProfileInfo
+
+    ProfileResults = CustomProfileResults
 
     class Performative(Message.Performative):
         """Performatives for the yoti protocol."""
 
         ERROR = "error"
         GET_PROFILE = "get_profile"
+        GET_PROFILES = "get_profiles"
         PROFILE = "profile"
+        PROFILES = "profiles"
 
         def __str__(self):
             """Get the string representation."""
             return str(self.value)
 
-    _performatives = {"error", "get_profile", "profile"}
+    _performatives = {"error", "get_profile", "get_profiles", "profile", "profiles"}
 
     class _SlotsCls:
         __slots__ = (
+            "accept_compression",
             "args",
+            "attributes",
+            "compression",
+            "compression_min_size",
             "dialogue_reference",
             "dotted_path",
             "error_code",
@@ -60,8 +77,12 @@ class YotiMessage(Message):
             "info",
             "message_id",
             "performative",
+            "results",
+            "scenario",
             "target",
+            "timeout",
             "token",
+            "tokens",
         )
 
     def __init__(
@@ -117,12 +138,32 @@ class YotiMessage(Message):
         enforce(self.is_set("target"), "target is not set.")
         return cast(int, self.get("target"))
 
+    @property
+    def accept_compression(self) -> Optional[Tuple[str, ...]]:
+        """Get the 'accept_compression' content from the message."""
+        return cast(Optional[Tuple[str, ...]], self.get("accept_compression"))
+
     @property
     def args(self) -> Tuple[str, ...]:
         """Get the 'args' content from the message."""
         enforce(self.is_set("args"), "'args' content is not set.")
         return cast(Tuple[str, ...], self.get("args"))
 
+    @property
+    def attributes(self) -> Optional[Tuple[str, ...]]:
+        """Get the 'attributes' content from the message."""
+        return cast(Optional[Tuple[str, ...]], self.get("attributes"))
+
+    @property
+    def compression(self) -> Optional[str]:
+        """Get the 'compression' content from the message."""
+        return cast(Optional[str], self.get("compression"))
+
+    @property
+    def compression_min_size(self) -> Optional[int]:
+        """Get the 'compression_min_size' content from the message."""
+        return cast(Optional[int], self.get("compression_min_size"))
+
     @property
     def dotted_path(self) -> str:
         """Get the 'dotted_path' content from the message."""
@@ -142,10 +183,26 @@ class YotiMessage(Message):
         return cast(str, self.get("error_msg"))
 
     @property
-    def info(self) -> Dict[str, str]:
+    def info(self) -> CustomProfileInfo:
         """Get the 'info' content from the message."""
         enforce(self.is_set("info"), "'info' content is not set.")
-        return cast(Dict[str, str], self.get("info"))
+        return cast(CustomProfileInfo, self.get("info"))
+
+    @property
+    def results(self) -> CustomProfileResults:
+        """Get the 'results' content from the message."""
+        enforce(self.is_set("results"), "'results' content is not set.")
+        return cast(CustomProfileResults, self.get("results"))
+
+    @property
+    def scenario(self) -> Optional[str]:
+        """Get the 'scenario' content from the message."""
+        return cast(Optional[str], self.get("scenario"))
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """Get the 'timeout' content from the message."""
+        return cast(Optional[float], self.get("timeout"))
 
     @property
     def token(self) -> str:
@@ -153,6 +210,18 @@ class YotiMessage(Message):
         enforce(self.is_set("token"), "'token' content is not set.")
         return cast(str, self.get("token"))
 
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        """Get the 'tokens' content from the message."""
+        enforce(self.is_set("tokens"), "'tokens' content is not set.")
+        return cast(Tuple[str, ...], self.get("tokens"))
+
+    def _is_info_consistent(  # pylint: disable=no-self-use
+        self, info: CustomProfileInfo
+    ) -> bool:
+        """Check that the values of a profile info follow the yoti protocol."""
+        return info.is_valid()
+
     def _is_consistent(self) -> bool:
         """Check that the message follows the yoti protocol."""
         try:
@@ -223,25 +292,207 @@ class YotiMessage(Message):
                     all(type(element) == str for element in self.args),
                     "Invalid type for tuple elements in content 'args'. Expected 'str'.",
                 )
+                if self.is_set("timeout"):
+                    expected_nb_of_contents += 1
+                    timeout = cast(float, self.timeout)
+                    enforce(
+                        type(timeout) in (int, float),
+                        "Invalid type for content 'timeout'. Expected 'float'. Found '{}'.".format(
+                            type(timeout)
+                        ),
+                    )
+                    enforce(
+                        timeout > 0,
+                        "Invalid value for content 'timeout'. Expected a positive number. Found '{}'.".format(
+                            timeout
+                        ),
+                    )
+                if self.is_set("attributes"):
+                    expected_nb_of_contents += 1
+                    attributes = cast(Tuple[str, ...], self.attributes)
+                    enforce(
+                        type(attributes) == tuple,
+                        "Invalid type for content 'attributes'. Expected 'tuple'. Found '{}'.".format(
+                            type(attributes)
+                        ),
+                    )
+                    enforce(
+                        all(type(element) == str for element in attributes),
+                        "Invalid type for tuple elements in content 'attributes'. Expected 'str'.",
+                    )
+                if self.is_set("scenario"):
+                    expected_nb_of_contents += 1
+                    scenario = cast(str, self.scenario)
+                    enforce(
+                        type(scenario) == str,
+                        "Invalid type for content 'scenario'. Expected 'str'. Found '{}'.".format(
+                            type(scenario)
+                        ),
+                    )
+                if self.is_set("accept_compression"):
+                    expected_nb_of_contents += 1
+                    accept_compression = cast(Tuple[str, ...], self.accept_compression)
+                    enforce(
+                        type(accept_compression) == tuple,
+                        "Invalid type for content 'accept_compression'. Expected 'tuple'. Found '{}'.".format(
+                            type(accept_compression)
+                        ),
+                    )
+                    enforce(
+                        all(type(element) == str for element in accept_compression),
+                        "Invalid type for tuple elements in content 'accept_compression'. Expected 'str'.",
+                    )
+            elif self.performative == YotiMessage.Performative.GET_PROFILES:
+                expected_nb_of_contents = 3
+                enforce(
+                    type(self.tokens) == tuple,
+                    "Invalid type for content 'tokens'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.tokens)
+                    ),
+                )
+                enforce(
+                    all(type(element) == str for element in self.tokens),
+                    "Invalid type for tuple elements in content 'tokens'. Expected 'str'.",
+                )
+                enforce(
+                    type(self.dotted_path) == str,
+                    "Invalid type for content 'dotted_path'. Expected 'str'. Found '{}'.".format(
+                        type(self.dotted_path)
+                    ),
+                )
+                enforce(
+                    type(self.args) == tuple,
+                    "Invalid type for content 'args'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.args)
+                    ),
+                )
+                enforce(
+                    all(type(element) == str for element in self.args),
+                    "Invalid type for tuple elements in content 'args'. Expected 'str'.",
+                )
+                if self.is_set("timeout"):
+                    expected_nb_of_contents += 1
+                    timeout = cast(float, self.timeout)
+                    enforce(
+                        type(timeout) in (int, float),
+                        "Invalid type for content 'timeout'. Expected 'float'. Found '{}'.".format(
+                            type(timeout)
+                        ),
+                    )
+                    enforce(
+                        timeout > 0,
+                        "Invalid value for content 'timeout'. Expected a positive number. Found '{}'.".format(
+                            timeout
+                        ),
+                    )
+                if self.is_set("attributes"):
+                    expected_nb_of_contents += 1
+                    attributes = cast(Tuple[str, ...], self.attributes)
+                    enforce(
+                        type(attributes) == tuple,
+                        "Invalid type for content 'attributes'. Expected 'tuple'. Found '{}'.".format(
+                            type(attributes)
+                        ),
+                    )
+                    enforce(
+                        all(type(element) == str for element in attributes),
+                        "Invalid type for tuple elements in content 'attributes'. Expected 'str'.",
+                    )
+                if self.is_set("scenario"):
+                    expected_nb_of_contents += 1
+                    scenario = cast(str, self.scenario)
+                    enforce(
+                        type(scenario) == str,
+                        "Invalid type for content 'scenario'. Expected 'str'. Found '{}'.".format(
+                            type(scenario)
+                        ),
+                    )
+                if self.is_set("accept_compression"):
+                    expected_nb_of_contents += 1
+                    accept_compression = cast(Tuple[str, ...], self.accept_compression)
+                    enforce(
+                        type(accept_compression) == tuple,
+                        "Invalid type for content 'accept_compression'. Expected 'tuple'. Found '{}'.".format(
+                            type(accept_compression)
+                        ),
+                    )
+                    enforce(
+                        all(type(element) == str for element in accept_compression),
+                        "Invalid type for tuple elements in content 'accept_compression'. Expected 'str'.",
+                    )
             elif self.performative == YotiMessage.Performative.PROFILE:
                 expected_nb_of_contents = 1
                 enforce(
-                    type(self.info) == dict,
-                    "Invalid type for content 'info'. Expected 'dict'. Found '{}'.".format(
+                    type(self.info) == CustomProfileInfo,
+                    "Invalid type for content 'info'. Expected 'ProfileInfo'. Found '{}'.".format(
                         type(self.info)
                     ),
                 )
-                for key_of_info, value_of_info in self.info.items():
+                enforce(
+                    self._is_info_consistent(self.info),
+                    "Invalid values in content 'info'. Expected attribute values of the yoti protocol.",
+                )
+                if self.is_set("compression"):
+                    expected_nb_of_contents += 1
+                    compression = cast(str, self.compression)
+                    enforce(
+                        type(compression) == str,
+                        "Invalid type for content 'compression'. Expected 'str'. Found '{}'.".format(
+                            type(compression)
+                        ),
+                    )
+                if self.is_set("compression_min_size"):
+                    expected_nb_of_contents += 1
+                    compression_min_size = cast(int, self.compression_min_size)
+                    enforce(
+                        type(compression_min_size) == int,
+                        "Invalid type for content 'compression_min_size'. Expected 'int'. Found '{}'.".format(
+                            type(compression_min_size)
+                        ),
+                    )
+                    enforce(
+                        compression_min_size >= 0,
+                        "Invalid value for content 'compression_min_size'. Expected a non-negative number. Found '{}'.".format(
+                            compression_min_size
+                        ),
+                    )
+            elif self.performative == YotiMessage.Performative.PROFILES:
+                expected_nb_of_contents = 1
+                enforce(
+                    type(self.results) == CustomProfileResults,
+                    "Invalid type for content 'results'. Expected 'ProfileResults'. Found '{}'.".format(
+                        type(self.results)
+                    ),
+                )
+                enforce(
+                    all(
+                        result.info is None or self._is_info_consistent(result.info)
+                        for result in self.results
+                    ),
+                    "Invalid values in content 'results'. Expected attribute values of the yoti protocol.",
+                )
+                if self.is_set("compression"):
+                    expected_nb_of_contents += 1
+                    compression = cast(str, self.compression)
+                    enforce(
+                        type(compression) == str,
+                        "Invalid type for content 'compression'. Expected 'str'. Found '{}'.".format(
+                            type(compression)
+                        ),
+                    )
+                if self.is_set("compression_min_size"):
+                    expected_nb_of_contents += 1
+                    compression_min_size = cast(int, self.compression_min_size)
                     enforce(
-                        type(key_of_info) == str,
-                        "Invalid type for dictionary keys in content 'info'. Expected 'str'. Found '{}'.".format(
-                            type(key_of_info)
+                        type(compression_min_size) == int,
+                        "Invalid type for content 'compression_min_size'. Expected 'int'. Found '{}'.".format(
+                            type(compression_min_size)
                         ),
                     )
                     enforce(
-                        type(value_of_info) == str,
-                        "Invalid type for dictionary values in content 'info'. Expected 'str'. Found '{}'.".format(
-                            type(value_of_info)
+                        compression_min_size >= 0,
+                        "Invalid value for content 'compression_min_size'. Expected a non-negative number. Found '{}'.".format(
+                            compression_min_size
                         ),
                     )
             elif self.performative == YotiMessage.Performative.ERROR:
@@ -19,18 +19,134 @@
 
 """Serialization module for yoti protocol."""
 
-from typing import Any, Dict, cast
+import threading
+from typing import Any, Dict, List, Tuple, cast
 
-from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
 from packages.fetchai.protocols.yoti import yoti_pb2
+from packages.fetchai.protocols.yoti.compression import (
+    COMPRESSED_FLAG,
+    DEFAULT_MIN_SIZE,
+    compress,
+    decompress,
+)
+from packages.fetchai.protocols.yoti.custom_types import (
+    PROFILE_INFO_FIELDS,
+    ProfileInfo,
+    ProfileResults,
+)
 from packages.fetchai.protocols.yoti.message import YotiMessage
 
 
+# the first byte of the content of a 'profile' message: its field key, length delimited
+PROFILE_FIELD_KEY = bytes(
+    [yoti_pb2.YotiMessage.DESCRIPTOR.fields_by_name["profile"].number << 3 | 2]
+)
+
+# the numbers of the fields of the 'profile' performative holding its info
+PROFILE_INFO_FIELD_NUMBERS = frozenset(
+    yoti_pb2.YotiMessage.Profile_Performative.DESCRIPTOR.fields_by_name[name].number
+    for name in PROFILE_INFO_FIELDS
+)
+# protobuf wire types
+WIRE_TYPE_VARINT = 0
+WIRE_TYPE_FIXED64 = 1
+WIRE_TYPE_LENGTH_DELIMITED = 2
+WIRE_TYPE_FIXED32 = 5
+
+_protobuf_objects = threading.local()
+
+
+def get_protobuf_objects() -> Tuple[ProtobufMessage, yoti_pb2.YotiMessage]:
+    """
+    Get the protobuf objects reused by the serializer in the current thread.
+
+    :return: the envelope message and the yoti message.
+    """
+    try:
+        return _protobuf_objects.message_pb, _protobuf_objects.yoti_pb
+    except AttributeError:
+        _protobuf_objects.message_pb = ProtobufMessage()
+        _protobuf_objects.yoti_pb = yoti_pb2.YotiMessage()
+        return _protobuf_objects.message_pb, _protobuf_objects.yoti_pb
+
+
+def _read_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """
+    Read a protobuf varint.
+
+    :param data: the encoded data.
+    :param position: the position of the varint in the data.
+    :return: the value of the varint and the position after it.
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def decode_profile_contents(content: bytes) -> Dict[str, Any]:
+    """
+    Decode the contents of an encoded 'profile' message, but its info.
+
+    The fields of the performative are walked over, those of the info
+    skipped and the others parsed, so that the info is left encoded.
+
+    :param content: the encoded 'YotiMessage' holding the 'profile' performative.
+    :return: the contents, but the info.
+    """
+    length, position = _read_varint(content, len(PROFILE_FIELD_KEY))
+    end = position + length
+    fields: List[bytes] = []
+    while position < end:
+        start = position
+        key, position = _read_varint(content, position)
+        wire_type = key & 7
+        if wire_type == WIRE_TYPE_LENGTH_DELIMITED:
+            length, position = _read_varint(content, position)
+            position += length
+        elif wire_type == WIRE_TYPE_VARINT:
+            _, position = _read_varint(content, position)
+        elif wire_type == WIRE_TYPE_FIXED64:
+            position += 8
+        elif wire_type == WIRE_TYPE_FIXED32:
+            position += 4
+        else:
+            raise ValueError("Unsupported wire type: {}.".format(wire_type))
+        if key >> 3 not in PROFILE_INFO_FIELD_NUMBERS:
+            fields.append(content[start:position])
+    performative_content = dict()  # type: Dict[str, Any]
+    if len(fields) == 0:
+        return performative_content
+    profile = yoti_pb2.YotiMessage.Profile_Performative.FromString(b"".join(fields))
+    if profile.compression_is_set:
+        compression = profile.compression
+        performative_content["compression"] = compression
+    if profile.compression_min_size_is_set:
+        compression_min_size = profile.compression_min_size
+        performative_content["compression_min_size"] = compression_min_size
+    return performative_content
+
+
 class YotiSerializer(Serializer):
-    """Serialization for the 'yoti' protocol."""
+    """
+    Serialization for the 'yoti' protocol.
+
+    The messages are built in place in protobuf objects reused per thread,
+    instead of being built apart and copied into their parent. The 'info'
+    of a decoded 'profile' message is parsed on first access.
+
+    The content of a 'profile' or 'profiles' message with a 'compression'
+    is compressed when it is at least 'compression_min_size' bytes, and
+    flagged as such.
+    """
 
     @staticmethod
     def encode(msg: Message) -> bytes:
@@ -41,9 +157,11 @@ class YotiSerializer(Serializer):
         :return: the bytes.
         """
         msg = cast(YotiMessage, msg)
-        message_pb = ProtobufMessage()
-        dialogue_message_pb = DialogueMessage()
-        yoti_msg = yoti_pb2.YotiMessage()
+        message_pb, yoti_msg = get_protobuf_objects()
+        message_pb.Clear()
+        yoti_msg.Clear()
+        dialogue_message_pb = message_pb.dialogue_message
+        dialogue_message_pb.SetInParent()
 
         dialogue_message_pb.message_id = msg.message_id
         dialogue_reference = msg.dialogue_reference
@@ -53,32 +171,102 @@ class YotiSerializer(Serializer):
 
         performative_id = msg.performative
         if performative_id == YotiMessage.Performative.GET_PROFILE:
-            performative = yoti_pb2.YotiMessage.Get_Profile_Performative()  # type: ignore
+            performative = yoti_msg.get_profile
+            performative.SetInParent()
             token = msg.token
             performative.token = token
             dotted_path = msg.dotted_path
             performative.dotted_path = dotted_path
             args = msg.args
             performative.args.extend(args)
-            yoti_msg.get_profile.CopyFrom(performative)
+            if msg.is_set("timeout"):
+                performative.timeout_is_set = True
+                timeout = msg.timeout
+                performative.timeout = timeout
+            if msg.is_set("attributes"):
+                performative.attributes_is_set = True
+                attributes = msg.attributes
+                performative.attributes.extend(attributes)
+            if msg.is_set("scenario"):
+                performative.scenario_is_set = True
+                scenario = msg.scenario
+                performative.scenario = scenario
+            if msg.is_set("accept_compression"):
+                performative.accept_compression_is_set = True
+                accept_compression = msg.accept_compression
+                performative.accept_compression.extend(accept_compression)
+        elif performative_id == YotiMessage.Performative.GET_PROFILES:
+            performative = yoti_msg.get_profiles
+            performative.SetInParent()
+            tokens = msg.tokens
+            performative.tokens.extend(tokens)
+            dotted_path = msg.dotted_path
+            performative.dotted_path = dotted_path
+            args = msg.args
+            performative.args.extend(args)
+            if msg.is_set("timeout"):
+                performative.timeout_is_set = True
+                timeout = msg.timeout
+                performative.timeout = timeout
+            if msg.is_set("attributes"):
+                performative.attributes_is_set = True
+                attributes = msg.attributes
+                performative.attributes.extend(attributes)
+            if msg.is_set("scenario"):
+                performative.scenario_is_set = True
+                scenario = msg.scenario
+                performative.scenario = scenario
+            if msg.is_set("accept_compression"):
+                performative.accept_compression_is_set = True
+                accept_compression = msg.accept_compression
+                performative.accept_compression.extend(accept_compression)
         elif performative_id == YotiMessage.Performative.PROFILE:
-            performative = yoti_pb2.YotiMessage.Profile_Performative()  # type: ignore
+            performative = yoti_msg.profile
+            performative.SetInParent()
             info = msg.info
-            performative.info.update(info)
-            yoti_msg.profile.CopyFrom(performative)
+            ProfileInfo.encode_profile(performative, info)
+            if msg.is_set("compression"):
+                performative.compression_is_set = True
+                compression = msg.compression
+                performative.compression = compression
+            if msg.is_set("compression_min_size"):
+                performative.compression_min_size_is_set = True
+                compression_min_size = msg.compression_min_size
+                performative.compression_min_size = compression_min_size
+        elif performative_id == YotiMessage.Performative.PROFILES:
+            performative = yoti_msg.profiles
+            performative.SetInParent()
+            results = msg.results
+            ProfileResults.encode(performative.results, results)
+            if msg.is_set("compression"):
+                performative.compression_is_set = True
+                compression = msg.compression
+                performative.compression = compression
+            if msg.is_set("compression_min_size"):
+                performative.compression_min_size_is_set = True
+                compression_min_size = msg.compression_min_size
+                performative.compression_min_size = compression_min_size
         elif performative_id == YotiMessage.Performative.ERROR:
-            performative = yoti_pb2.YotiMessage.Error_Performative()  # type: ignore
+            performative = yoti_msg.error
+            performative.SetInParent()
             error_code = msg.error_code
             performative.error_code = error_code
             error_msg = msg.error_msg
             performative.error_msg = error_msg
-            yoti_msg.error.CopyFrom(performative)
         else:
             raise ValueError("Performative not valid: {}".format(performative_id))
 
-        dialogue_message_pb.content = yoti_msg.SerializeToString()
+        content = yoti_msg.SerializeToString()
+        if msg.is_set("compression"):
+            content = compress(
+                content,
+                cast(str, msg.compression),
+                msg.compression_min_size
+                if msg.is_set("compression_min_size")
+                else DEFAULT_MIN_SIZE,
+            )
+        dialogue_message_pb.content = content
 
-        message_pb.dialogue_message.CopyFrom(dialogue_message_pb)
         message_bytes = message_pb.SerializeToString()
         return message_bytes
 
@@ -90,20 +278,36 @@ class YotiSerializer(Serializer):
         :param obj: the bytes object.
         :return: the 'Yoti' message.
         """
-        message_pb = ProtobufMessage()
-        yoti_pb = yoti_pb2.YotiMessage()
+        message_pb, yoti_pb = get_protobuf_objects()
         message_pb.ParseFromString(obj)
-        message_id = message_pb.dialogue_message.message_id
+        dialogue_message_pb = message_pb.dialogue_message
+        message_id = dialogue_message_pb.message_id
         dialogue_reference = (
-            message_pb.dialogue_message.dialogue_starter_reference,
-            message_pb.dialogue_message.dialogue_responder_reference,
+            dialogue_message_pb.dialogue_starter_reference,
+            dialogue_message_pb.dialogue_responder_reference,
         )
-        target = message_pb.dialogue_message.target
+        target = dialogue_message_pb.target
+        content = dialogue_message_pb.content
+        if content[:1] == COMPRESSED_FLAG:
+            content = decompress(content)
 
-        yoti_pb.ParseFromString(message_pb.dialogue_message.content)
+        performative_content = dict()  # type: Dict[str, Any]
+        if content[:1] == PROFILE_FIELD_KEY:
+            # the content only holds the performative, so it is a 'profile'
+            # message: its info is parsed on first access
+            performative_content = decode_profile_contents(content)
+            performative_content["info"] = ProfileInfo.from_content(content)
+            return YotiMessage(
+                message_id=message_id,
+                dialogue_reference=dialogue_reference,
+                target=target,
+                performative=YotiMessage.Performative.PROFILE,
+                **performative_content
+            )
+
+        yoti_pb.ParseFromString(content)
         performative = yoti_pb.WhichOneof("performative")
         performative_id = YotiMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
         if performative_id == YotiMessage.Performative.GET_PROFILE:
             token = yoti_pb.get_profile.token
             performative_content["token"] = token
@@ -112,10 +316,53 @@ class YotiSerializer(Serializer):
             args = yoti_pb.get_profile.args
             args_tuple = tuple(args)
             performative_content["args"] = args_tuple
-        elif performative_id == YotiMessage.Performative.PROFILE:
-            info = yoti_pb.profile.info
-            info_dict = dict(info)
-            performative_content["info"] = info_dict
+            if yoti_pb.get_profile.timeout_is_set:
+                timeout = yoti_pb.get_profile.timeout
+                performative_content["timeout"] = timeout
+            if yoti_pb.get_profile.attributes_is_set:
+                attributes = yoti_pb.get_profile.attributes
+                attributes_tuple = tuple(attributes)
+                performative_content["attributes"] = attributes_tuple
+            if yoti_pb.get_profile.scenario_is_set:
+                scenario = yoti_pb.get_profile.scenario
+                performative_content["scenario"] = scenario
+            if yoti_pb.get_profile.accept_compression_is_set:
+                accept_compression = yoti_pb.get_profile.accept_compression
+                accept_compression_tuple = tuple(accept_compression)
+                performative_content["accept_compression"] = accept_compression_tuple
+        elif performative_id == YotiMessage.Performative.GET_PROFILES:
+            tokens = yoti_pb.get_profiles.tokens
+            tokens_tuple = tuple(tokens)
+            performative_content["tokens"] = tokens_tuple
+            dotted_path = yoti_pb.get_profiles.dotted_path
+            performative_content["dotted_path"] = dotted_path
+            args = yoti_pb.get_profiles.args
+            args_tuple = tuple(args)
+            performative_content["args"] = args_tuple
+            if yoti_pb.get_profiles.timeout_is_set:
+                timeout = yoti_pb.get_profiles.timeout
+                performative_content["timeout"] = timeout
+            if yoti_pb.get_profiles.attributes_is_set:
+                attributes = yoti_pb.get_profiles.attributes
+                attributes_tuple = tuple(attributes)
+                performative_content["attributes"] = attributes_tuple
+            if yoti_pb.get_profiles.scenario_is_set:
+                scenario = yoti_pb.get_profiles.scenario
+                performative_content["scenario"] = scenario
+            if yoti_pb.get_profiles.accept_compression_is_set:
+                accept_compression = yoti_pb.get_profiles.accept_compression
+                accept_compression_tuple = tuple(accept_compression)
+                performative_content["accept_compression"] = accept_compression_tuple
+        elif performative_id == YotiMessage.Performative.PROFILES:
+            pb2_results = yoti_pb.profiles.results
+            results = ProfileResults.decode(pb2_results)
+            performative_content["results"] = results
+            if yoti_pb.profiles.compression_is_set:
+                compression = yoti_pb.profiles.compression
+                performative_content["compression"] = compression
+            if yoti_pb.profiles.compression_min_size_is_set:
+                compression_min_size = yoti_pb.profiles.compression_min_size
+                performative_content["compression_min_size"] = compression_min_size
         elif performative_id == YotiMessage.Performative.ERROR:
             error_code = yoti_pb.error.error_code
             performative_content["error_code"] = error_code
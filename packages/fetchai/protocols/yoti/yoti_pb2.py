@@ -17,20 +17,20 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="aea.fetchai.yoti",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=b'\n\nyoti.proto\x12\x10\x61\x65\x61.fetchai.yoti"\x93\x04\n\x0bYotiMessage\x12\x41\n\x05\x65rror\x18\x05 \x01(\x0b\x32\x30.aea.fetchai.yoti.YotiMessage.Error_PerformativeH\x00\x12M\n\x0bget_profile\x18\x06 \x01(\x0b\x32\x36.aea.fetchai.yoti.YotiMessage.Get_Profile_PerformativeH\x00\x12\x45\n\x07profile\x18\x07 \x01(\x0b\x32\x32.aea.fetchai.yoti.YotiMessage.Profile_PerformativeH\x00\x1aL\n\x18Get_Profile_Performative\x12\r\n\x05token\x18\x01 \x01(\t\x12\x13\n\x0b\x64otted_path\x18\x02 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x03 \x03(\t\x1a\x8f\x01\n\x14Profile_Performative\x12J\n\x04info\x18\x01 \x03(\x0b\x32<.aea.fetchai.yoti.YotiMessage.Profile_Performative.InfoEntry\x1a+\n\tInfoEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a;\n\x12\x45rror_Performative\x12\x12\n\nerror_code\x18\x01 \x01(\x05\x12\x11\n\terror_msg\x18\x02 \x01(\tB\x0e\n\x0cperformativeb\x06proto3',
+    serialized_pb=b'\n\nyoti.proto\x12\x10\x61\x65\x61.fetchai.yoti"\xe4%\n\x0bYotiMessage\x12\x41\n\x05\x65rror\x18\x05 \x01(\x0b\x32\x30.aea.fetchai.yoti.YotiMessage.Error_PerformativeH\x00\x12M\n\x0bget_profile\x18\x06 \x01(\x0b\x32\x36.aea.fetchai.yoti.YotiMessage.Get_Profile_PerformativeH\x00\x12\x45\n\x07profile\x18\x07 \x01(\x0b\x32\x32.aea.fetchai.yoti.YotiMessage.Profile_PerformativeH\x00\x12O\n\x0cget_profiles\x18\x08 \x01(\x0b\x32\x37.aea.fetchai.yoti.YotiMessage.Get_Profiles_PerformativeH\x00\x12G\n\x08profiles\x18\t \x01(\x0b\x32\x33.aea.fetchai.yoti.YotiMessage.Profiles_PerformativeH\x00\x1a\xc6\x0e\n\x0bProfileInfo\x12R\n\rstring_values\x18\x01 \x03(\x0b\x32;.aea.fetchai.yoti.YotiMessage.ProfileInfo.StringValuesEntry\x12L\n\nint_values\x18\x02 \x03(\x0b\x32\x38.aea.fetchai.yoti.YotiMessage.ProfileInfo.IntValuesEntry\x12N\n\x0b\x62ool_values\x18\x03 \x03(\x0b\x32\x39.aea.fetchai.yoti.YotiMessage.ProfileInfo.BoolValuesEntry\x12P\n\x0c\x66loat_values\x18\x04 \x03(\x0b\x32:.aea.fetchai.yoti.YotiMessage.ProfileInfo.FloatValuesEntry\x12N\n\x0b\x64\x61te_values\x18\x05 \x03(\x0b\x32\x39.aea.fetchai.yoti.YotiMessage.ProfileInfo.DateValuesEntry\x12P\n\x0c\x62ytes_values\x18\x06 \x03(\x0b\x32:.aea.fetchai.yoti.YotiMessage.ProfileInfo.BytesValuesEntry\x12R\n\rstruct_values\x18\x07 \x03(\x0b\x32;.aea.fetchai.yoti.YotiMessage.ProfileInfo.StructValuesEntry\x12N\n\x0blist_values\x18\x08 \x03(\x0b\x32\x39.aea.fetchai.yoti.YotiMessage.ProfileInfo.ListValuesEntry\x12N\n\x0b\x62lob_values\x18\t \x03(\x0b\x32\x39.aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobValuesEntry\x1aJ\n\x07\x42lobRef\x12\x0e\n\x06\x64igest\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x03\x12\x12\n\nmedia_type\x18\x03 \x01(\t\x12\r\n\x05store\x18\x04 \x01(\t\x1a\xe9\x02\n\x05Value\x12\x16\n\x0cstring_value\x18\x01 \x01(\tH\x00\x12\x13\n\tint_value\x18\x02 \x01(\x12H\x00\x12\x14\n\nbool_value\x18\x03 \x01(\x08H\x00\x12\x15\n\x0b\x66loat_value\x18\x04 \x01(\x01H\x00\x12\x14\n\ndate_value\x18\x05 \x01(\x11H\x00\x12\x15\n\x0b\x62ytes_value\x18\x06 \x01(\x0cH\x00\x12\x41\n\x0cstruct_value\x18\x07 \x01(\x0b\x32).aea.fetchai.yoti.YotiMessage.ProfileInfoH\x00\x12\x44\n\nlist_value\x18\x08 \x01(\x0b\x32..aea.fetchai.yoti.YotiMessage.ProfileInfo.ListH\x00\x12G\n\nblob_value\x18\t \x01(\x0b\x32\x31.aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobRefH\x00\x42\x07\n\x05value\x1aG\n\x04List\x12?\n\x06values\x18\x01 \x03(\x0b\x32/.aea.fetchai.yoti.YotiMessage.ProfileInfo.Value\x1a\x33\n\x11StringValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x30\n\x0eIntValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x12:\x02\x38\x01\x1a\x31\n\x0f\x42oolValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x08:\x02\x38\x01\x1a\x32\n\x10\x46loatValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a\x31\n\x0f\x44\x61teValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x11:\x02\x38\x01\x1a\x32\n\x10\x42ytesValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a^\n\x11StructValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32).aea.fetchai.yoti.YotiMessage.ProfileInfo:\x02\x38\x01\x1a\x61\n\x0fListValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..aea.fetchai.yoti.YotiMessage.ProfileInfo.List:\x02\x38\x01\x1a\x64\n\x0f\x42lobValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12@\n\x05value\x18\x02 \x01(\x0b\x32\x31.aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobRef:\x02\x38\x01\x1a\xdd\x01\n\x0eProfileResults\x12K\n\x07results\x18\x01 \x03(\x0b\x32:.aea.fetchai.yoti.YotiMessage.ProfileResults.ProfileResult\x1a~\n\rProfileResult\x12\r\n\x05token\x18\x01 \x01(\t\x12\x37\n\x04info\x18\x02 \x01(\x0b\x32).aea.fetchai.yoti.YotiMessage.ProfileInfo\x12\x12\n\nerror_code\x18\x03 \x01(\x05\x12\x11\n\terror_msg\x18\x04 \x01(\t\x1a\x8e\x02\n\x18Get_Profile_Performative\x12\r\n\x05token\x18\x01 \x01(\t\x12\x13\n\x0b\x64otted_path\x18\x02 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x03 \x03(\t\x12\x0f\n\x07timeout\x18\x04 \x01(\x01\x12\x16\n\x0etimeout_is_set\x18\x05 \x01(\x08\x12\x12\n\nattributes\x18\x06 \x03(\t\x12\x19\n\x11\x61ttributes_is_set\x18\x07 \x01(\x08\x12\x10\n\x08scenario\x18\x08 \x01(\t\x12\x17\n\x0fscenario_is_set\x18\t \x01(\x08\x12\x1a\n\x12\x61\x63\x63\x65pt_compression\x18\n \x03(\t\x12!\n\x19\x61\x63\x63\x65pt_compression_is_set\x18\x0b \x01(\x08\x1a\x90\x02\n\x19Get_Profiles_Performative\x12\x0e\n\x06tokens\x18\x01 \x03(\t\x12\x13\n\x0b\x64otted_path\x18\x02 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x03 \x03(\t\x12\x0f\n\x07timeout\x18\x04 \x01(\x01\x12\x16\n\x0etimeout_is_set\x18\x05 \x01(\x08\x12\x12\n\nattributes\x18\x06 \x03(\t\x12\x19\n\x11\x61ttributes_is_set\x18\x07 \x01(\x08\x12\x10\n\x08scenario\x18\x08 \x01(\t\x12\x17\n\x0fscenario_is_set\x18\t \x01(\x08\x12\x1a\n\x12\x61\x63\x63\x65pt_compression\x18\n \x03(\t\x12!\n\x19\x61\x63\x63\x65pt_compression_is_set\x18\x0b \x01(\x08\x1a\xfa\x0b\n\x14Profile_Performative\x12J\n\x04info\x18\x01 \x03(\x0b\x32<.aea.fetchai.yoti.YotiMessage.Profile_Performative.InfoEntry\x12U\n\nint_values\x18\x02 \x03(\x0b\x32\x41.aea.fetchai.yoti.YotiMessage.Profile_Performative.IntValuesEntry\x12W\n\x0b\x62ool_values\x18\x03 \x03(\x0b\x32\x42.aea.fetchai.yoti.YotiMessage.Profile_Performative.BoolValuesEntry\x12Y\n\x0c\x66loat_values\x18\x04 \x03(\x0b\x32\x43.aea.fetchai.yoti.YotiMessage.Profile_Performative.FloatValuesEntry\x12W\n\x0b\x64\x61te_values\x18\x05 \x03(\x0b\x32\x42.aea.fetchai.yoti.YotiMessage.Profile_Performative.DateValuesEntry\x12Y\n\x0c\x62ytes_values\x18\x06 \x03(\x0b\x32\x43.aea.fetchai.yoti.YotiMessage.Profile_Performative.BytesValuesEntry\x12[\n\rstruct_values\x18\x07 \x03(\x0b\x32\x44.aea.fetchai.yoti.YotiMessage.Profile_Performative.StructValuesEntry\x12W\n\x0blist_values\x18\x08 \x03(\x0b\x32\x42.aea.fetchai.yoti.YotiMessage.Profile_Performative.ListValuesEntry\x12W\n\x0b\x62lob_values\x18\t \x03(\x0b\x32\x42.aea.fetchai.yoti.YotiMessage.Profile_Performative.BlobValuesEntry\x12\x13\n\x0b\x63ompression\x18\n \x01(\t\x12\x1a\n\x12\x63ompression_is_set\x18\x0b \x01(\x08\x12\x1c\n\x14\x63ompression_min_size\x18\x0c \x01(\x03\x12#\n\x1b\x63ompression_min_size_is_set\x18\r \x01(\x08\x1a+\n\tInfoEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x30\n\x0eIntValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x12:\x02\x38\x01\x1a\x31\n\x0f\x42oolValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x08:\x02\x38\x01\x1a\x32\n\x10\x46loatValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a\x31\n\x0f\x44\x61teValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x11:\x02\x38\x01\x1a\x32\n\x10\x42ytesValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a^\n\x11StructValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32).aea.fetchai.yoti.YotiMessage.ProfileInfo:\x02\x38\x01\x1a\x61\n\x0fListValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..aea.fetchai.yoti.YotiMessage.ProfileInfo.List:\x02\x38\x01\x1a\x64\n\x0f\x42lobValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12@\n\x05value\x18\x02 \x01(\x0b\x32\x31.aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobRef:\x02\x38\x01\x1a\xca\x01\n\x15Profiles_Performative\x12=\n\x07results\x18\x01 \x01(\x0b\x32,.aea.fetchai.yoti.YotiMessage.ProfileResults\x12\x13\n\x0b\x63ompression\x18\x02 \x01(\t\x12\x1a\n\x12\x63ompression_is_set\x18\x03 \x01(\x08\x12\x1c\n\x14\x63ompression_min_size\x18\x04 \x01(\x03\x12#\n\x1b\x63ompression_min_size_is_set\x18\x05 \x01(\x08\x1a;\n\x12\x45rror_Performative\x12\x12\n\nerror_code\x18\x01 \x01(\x05\x12\x11\n\terror_msg\x18\x02 \x01(\tB\x0e\n\x0cperformativeb\x06proto3',
 )
 
 
-_YOTIMESSAGE_GET_PROFILE_PERFORMATIVE = _descriptor.Descriptor(
-    name="Get_Profile_Performative",
-    full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative",
+_YOTIMESSAGE_PROFILEINFO_BLOBREF = _descriptor.Descriptor(
+    name="BlobRef",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobRef",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     fields=[
         _descriptor.FieldDescriptor(
-            name="token",
-            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.token",
+            name="digest",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobRef.digest",
             index=0,
             number=1,
             type=9,
@@ -47,10 +47,28 @@ _YOTIMESSAGE_GET_PROFILE_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="dotted_path",
-            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.dotted_path",
+            name="size",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobRef.size",
             index=1,
             number=2,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="media_type",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobRef.media_type",
+            index=2,
+            number=3,
             type=9,
             cpp_type=9,
             label=1,
@@ -65,12 +83,240 @@ _YOTIMESSAGE_GET_PROFILE_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="args",
-            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.args",
+            name="store",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobRef.store",
+            index=3,
+            number=4,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1165,
+    serialized_end=1239,
+)
+
+_YOTIMESSAGE_PROFILEINFO_VALUE = _descriptor.Descriptor(
+    name="Value",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="string_value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.string_value",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="int_value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.int_value",
+            index=1,
+            number=2,
+            type=18,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="bool_value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.bool_value",
             index=2,
             number=3,
-            type=9,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="float_value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.float_value",
+            index=3,
+            number=4,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="date_value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.date_value",
+            index=4,
+            number=5,
+            type=17,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="bytes_value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.bytes_value",
+            index=5,
+            number=6,
+            type=12,
             cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="struct_value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.struct_value",
+            index=6,
+            number=7,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="list_value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.list_value",
+            index=7,
+            number=8,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="blob_value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.blob_value",
+            index=8,
+            number=9,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[
+        _descriptor.OneofDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.Value.value",
+            index=0,
+            containing_type=None,
+            fields=[],
+        ),
+    ],
+    serialized_start=1242,
+    serialized_end=1603,
+)
+
+_YOTIMESSAGE_PROFILEINFO_LIST = _descriptor.Descriptor(
+    name="List",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.List",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.List.values",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
             label=3,
             has_default_value=False,
             default_value=[],
@@ -91,27 +337,2060 @@ _YOTIMESSAGE_GET_PROFILE_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=265,
-    serialized_end=341,
+    serialized_start=1605,
+    serialized_end=1676,
 )
 
-_YOTIMESSAGE_PROFILE_PERFORMATIVE_INFOENTRY = _descriptor.Descriptor(
-    name="InfoEntry",
-    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.InfoEntry",
+_YOTIMESSAGE_PROFILEINFO_STRINGVALUESENTRY = _descriptor.Descriptor(
+    name="StringValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.StringValuesEntry",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     fields=[
         _descriptor.FieldDescriptor(
             name="key",
-            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.InfoEntry.key",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.StringValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.StringValuesEntry.value",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1678,
+    serialized_end=1729,
+)
+
+_YOTIMESSAGE_PROFILEINFO_INTVALUESENTRY = _descriptor.Descriptor(
+    name="IntValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.IntValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.IntValuesEntry.key",
             index=0,
             number=1,
             type=9,
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=b"".decode("utf-8"),
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.IntValuesEntry.value",
+            index=1,
+            number=2,
+            type=18,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1731,
+    serialized_end=1779,
+)
+
+_YOTIMESSAGE_PROFILEINFO_BOOLVALUESENTRY = _descriptor.Descriptor(
+    name="BoolValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BoolValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BoolValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BoolValuesEntry.value",
+            index=1,
+            number=2,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1781,
+    serialized_end=1830,
+)
+
+_YOTIMESSAGE_PROFILEINFO_FLOATVALUESENTRY = _descriptor.Descriptor(
+    name="FloatValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.FloatValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.FloatValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.FloatValuesEntry.value",
+            index=1,
+            number=2,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1832,
+    serialized_end=1882,
+)
+
+_YOTIMESSAGE_PROFILEINFO_DATEVALUESENTRY = _descriptor.Descriptor(
+    name="DateValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.DateValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.DateValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.DateValuesEntry.value",
+            index=1,
+            number=2,
+            type=17,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1884,
+    serialized_end=1933,
+)
+
+_YOTIMESSAGE_PROFILEINFO_BYTESVALUESENTRY = _descriptor.Descriptor(
+    name="BytesValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BytesValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BytesValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BytesValuesEntry.value",
+            index=1,
+            number=2,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1935,
+    serialized_end=1985,
+)
+
+_YOTIMESSAGE_PROFILEINFO_STRUCTVALUESENTRY = _descriptor.Descriptor(
+    name="StructValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.StructValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.StructValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.StructValuesEntry.value",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1987,
+    serialized_end=2081,
+)
+
+_YOTIMESSAGE_PROFILEINFO_LISTVALUESENTRY = _descriptor.Descriptor(
+    name="ListValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.ListValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.ListValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.ListValuesEntry.value",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2083,
+    serialized_end=2180,
+)
+
+_YOTIMESSAGE_PROFILEINFO_BLOBVALUESENTRY = _descriptor.Descriptor(
+    name="BlobValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobValuesEntry.value",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2182,
+    serialized_end=2282,
+)
+
+_YOTIMESSAGE_PROFILEINFO = _descriptor.Descriptor(
+    name="ProfileInfo",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="string_values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.string_values",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="int_values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.int_values",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="bool_values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.bool_values",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="float_values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.float_values",
+            index=3,
+            number=4,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="date_values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.date_values",
+            index=4,
+            number=5,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="bytes_values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.bytes_values",
+            index=5,
+            number=6,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="struct_values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.struct_values",
+            index=6,
+            number=7,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="list_values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.list_values",
+            index=7,
+            number=8,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="blob_values",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileInfo.blob_values",
+            index=8,
+            number=9,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[
+        _YOTIMESSAGE_PROFILEINFO_BLOBREF,
+        _YOTIMESSAGE_PROFILEINFO_VALUE,
+        _YOTIMESSAGE_PROFILEINFO_LIST,
+        _YOTIMESSAGE_PROFILEINFO_STRINGVALUESENTRY,
+        _YOTIMESSAGE_PROFILEINFO_INTVALUESENTRY,
+        _YOTIMESSAGE_PROFILEINFO_BOOLVALUESENTRY,
+        _YOTIMESSAGE_PROFILEINFO_FLOATVALUESENTRY,
+        _YOTIMESSAGE_PROFILEINFO_DATEVALUESENTRY,
+        _YOTIMESSAGE_PROFILEINFO_BYTESVALUESENTRY,
+        _YOTIMESSAGE_PROFILEINFO_STRUCTVALUESENTRY,
+        _YOTIMESSAGE_PROFILEINFO_LISTVALUESENTRY,
+        _YOTIMESSAGE_PROFILEINFO_BLOBVALUESENTRY,
+    ],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=420,
+    serialized_end=2282,
+)
+
+_YOTIMESSAGE_PROFILERESULTS_PROFILERESULT = _descriptor.Descriptor(
+    name="ProfileResult",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileResults.ProfileResult",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="token",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileResults.ProfileResult.token",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="info",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileResults.ProfileResult.info",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="error_code",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileResults.ProfileResult.error_code",
+            index=2,
+            number=3,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="error_msg",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileResults.ProfileResult.error_msg",
+            index=3,
+            number=4,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2380,
+    serialized_end=2506,
+)
+
+_YOTIMESSAGE_PROFILERESULTS = _descriptor.Descriptor(
+    name="ProfileResults",
+    full_name="aea.fetchai.yoti.YotiMessage.ProfileResults",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="results",
+            full_name="aea.fetchai.yoti.YotiMessage.ProfileResults.results",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[_YOTIMESSAGE_PROFILERESULTS_PROFILERESULT,],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2285,
+    serialized_end=2506,
+)
+
+_YOTIMESSAGE_GET_PROFILE_PERFORMATIVE = _descriptor.Descriptor(
+    name="Get_Profile_Performative",
+    full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="token",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.token",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="dotted_path",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.dotted_path",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="args",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.args",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="timeout",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.timeout",
+            index=3,
+            number=4,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="timeout_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.timeout_is_set",
+            index=4,
+            number=5,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="attributes",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.attributes",
+            index=5,
+            number=6,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="attributes_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.attributes_is_set",
+            index=6,
+            number=7,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="scenario",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.scenario",
+            index=7,
+            number=8,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="scenario_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.scenario_is_set",
+            index=8,
+            number=9,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="accept_compression",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.accept_compression",
+            index=9,
+            number=10,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="accept_compression_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profile_Performative.accept_compression_is_set",
+            index=10,
+            number=11,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2509,
+    serialized_end=2779,
+)
+
+_YOTIMESSAGE_GET_PROFILES_PERFORMATIVE = _descriptor.Descriptor(
+    name="Get_Profiles_Performative",
+    full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="tokens",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.tokens",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="dotted_path",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.dotted_path",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="args",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.args",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="timeout",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.timeout",
+            index=3,
+            number=4,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="timeout_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.timeout_is_set",
+            index=4,
+            number=5,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="attributes",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.attributes",
+            index=5,
+            number=6,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="attributes_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.attributes_is_set",
+            index=6,
+            number=7,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="scenario",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.scenario",
+            index=7,
+            number=8,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="scenario_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.scenario_is_set",
+            index=8,
+            number=9,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="accept_compression",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.accept_compression",
+            index=9,
+            number=10,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="accept_compression_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative.accept_compression_is_set",
+            index=10,
+            number=11,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2782,
+    serialized_end=3054,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_INFOENTRY = _descriptor.Descriptor(
+    name="InfoEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.InfoEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.InfoEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.InfoEntry.value",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=3991,
+    serialized_end=4034,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_INTVALUESENTRY = _descriptor.Descriptor(
+    name="IntValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.IntValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.IntValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.IntValuesEntry.value",
+            index=1,
+            number=2,
+            type=18,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1731,
+    serialized_end=1779,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BOOLVALUESENTRY = _descriptor.Descriptor(
+    name="BoolValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.BoolValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.BoolValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.BoolValuesEntry.value",
+            index=1,
+            number=2,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1781,
+    serialized_end=1830,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_FLOATVALUESENTRY = _descriptor.Descriptor(
+    name="FloatValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.FloatValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.FloatValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.FloatValuesEntry.value",
+            index=1,
+            number=2,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1832,
+    serialized_end=1882,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_DATEVALUESENTRY = _descriptor.Descriptor(
+    name="DateValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.DateValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.DateValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.DateValuesEntry.value",
+            index=1,
+            number=2,
+            type=17,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1884,
+    serialized_end=1933,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BYTESVALUESENTRY = _descriptor.Descriptor(
+    name="BytesValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.BytesValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.BytesValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.BytesValuesEntry.value",
+            index=1,
+            number=2,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1935,
+    serialized_end=1985,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_STRUCTVALUESENTRY = _descriptor.Descriptor(
+    name="StructValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.StructValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.StructValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.StructValuesEntry.value",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1987,
+    serialized_end=2081,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_LISTVALUESENTRY = _descriptor.Descriptor(
+    name="ListValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.ListValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.ListValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.ListValuesEntry.value",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2083,
+    serialized_end=2180,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BLOBVALUESENTRY = _descriptor.Descriptor(
+    name="BlobValuesEntry",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.BlobValuesEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.BlobValuesEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.BlobValuesEntry.value",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=b"8\001",
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2182,
+    serialized_end=2282,
+)
+
+_YOTIMESSAGE_PROFILE_PERFORMATIVE = _descriptor.Descriptor(
+    name="Profile_Performative",
+    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="info",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.info",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="int_values",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.int_values",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="bool_values",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.bool_values",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="float_values",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.float_values",
+            index=3,
+            number=4,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="date_values",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.date_values",
+            index=4,
+            number=5,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="bytes_values",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.bytes_values",
+            index=5,
+            number=6,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="struct_values",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.struct_values",
+            index=6,
+            number=7,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="list_values",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.list_values",
+            index=7,
+            number=8,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="blob_values",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.blob_values",
+            index=8,
+            number=9,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="compression",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.compression",
+            index=9,
+            number=10,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="compression_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.compression_is_set",
+            index=10,
+            number=11,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="compression_min_size",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.compression_min_size",
+            index=11,
+            number=12,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="compression_min_size_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.compression_min_size_is_set",
+            index=12,
+            number=13,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[
+        _YOTIMESSAGE_PROFILE_PERFORMATIVE_INFOENTRY,
+        _YOTIMESSAGE_PROFILE_PERFORMATIVE_INTVALUESENTRY,
+        _YOTIMESSAGE_PROFILE_PERFORMATIVE_BOOLVALUESENTRY,
+        _YOTIMESSAGE_PROFILE_PERFORMATIVE_FLOATVALUESENTRY,
+        _YOTIMESSAGE_PROFILE_PERFORMATIVE_DATEVALUESENTRY,
+        _YOTIMESSAGE_PROFILE_PERFORMATIVE_BYTESVALUESENTRY,
+        _YOTIMESSAGE_PROFILE_PERFORMATIVE_STRUCTVALUESENTRY,
+        _YOTIMESSAGE_PROFILE_PERFORMATIVE_LISTVALUESENTRY,
+        _YOTIMESSAGE_PROFILE_PERFORMATIVE_BLOBVALUESENTRY,
+    ],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=3057,
+    serialized_end=4587,
+)
+
+_YOTIMESSAGE_PROFILES_PERFORMATIVE = _descriptor.Descriptor(
+    name="Profiles_Performative",
+    full_name="aea.fetchai.yoti.YotiMessage.Profiles_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="results",
+            full_name="aea.fetchai.yoti.YotiMessage.Profiles_Performative.results",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -121,8 +2400,8 @@ _YOTIMESSAGE_PROFILE_PERFORMATIVE_INFOENTRY = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="value",
-            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.InfoEntry.value",
+            name="compression",
+            full_name="aea.fetchai.yoti.YotiMessage.Profiles_Performative.compression",
             index=1,
             number=2,
             type=9,
@@ -138,36 +2417,52 @@ _YOTIMESSAGE_PROFILE_PERFORMATIVE_INFOENTRY = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=b"8\001",
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=444,
-    serialized_end=487,
-)
-
-_YOTIMESSAGE_PROFILE_PERFORMATIVE = _descriptor.Descriptor(
-    name="Profile_Performative",
-    full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="info",
-            full_name="aea.fetchai.yoti.YotiMessage.Profile_Performative.info",
-            index=0,
-            number=1,
-            type=11,
-            cpp_type=10,
-            label=3,
+            name="compression_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Profiles_Performative.compression_is_set",
+            index=2,
+            number=3,
+            type=8,
+            cpp_type=7,
+            label=1,
             has_default_value=False,
-            default_value=[],
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="compression_min_size",
+            full_name="aea.fetchai.yoti.YotiMessage.Profiles_Performative.compression_min_size",
+            index=3,
+            number=4,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="compression_min_size_is_set",
+            full_name="aea.fetchai.yoti.YotiMessage.Profiles_Performative.compression_min_size_is_set",
+            index=4,
+            number=5,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -178,15 +2473,15 @@ _YOTIMESSAGE_PROFILE_PERFORMATIVE = _descriptor.Descriptor(
         ),
     ],
     extensions=[],
-    nested_types=[_YOTIMESSAGE_PROFILE_PERFORMATIVE_INFOENTRY,],
+    nested_types=[],
     enum_types=[],
     serialized_options=None,
     is_extendable=False,
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=344,
-    serialized_end=487,
+    serialized_start=4590,
+    serialized_end=4792,
 )
 
 _YOTIMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
@@ -241,8 +2536,8 @@ _YOTIMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=489,
-    serialized_end=548,
+    serialized_start=4794,
+    serialized_end=4853,
 )
 
 _YOTIMESSAGE = _descriptor.Descriptor(
@@ -306,11 +2601,51 @@ _YOTIMESSAGE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+        _descriptor.FieldDescriptor(
+            name="get_profiles",
+            full_name="aea.fetchai.yoti.YotiMessage.get_profiles",
+            index=3,
+            number=8,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="profiles",
+            full_name="aea.fetchai.yoti.YotiMessage.profiles",
+            index=4,
+            number=9,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
     ],
     extensions=[],
     nested_types=[
+        _YOTIMESSAGE_PROFILEINFO,
+        _YOTIMESSAGE_PROFILERESULTS,
         _YOTIMESSAGE_GET_PROFILE_PERFORMATIVE,
+        _YOTIMESSAGE_GET_PROFILES_PERFORMATIVE,
         _YOTIMESSAGE_PROFILE_PERFORMATIVE,
+        _YOTIMESSAGE_PROFILES_PERFORMATIVE,
         _YOTIMESSAGE_ERROR_PERFORMATIVE,
     ],
     enum_types=[],
@@ -328,23 +2663,214 @@ _YOTIMESSAGE = _descriptor.Descriptor(
         ),
     ],
     serialized_start=33,
-    serialized_end=564,
+    serialized_end=4869,
 )
 
+_YOTIMESSAGE_PROFILEINFO_BLOBREF.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "struct_value"
+].message_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "list_value"
+].message_type = _YOTIMESSAGE_PROFILEINFO_LIST
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "blob_value"
+].message_type = _YOTIMESSAGE_PROFILEINFO_BLOBREF
+_YOTIMESSAGE_PROFILEINFO_VALUE.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"].fields.append(
+    _YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name["string_value"]
+)
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "string_value"
+].containing_oneof = _YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"]
+_YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"].fields.append(
+    _YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name["int_value"]
+)
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "int_value"
+].containing_oneof = _YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"]
+_YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"].fields.append(
+    _YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name["bool_value"]
+)
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "bool_value"
+].containing_oneof = _YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"]
+_YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"].fields.append(
+    _YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name["float_value"]
+)
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "float_value"
+].containing_oneof = _YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"]
+_YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"].fields.append(
+    _YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name["date_value"]
+)
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "date_value"
+].containing_oneof = _YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"]
+_YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"].fields.append(
+    _YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name["bytes_value"]
+)
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "bytes_value"
+].containing_oneof = _YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"]
+_YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"].fields.append(
+    _YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name["struct_value"]
+)
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "struct_value"
+].containing_oneof = _YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"]
+_YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"].fields.append(
+    _YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name["list_value"]
+)
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "list_value"
+].containing_oneof = _YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"]
+_YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"].fields.append(
+    _YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name["blob_value"]
+)
+_YOTIMESSAGE_PROFILEINFO_VALUE.fields_by_name[
+    "blob_value"
+].containing_oneof = _YOTIMESSAGE_PROFILEINFO_VALUE.oneofs_by_name["value"]
+_YOTIMESSAGE_PROFILEINFO_LIST.fields_by_name[
+    "values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_VALUE
+_YOTIMESSAGE_PROFILEINFO_LIST.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_STRINGVALUESENTRY.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_INTVALUESENTRY.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_BOOLVALUESENTRY.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_FLOATVALUESENTRY.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_DATEVALUESENTRY.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_BYTESVALUESENTRY.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_STRUCTVALUESENTRY.fields_by_name[
+    "value"
+].message_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_STRUCTVALUESENTRY.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_LISTVALUESENTRY.fields_by_name[
+    "value"
+].message_type = _YOTIMESSAGE_PROFILEINFO_LIST
+_YOTIMESSAGE_PROFILEINFO_LISTVALUESENTRY.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO_BLOBVALUESENTRY.fields_by_name[
+    "value"
+].message_type = _YOTIMESSAGE_PROFILEINFO_BLOBREF
+_YOTIMESSAGE_PROFILEINFO_BLOBVALUESENTRY.containing_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILEINFO.fields_by_name[
+    "string_values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_STRINGVALUESENTRY
+_YOTIMESSAGE_PROFILEINFO.fields_by_name[
+    "int_values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_INTVALUESENTRY
+_YOTIMESSAGE_PROFILEINFO.fields_by_name[
+    "bool_values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_BOOLVALUESENTRY
+_YOTIMESSAGE_PROFILEINFO.fields_by_name[
+    "float_values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_FLOATVALUESENTRY
+_YOTIMESSAGE_PROFILEINFO.fields_by_name[
+    "date_values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_DATEVALUESENTRY
+_YOTIMESSAGE_PROFILEINFO.fields_by_name[
+    "bytes_values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_BYTESVALUESENTRY
+_YOTIMESSAGE_PROFILEINFO.fields_by_name[
+    "struct_values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_STRUCTVALUESENTRY
+_YOTIMESSAGE_PROFILEINFO.fields_by_name[
+    "list_values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_LISTVALUESENTRY
+_YOTIMESSAGE_PROFILEINFO.fields_by_name[
+    "blob_values"
+].message_type = _YOTIMESSAGE_PROFILEINFO_BLOBVALUESENTRY
+_YOTIMESSAGE_PROFILEINFO.containing_type = _YOTIMESSAGE
+_YOTIMESSAGE_PROFILERESULTS_PROFILERESULT.fields_by_name[
+    "info"
+].message_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILERESULTS_PROFILERESULT.containing_type = _YOTIMESSAGE_PROFILERESULTS
+_YOTIMESSAGE_PROFILERESULTS.fields_by_name[
+    "results"
+].message_type = _YOTIMESSAGE_PROFILERESULTS_PROFILERESULT
+_YOTIMESSAGE_PROFILERESULTS.containing_type = _YOTIMESSAGE
 _YOTIMESSAGE_GET_PROFILE_PERFORMATIVE.containing_type = _YOTIMESSAGE
+_YOTIMESSAGE_GET_PROFILES_PERFORMATIVE.containing_type = _YOTIMESSAGE
 _YOTIMESSAGE_PROFILE_PERFORMATIVE_INFOENTRY.containing_type = (
     _YOTIMESSAGE_PROFILE_PERFORMATIVE
 )
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_INTVALUESENTRY.containing_type = (
+    _YOTIMESSAGE_PROFILE_PERFORMATIVE
+)
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BOOLVALUESENTRY.containing_type = (
+    _YOTIMESSAGE_PROFILE_PERFORMATIVE
+)
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_FLOATVALUESENTRY.containing_type = (
+    _YOTIMESSAGE_PROFILE_PERFORMATIVE
+)
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_DATEVALUESENTRY.containing_type = (
+    _YOTIMESSAGE_PROFILE_PERFORMATIVE
+)
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BYTESVALUESENTRY.containing_type = (
+    _YOTIMESSAGE_PROFILE_PERFORMATIVE
+)
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_STRUCTVALUESENTRY.fields_by_name[
+    "value"
+].message_type = _YOTIMESSAGE_PROFILEINFO
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_STRUCTVALUESENTRY.containing_type = (
+    _YOTIMESSAGE_PROFILE_PERFORMATIVE
+)
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_LISTVALUESENTRY.fields_by_name[
+    "value"
+].message_type = _YOTIMESSAGE_PROFILEINFO_LIST
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_LISTVALUESENTRY.containing_type = (
+    _YOTIMESSAGE_PROFILE_PERFORMATIVE
+)
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BLOBVALUESENTRY.fields_by_name[
+    "value"
+].message_type = _YOTIMESSAGE_PROFILEINFO_BLOBREF
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BLOBVALUESENTRY.containing_type = (
+    _YOTIMESSAGE_PROFILE_PERFORMATIVE
+)
 _YOTIMESSAGE_PROFILE_PERFORMATIVE.fields_by_name[
     "info"
 ].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE_INFOENTRY
+_YOTIMESSAGE_PROFILE_PERFORMATIVE.fields_by_name[
+    "int_values"
+].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE_INTVALUESENTRY
+_YOTIMESSAGE_PROFILE_PERFORMATIVE.fields_by_name[
+    "bool_values"
+].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE_BOOLVALUESENTRY
+_YOTIMESSAGE_PROFILE_PERFORMATIVE.fields_by_name[
+    "float_values"
+].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE_FLOATVALUESENTRY
+_YOTIMESSAGE_PROFILE_PERFORMATIVE.fields_by_name[
+    "date_values"
+].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE_DATEVALUESENTRY
+_YOTIMESSAGE_PROFILE_PERFORMATIVE.fields_by_name[
+    "bytes_values"
+].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE_BYTESVALUESENTRY
+_YOTIMESSAGE_PROFILE_PERFORMATIVE.fields_by_name[
+    "struct_values"
+].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE_STRUCTVALUESENTRY
+_YOTIMESSAGE_PROFILE_PERFORMATIVE.fields_by_name[
+    "list_values"
+].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE_LISTVALUESENTRY
+_YOTIMESSAGE_PROFILE_PERFORMATIVE.fields_by_name[
+    "blob_values"
+].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE_BLOBVALUESENTRY
 _YOTIMESSAGE_PROFILE_PERFORMATIVE.containing_type = _YOTIMESSAGE
+_YOTIMESSAGE_PROFILES_PERFORMATIVE.fields_by_name[
+    "results"
+].message_type = _YOTIMESSAGE_PROFILERESULTS
+_YOTIMESSAGE_PROFILES_PERFORMATIVE.containing_type = _YOTIMESSAGE
 _YOTIMESSAGE_ERROR_PERFORMATIVE.containing_type = _YOTIMESSAGE
 _YOTIMESSAGE.fields_by_name["error"].message_type = _YOTIMESSAGE_ERROR_PERFORMATIVE
 _YOTIMESSAGE.fields_by_name[
     "get_profile"
 ].message_type = _YOTIMESSAGE_GET_PROFILE_PERFORMATIVE
 _YOTIMESSAGE.fields_by_name["profile"].message_type = _YOTIMESSAGE_PROFILE_PERFORMATIVE
+_YOTIMESSAGE.fields_by_name[
+    "get_profiles"
+].message_type = _YOTIMESSAGE_GET_PROFILES_PERFORMATIVE
+_YOTIMESSAGE.fields_by_name[
+    "profiles"
+].message_type = _YOTIMESSAGE_PROFILES_PERFORMATIVE
 _YOTIMESSAGE.oneofs_by_name["performative"].fields.append(
     _YOTIMESSAGE.fields_by_name["error"]
 )
@@ -363,6 +2889,18 @@ _YOTIMESSAGE.oneofs_by_name["performative"].fields.append(
 _YOTIMESSAGE.fields_by_name["profile"].containing_oneof = _YOTIMESSAGE.oneofs_by_name[
     "performative"
 ]
+_YOTIMESSAGE.oneofs_by_name["performative"].fields.append(
+    _YOTIMESSAGE.fields_by_name["get_profiles"]
+)
+_YOTIMESSAGE.fields_by_name[
+    "get_profiles"
+].containing_oneof = _YOTIMESSAGE.oneofs_by_name["performative"]
+_YOTIMESSAGE.oneofs_by_name["performative"].fields.append(
+    _YOTIMESSAGE.fields_by_name["profiles"]
+)
+_YOTIMESSAGE.fields_by_name["profiles"].containing_oneof = _YOTIMESSAGE.oneofs_by_name[
+    "performative"
+]
 DESCRIPTOR.message_types_by_name["YotiMessage"] = _YOTIMESSAGE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
@@ -370,6 +2908,141 @@ YotiMessage = _reflection.GeneratedProtocolMessageType(
     "YotiMessage",
     (_message.Message,),
     {
+        "ProfileInfo": _reflection.GeneratedProtocolMessageType(
+            "ProfileInfo",
+            (_message.Message,),
+            {
+                "BlobRef": _reflection.GeneratedProtocolMessageType(
+                    "BlobRef",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_BLOBREF,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobRef)
+                    },
+                ),
+                "Value": _reflection.GeneratedProtocolMessageType(
+                    "Value",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_VALUE,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.Value)
+                    },
+                ),
+                "List": _reflection.GeneratedProtocolMessageType(
+                    "List",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_LIST,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.List)
+                    },
+                ),
+                "StringValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "StringValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_STRINGVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.StringValuesEntry)
+                    },
+                ),
+                "IntValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "IntValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_INTVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.IntValuesEntry)
+                    },
+                ),
+                "BoolValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "BoolValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_BOOLVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.BoolValuesEntry)
+                    },
+                ),
+                "FloatValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "FloatValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_FLOATVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.FloatValuesEntry)
+                    },
+                ),
+                "DateValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "DateValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_DATEVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.DateValuesEntry)
+                    },
+                ),
+                "BytesValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "BytesValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_BYTESVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.BytesValuesEntry)
+                    },
+                ),
+                "StructValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "StructValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_STRUCTVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.StructValuesEntry)
+                    },
+                ),
+                "ListValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "ListValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_LISTVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.ListValuesEntry)
+                    },
+                ),
+                "BlobValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "BlobValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO_BLOBVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo.BlobValuesEntry)
+                    },
+                ),
+                "DESCRIPTOR": _YOTIMESSAGE_PROFILEINFO,
+                "__module__": "yoti_pb2"
+                # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileInfo)
+            },
+        ),
+        "ProfileResults": _reflection.GeneratedProtocolMessageType(
+            "ProfileResults",
+            (_message.Message,),
+            {
+                "ProfileResult": _reflection.GeneratedProtocolMessageType(
+                    "ProfileResult",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILERESULTS_PROFILERESULT,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileResults.ProfileResult)
+                    },
+                ),
+                "DESCRIPTOR": _YOTIMESSAGE_PROFILERESULTS,
+                "__module__": "yoti_pb2"
+                # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.ProfileResults)
+            },
+        ),
         "Get_Profile_Performative": _reflection.GeneratedProtocolMessageType(
             "Get_Profile_Performative",
             (_message.Message,),
@@ -379,6 +3052,15 @@ YotiMessage = _reflection.GeneratedProtocolMessageType(
                 # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Get_Profile_Performative)
             },
         ),
+        "Get_Profiles_Performative": _reflection.GeneratedProtocolMessageType(
+            "Get_Profiles_Performative",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _YOTIMESSAGE_GET_PROFILES_PERFORMATIVE,
+                "__module__": "yoti_pb2"
+                # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Get_Profiles_Performative)
+            },
+        ),
         "Profile_Performative": _reflection.GeneratedProtocolMessageType(
             "Profile_Performative",
             (_message.Message,),
@@ -392,11 +3074,92 @@ YotiMessage = _reflection.GeneratedProtocolMessageType(
                         # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative.InfoEntry)
                     },
                 ),
+                "IntValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "IntValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILE_PERFORMATIVE_INTVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative.IntValuesEntry)
+                    },
+                ),
+                "BoolValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "BoolValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILE_PERFORMATIVE_BOOLVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative.BoolValuesEntry)
+                    },
+                ),
+                "FloatValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "FloatValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILE_PERFORMATIVE_FLOATVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative.FloatValuesEntry)
+                    },
+                ),
+                "DateValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "DateValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILE_PERFORMATIVE_DATEVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative.DateValuesEntry)
+                    },
+                ),
+                "BytesValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "BytesValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILE_PERFORMATIVE_BYTESVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative.BytesValuesEntry)
+                    },
+                ),
+                "StructValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "StructValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILE_PERFORMATIVE_STRUCTVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative.StructValuesEntry)
+                    },
+                ),
+                "ListValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "ListValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILE_PERFORMATIVE_LISTVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative.ListValuesEntry)
+                    },
+                ),
+                "BlobValuesEntry": _reflection.GeneratedProtocolMessageType(
+                    "BlobValuesEntry",
+                    (_message.Message,),
+                    {
+                        "DESCRIPTOR": _YOTIMESSAGE_PROFILE_PERFORMATIVE_BLOBVALUESENTRY,
+                        "__module__": "yoti_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative.BlobValuesEntry)
+                    },
+                ),
                 "DESCRIPTOR": _YOTIMESSAGE_PROFILE_PERFORMATIVE,
                 "__module__": "yoti_pb2"
                 # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profile_Performative)
             },
         ),
+        "Profiles_Performative": _reflection.GeneratedProtocolMessageType(
+            "Profiles_Performative",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _YOTIMESSAGE_PROFILES_PERFORMATIVE,
+                "__module__": "yoti_pb2"
+                # @@protoc_insertion_point(class_scope:aea.fetchai.yoti.YotiMessage.Profiles_Performative)
+            },
+        ),
         "Error_Performative": _reflection.GeneratedProtocolMessageType(
             "Error_Performative",
             (_message.Message,),
@@ -412,11 +3175,53 @@ YotiMessage = _reflection.GeneratedProtocolMessageType(
     },
 )
 _sym_db.RegisterMessage(YotiMessage)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.BlobRef)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.Value)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.List)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.StringValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.IntValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.BoolValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.FloatValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.DateValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.BytesValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.StructValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.ListValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.ProfileInfo.BlobValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.ProfileResults)
+_sym_db.RegisterMessage(YotiMessage.ProfileResults.ProfileResult)
 _sym_db.RegisterMessage(YotiMessage.Get_Profile_Performative)
+_sym_db.RegisterMessage(YotiMessage.Get_Profiles_Performative)
 _sym_db.RegisterMessage(YotiMessage.Profile_Performative)
 _sym_db.RegisterMessage(YotiMessage.Profile_Performative.InfoEntry)
+_sym_db.RegisterMessage(YotiMessage.Profile_Performative.IntValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.Profile_Performative.BoolValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.Profile_Performative.FloatValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.Profile_Performative.DateValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.Profile_Performative.BytesValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.Profile_Performative.StructValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.Profile_Performative.ListValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.Profile_Performative.BlobValuesEntry)
+_sym_db.RegisterMessage(YotiMessage.Profiles_Performative)
 _sym_db.RegisterMessage(YotiMessage.Error_Performative)
 
 
+_YOTIMESSAGE_PROFILEINFO_STRINGVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILEINFO_INTVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILEINFO_BOOLVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILEINFO_FLOATVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILEINFO_DATEVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILEINFO_BYTESVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILEINFO_STRUCTVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILEINFO_LISTVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILEINFO_BLOBVALUESENTRY._options = None
 _YOTIMESSAGE_PROFILE_PERFORMATIVE_INFOENTRY._options = None
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_INTVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BOOLVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_FLOATVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_DATEVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BYTESVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_STRUCTVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_LISTVALUESENTRY._options = None
+_YOTIMESSAGE_PROFILE_PERFORMATIVE_BLOBVALUESENTRY._options = None
 # @@protoc_insertion_point(module_scope)
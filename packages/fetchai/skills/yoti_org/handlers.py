@@ -28,6 +28,7 @@ from aea.skills.base import Handler
 from packages.fetchai.connections.yoti.connection import (
     CONNECTION_ID as YOTI_CONNECTION_ID,
 )
+from packages.fetchai.connections.yoti.connection import ERROR_CODE_UNAVAILABLE
 from packages.fetchai.protocols.http.message import (  # pylint: disable=import-error,no-name-in-module
     HttpMessage,
 )
@@ -88,8 +89,10 @@ class HttpHandler(Handler):
 
         :param http_msg: the message
         """
+        parameters = cast(Parameters, self.context.parameters)
         self.context.logger.info(
-            "received invalid http message={}, unidentified dialogue.".format(http_msg)
+            "received invalid http message=%s, unidentified dialogue.",
+            parameters.truncated(http_msg),
         )
 
     def _handle_request(
@@ -102,15 +105,22 @@ class HttpHandler(Handler):
         :param http_dialogue: the http dialogue
         :return: None
         """
-        self.context.logger.info(
-            "received http request with method={}, url={} and body={!r}".format(
-                http_msg.method, http_msg.url, http_msg.body,
+        parameters = cast(Parameters, self.context.parameters)
+        count = parameters.log_sampler.sample("http_request")
+        if count > 0:
+            self.context.logger.info(
+                "received http request with method=%s, path=%s and body of %d bytes (request %d).",
+                http_msg.method,
+                parameters.truncated(urlparse(http_msg.url).path),
+                len(http_msg.body),
+                count,
             )
-        )
         if http_msg.method == "get":
             self._handle_get(http_msg, http_dialogue)
-        else:
-            self.context.logger.info(f"No handler for request type={http_msg.method}")
+        elif parameters.log_sampler.sample("http_unsupported_method") > 0:
+            self.context.logger.info(
+                "No handler for request type=%s", parameters.truncated(http_msg.method)
+            )
 
     def _handle_get(self, http_msg: HttpMessage, http_dialogue: HttpDialogue) -> None:
         """
@@ -124,10 +134,23 @@ class HttpHandler(Handler):
         query = parse_qs(parsed.query)
         address = cast(List[Optional[str]], query.get("address", [None]))[0]
         token = cast(List[Optional[str]], query.get("token", [None]))[0]
+        attribute = cast(List[Optional[str]], query.get("attribute", [None]))[0]
         parameters = cast(Parameters, self.context.parameters)
         yoti_redirect = parameters.scenario_name in parsed.path
         info = parameters.db.get(address, None) if address is not None else None
-        if not yoti_redirect and address is not None and info is None:
+        if parameters.is_degraded and info is None:
+            http_response = http_dialogue.reply(
+                performative=HttpMessage.Performative.RESPONSE,
+                target_message=http_msg,
+                version=http_msg.version,
+                status_code=503,
+                status_text="Service Unavailable",
+                headers=HEADERS,
+                body=parameters.degraded_html,
+            )
+            self._log_response("degraded", cast(HttpMessage, http_response))
+            self.context.outbox.put_message(message=http_response)
+        elif not yoti_redirect and address is not None and info is None:
             http_response = http_dialogue.reply(
                 performative=HttpMessage.Performative.RESPONSE,
                 target_message=http_msg,
@@ -137,7 +160,32 @@ class HttpHandler(Handler):
                 headers=HEADERS,
                 body=parameters.yoti_button,
             )
-            self.context.logger.info("responding with button html: {}".format(http_response))
+            self._log_response("button", cast(HttpMessage, http_response))
+            self.context.outbox.put_message(message=http_response)
+        elif not yoti_redirect and info is not None and attribute is not None:
+            binary = parameters.get_binary_attribute(info, attribute)
+            if binary is None:
+                http_response = http_dialogue.reply(
+                    performative=HttpMessage.Performative.RESPONSE,
+                    target_message=http_msg,
+                    version=http_msg.version,
+                    status_code=404,
+                    status_text="Not Found",
+                    headers=HEADERS,
+                    body=b"",
+                )
+            else:
+                data, media_type = binary
+                http_response = http_dialogue.reply(
+                    performative=HttpMessage.Performative.RESPONSE,
+                    target_message=http_msg,
+                    version=http_msg.version,
+                    status_code=200,
+                    status_text=STATUS_TEXT,
+                    headers=f"Content-Type: {media_type}",
+                    body=data,
+                )
+            self._log_response("attribute", cast(HttpMessage, http_response))
             self.context.outbox.put_message(message=http_response)
         elif not yoti_redirect and address is not None and info is not None:
             http_response = http_dialogue.reply(
@@ -147,9 +195,9 @@ class HttpHandler(Handler):
                 status_code=200,
                 status_text=STATUS_TEXT,
                 headers=HEADERS,
-                body=parameters.info_html(info),
+                body=parameters.info_html(address, info),
             )
-            self.context.logger.info("responding with info html: {}".format(http_response))
+            self._log_response("info", cast(HttpMessage, http_response))
             self.context.outbox.put_message(message=http_response)
         elif yoti_redirect and address is not None and token is not None:
             http_response = http_dialogue.reply(
@@ -161,19 +209,31 @@ class HttpHandler(Handler):
                 headers=HEADERS,
                 body=parameters.success_html,
             )
-            self.context.logger.info("responding with success html: {}".format(http_response))
+            self._log_response("success", cast(HttpMessage, http_response))
             self.context.outbox.put_message(message=http_response)
             yoti_dialogues = cast(YotiDialogues, self.context.yoti_dialogues)
+            optional_contents = {}
+            if parameters.yoti_attributes is not None:
+                optional_contents["attributes"] = parameters.yoti_attributes
+            if parameters.accept_compression is not None:
+                optional_contents["accept_compression"] = parameters.accept_compression
             yoti_request, yoti_dialogue = yoti_dialogues.create(
                 performative=YotiMessage.Performative.GET_PROFILE,
                 counterparty=str(YOTI_CONNECTION_ID),
                 token=token,
                 dotted_path=parameters.yoti_sdk_dotted_path,
                 args=parameters.yoti_sdk_args,
+                **optional_contents,
             )
             yoti_dialogue = cast(YotiDialogue, yoti_dialogue)
             yoti_dialogue.agent_address = address
-            self.context.logger.info(f"requesting profile from yoti with token={token}")
+            count = parameters.log_sampler.sample("yoti_request")
+            if count > 0:
+                self.context.logger.info(
+                    "requesting profile from yoti for address=%s (request %d).",
+                    parameters.truncated(address),
+                    count,
+                )
             self.context.outbox.put_message(message=yoti_request)
         else:
             http_response = http_dialogue.reply(
@@ -185,9 +245,28 @@ class HttpHandler(Handler):
                 headers=HEADERS,
                 body=parameters.failure_html,
             )
-            self.context.logger.info("responding with failure html: {}".format(http_response))
+            self._log_response("failure", cast(HttpMessage, http_response))
             self.context.outbox.put_message(message=http_response)
 
+    def _log_response(self, kind: str, http_response: HttpMessage) -> None:
+        """
+        Log a Http response, sampled per kind.
+
+        :param kind: the kind of html responded.
+        :param http_response: the http response
+        :return: None
+        """
+        parameters = cast(Parameters, self.context.parameters)
+        count = parameters.log_sampler.sample("http_response_" + kind)
+        if count > 0:
+            self.context.logger.info(
+                "responding with %s html: status_code=%d, body of %d bytes (response %d).",
+                kind,
+                http_response.status_code,
+                len(http_response.body),
+                count,
+            )
+
     def _handle_invalid(
         self, http_msg: HttpMessage, http_dialogue: HttpDialogue
     ) -> None:
@@ -199,9 +278,9 @@ class HttpHandler(Handler):
         :return: None
         """
         self.context.logger.warning(
-            "cannot handle http message of performative={} in dialogue={}.".format(
-                http_msg.performative, http_dialogue
-            )
+            "cannot handle http message of performative=%s in dialogue=%s.",
+            http_msg.performative,
+            http_dialogue.dialogue_label.dialogue_reference,
         )
 
     def teardown(self) -> None:
@@ -256,8 +335,10 @@ class YotiHandler(Handler):
 
         :param yoti_msg: the message
         """
+        parameters = cast(Parameters, self.context.parameters)
         self.context.logger.info(
-            "received invalid yoti message={}, unidentified dialogue.".format(yoti_msg)
+            "received invalid yoti message=%s, unidentified dialogue.",
+            parameters.truncated(yoti_msg),
         )
 
     def _handle_profile(
@@ -270,12 +351,18 @@ class YotiHandler(Handler):
         :param yoti_dialogue: the yoti dialogue
         :return: None
         """
-        self.context.logger.info(
-            "received yoti message={} in dialogue={}.".format(yoti_msg, yoti_dialogue)
-        )
         parameters = cast(Parameters, self.context.parameters)
-        parameters.db[yoti_dialogue.agent_address] = yoti_msg.info
-        self.context.logger.info(f"DB updated: {parameters.db}")
+        parameters.set_profile(yoti_dialogue.agent_address, yoti_msg.info)
+        count = parameters.log_sampler.sample("yoti_profile")
+        if count > 0:
+            self.context.logger.info(
+                "DB updated: address=%s verified with %d attributes in dialogue=%s, %d addresses verified (profile %d).",
+                parameters.truncated(yoti_dialogue.agent_address),
+                len(yoti_msg.info),
+                yoti_dialogue.dialogue_label.dialogue_reference,
+                len(parameters.db),
+                count,
+            )
 
     def _handle_error(
         self, yoti_msg: YotiMessage, yoti_dialogue: YotiDialogue
@@ -287,11 +374,18 @@ class YotiHandler(Handler):
         :param yoti_dialogue: the yoti dialogue
         :return: None
         """
-        self.context.logger.warning(
-            "received yoti error message={} in dialogue={}.".format(
-                yoti_msg.error_msg, yoti_dialogue
+        parameters = cast(Parameters, self.context.parameters)
+        count = parameters.log_sampler.sample(f"yoti_error_{yoti_msg.error_code}")
+        if count > 0:
+            self.context.logger.warning(
+                "received yoti error message=%s with error_code=%d in dialogue=%s (error %d).",
+                parameters.truncated(yoti_msg.error_msg),
+                yoti_msg.error_code,
+                yoti_dialogue.dialogue_label.dialogue_reference,
+                count,
             )
-        )
+        if yoti_msg.error_code == ERROR_CODE_UNAVAILABLE:
+            parameters.mark_degraded()
 
     def _handle_invalid(
         self, yoti_msg: YotiMessage, yoti_dialogue: YotiDialogue
@@ -304,9 +398,9 @@ class YotiHandler(Handler):
         :return: None
         """
         self.context.logger.warning(
-            "cannot handle yoti message of performative={} in dialogue={}.".format(
-                yoti_msg.performative, yoti_dialogue
-            )
+            "cannot handle yoti message of performative=%s in dialogue=%s.",
+            yoti_msg.performative,
+            yoti_dialogue.dialogue_label.dialogue_reference,
         )
 
     def teardown(self) -> None:
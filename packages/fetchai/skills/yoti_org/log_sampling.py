@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This package contains the log sampling of the yoti_org skill."""
+
+from typing import Any, Dict
+
+
+class Truncated:
+    """
+    A log argument formatted only if the record is emitted, cut to a maximum length.
+
+    Pass it as an argument of a %-style log call, so that nothing is
+    formatted for records which are filtered out.
+    """
+
+    __slots__ = ("value", "max_length")
+
+    def __init__(self, value: Any, max_length: int) -> None:
+        """
+        Initialize the argument.
+
+        :param value: the value to log.
+        :param max_length: the maximum number of characters logged.
+        """
+        self.value = value
+        self.max_length = max_length
+
+    def __str__(self) -> str:
+        """Get the value as a string, cut to the maximum length."""
+        text = str(self.value)
+        if len(text) <= self.max_length:
+            return text
+        return "{}...({} chars)".format(text[: self.max_length], len(text))
+
+
+class LogSampler:
+    """
+    Sample the log records of frequent events.
+
+    The first occurrence of each event is logged, then one in every
+    'every' occurrences, so the cost of logging an event does not grow
+    with its rate.
+    """
+
+    def __init__(self, every: int = 1) -> None:
+        """
+        Initialize the sampler.
+
+        :param every: log one in this many occurrences of each event, 1 to log them all.
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1.")
+        self.every = every
+        self._counts: Dict[str, int] = {}
+
+    def sample(self, event: str) -> int:
+        """
+        Count an occurrence of an event and tell whether to log it.
+
+        :param event: the name of the event.
+        :return: the number of occurrences of the event so far if this one is logged, otherwise 0.
+        """
+        count = self._counts.get(event, 0) + 1
+        self._counts[event] = count
+        return count if (count - 1) % self.every == 0 else 0
@@ -19,10 +19,24 @@
 
 """This package contains the models of the yoti_user skill."""
 
-from typing import Dict, Tuple
+import datetime
+import html
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
 
 from aea.skills.base import Model
 
+from packages.fetchai.protocols.yoti.blob_store import (
+    BlobNotFoundError,
+    BlobStore,
+    guess_media_type,
+    iter_blob_refs,
+)
+from packages.fetchai.protocols.yoti.custom_types import BlobRef, ProfileInfo
+from packages.fetchai.skills.yoti_org.log_sampling import LogSampler, Truncated
+
 
 YOTI_BUTTON_SCHEMA = """
 <head>
@@ -65,13 +79,66 @@ token found
 </body>
 """
 
+DEGRADED = """
+<body>
+identity verification is temporarily unavailable, please try again later
+</body>
+"""
+
 INFO = """
 <body>
 info: {info}
 </body>
 """
 
+INFO_ITEM = "<li>{name}: {value}</li>"
+
 VALID_SCENARIO_NAMES = ["age", "identity"]
+DEFAULT_DEGRADED_PERIOD = 30.0
+DEFAULT_LOG_EVERY = 100
+DEFAULT_LOG_MAX_LENGTH = 200
+
+
+def render_value(value: Any) -> str:
+    """
+    Render an attribute value of a profile in html.
+
+    :param value: the value.
+    :return: the html.
+    """
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return f"&lt;{len(value)} bytes&gt;"
+    if isinstance(value, BlobRef):
+        return f"&lt;{html.escape(value.media_type)}, {value.size} bytes&gt;"
+    if isinstance(value, dict):
+        return render_values(value)
+    if isinstance(value, tuple):
+        return "<ul>{}</ul>".format("".join(f"<li>{render_value(element)}</li>" for element in value))
+    return html.escape(str(value))
+
+
+def render_values(values: Dict[str, Any], address: Optional[str] = None) -> str:
+    """
+    Render the attribute values of a profile in html.
+
+    With an address, the binary values link to the page serving them.
+
+    :param values: the values, by name.
+    :param address: the address the profile was shared for, if any.
+    :return: the html.
+    """
+    items = []
+    for name, value in values.items():
+        rendered = render_value(value)
+        if address is not None and isinstance(value, (bytes, BlobRef)):
+            link = "?" + urlencode({"address": address, "attribute": name})
+            rendered = f'<a href="{html.escape(link)}">{rendered}</a>'
+        items.append(INFO_ITEM.format(name=html.escape(name), value=rendered))
+    return "<ul>{}</ul>".format("".join(items))
 
 
 class Parameters(Model):
@@ -90,16 +157,55 @@ class Parameters(Model):
             raise ValueError("yoti_scenario_name not provided.")
         if scenario_name not in VALID_SCENARIO_NAMES:
             raise ValueError(f"Got yoti_scenario_name={scenario_name}, expected one of {VALID_SCENARIO_NAMES}.")
+        degraded_period = kwargs.pop("degraded_period", DEFAULT_DEGRADED_PERIOD)
+        yoti_attributes = kwargs.pop("yoti_attributes", None)
+        log_every = kwargs.pop("log_every", DEFAULT_LOG_EVERY)
+        log_max_length = kwargs.pop("log_max_length", DEFAULT_LOG_MAX_LENGTH)
+        accept_compression = kwargs.pop("accept_compression", None)
         super().__init__(**kwargs)
         self._yoti_button = YOTI_BUTTON_SCHEMA.format(scenario_id=scenario_id, client_sdk_id=client_sdk_id, scenario_name=scenario_name)
         self._scenario_name = scenario_name
+        self._yoti_attributes = tuple(yoti_attributes) if yoti_attributes is not None else None
         self._db = {}  # temporary db mock
+        self._degraded_period = degraded_period
+        self._degraded_until = 0.0
+        self._log_sampler = LogSampler(log_every)
+        self._log_max_length = log_max_length
+        self._blob_stores = {}  # type: Dict[str, BlobStore]
+        self._blob_pins = Counter()  # type: Counter
+        self._accept_compression = tuple(accept_compression) if accept_compression is not None else None
+
+    def teardown(self) -> None:
+        """Unpin the binary attributes the db references, the db being dropped."""
+        for blob_store in self._blob_stores.values():
+            blob_store.release(self.blob_holder)
+        self._blob_stores.clear()
+        self._blob_pins.clear()
+        super().teardown()
 
     @property
-    def db(self) -> Dict[str, Dict[str, str]]:
+    def db(self) -> Dict[str, ProfileInfo]:
         """Get db."""
         return self._db
 
+    def set_profile(self, address: str, info: ProfileInfo) -> None:
+        """
+        Keep the profile info of an address in the db.
+
+        The binary attributes the yoti connection kept out of the info, in its blob store, are pinned there while the db references them, so that the connection does not prune them.
+
+        :param address: the address the profile was shared for.
+        :param info: the profile info.
+        :return: None
+        """
+        for blob_ref in iter_blob_refs(info):
+            self._pin(blob_ref)
+        previous = self._db.get(address)
+        self._db[address] = info
+        if previous is not None:
+            for blob_ref in iter_blob_refs(previous):
+                self._unpin(blob_ref)
+
     @property
     def yoti_button(self) -> bytes:
         """Get yoti button."""
@@ -115,10 +221,81 @@ class Parameters(Model):
         """Get success html."""
         return FAILURE.encode("utf-8")
 
+    @property
+    def degraded_html(self) -> bytes:
+        """Get degraded html."""
+        return DEGRADED.encode("utf-8")
+
+    @property
+    def is_degraded(self) -> bool:
+        """Check whether the yoti connection reported the Yoti API unavailable recently."""
+        return time.monotonic() < self._degraded_until
+
+    def mark_degraded(self) -> None:
+        """Stop requesting profiles for the degraded period."""
+        self._degraded_until = time.monotonic() + self._degraded_period
+
     @staticmethod
-    def info_html(info: Dict[str, str]) -> bytes:
-        """Get no_address html."""
-        return INFO.format(info=info).encode("utf-8")
+    def info_html(address: str, info: ProfileInfo) -> bytes:
+        """Get info html, the binary attributes linking to the page serving them."""
+        return INFO.format(info=render_values(dict(info), address)).encode("utf-8")
+
+    @property
+    def blob_holder(self) -> str:
+        """Get the holder of the pins of the skill in the blob stores."""
+        return f"{self.context.agent_address}/{self.context.skill_id}"
+
+    def _get_blob_store(self, blob_ref: BlobRef) -> BlobStore:
+        """Get the blob store of a reference, releasing the pins a previous run of the skill left in it on first use."""
+        blob_store = self._blob_stores.get(blob_ref.store)
+        if blob_store is None:
+            blob_store = BlobStore.of(blob_ref)
+            blob_store.release(self.blob_holder)
+            self._blob_stores[blob_ref.store] = blob_store
+        return blob_store
+
+    def _pin(self, blob_ref: BlobRef) -> None:
+        """Pin a binary attribute in its blob store, on its first reference by the db."""
+        key = (blob_ref.store, blob_ref.digest)
+        self._blob_pins[key] += 1
+        if self._blob_pins[key] > 1 or blob_ref.store == "":
+            return
+        try:
+            self._get_blob_store(blob_ref).pin(blob_ref, self.blob_holder)
+        except (OSError, ValueError) as e:
+            self.context.logger.warning("could not pin blob=%s: %r", blob_ref.digest, e)
+
+    def _unpin(self, blob_ref: BlobRef) -> None:
+        """Unpin a binary attribute in its blob store, on its last reference by the db."""
+        key = (blob_ref.store, blob_ref.digest)
+        self._blob_pins[key] -= 1
+        if self._blob_pins[key] > 0:
+            return
+        del self._blob_pins[key]
+        if blob_ref.store == "":
+            return
+        try:
+            self._get_blob_store(blob_ref).unpin(blob_ref, self.blob_holder)
+        except (OSError, ValueError) as e:
+            self.context.logger.warning("could not unpin blob=%s: %r", blob_ref.digest, e)
+
+    def get_binary_attribute(self, info: ProfileInfo, name: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Get a binary attribute of a profile, fetching it from the blob store if it was kept out of the message.
+
+        :param info: the profile info.
+        :param name: the name of the attribute.
+        :return: the data and media type of the attribute, None if the profile has no such binary attribute.
+        """
+        value = info.get(name)
+        if isinstance(value, bytes):
+            return value, guess_media_type(value)
+        if not isinstance(value, BlobRef):
+            return None
+        try:
+            return self._get_blob_store(value).get(value), value.media_type
+        except (BlobNotFoundError, ValueError):
+            return None
 
     @property
     def scenario_name(self) -> str:
@@ -134,3 +311,22 @@ class Parameters(Model):
     def yoti_sdk_args(self) -> Tuple[str, ...]:
         """Get args for yoti sdk call."""
         return ("age_over:18",) if self.scenario_name == "age" else ("",)
+
+    @property
+    def yoti_attributes(self) -> Optional[Tuple[str, ...]]:
+        """Get the names of the profile attributes requested, None for all of them."""
+        return self._yoti_attributes
+
+    @property
+    def accept_compression(self) -> Optional[Tuple[str, ...]]:
+        """Get the compressions accepted for the profiles, by order of preference, None for none."""
+        return self._accept_compression
+
+    @property
+    def log_sampler(self) -> LogSampler:
+        """Get the sampler of the log records of frequent events."""
+        return self._log_sampler
+
+    def truncated(self, value: Any) -> Truncated:
+        """Get a log argument formatting a value only if logged, cut to 'log_max_length' characters."""
+        return Truncated(value, self._log_max_length)
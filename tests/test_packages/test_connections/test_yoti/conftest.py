@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the fixtures of the tests of the yoti connection."""
+
+import pytest
+
+from benchmark.fake_yoti_api import generate_test_key
+from benchmark.yoti_connection import StubYotiClient, make_connection
+
+
+@pytest.fixture(scope="session")
+def key_file_path(tmp_path_factory):
+    """Write a Yoti key file."""
+    path = str(tmp_path_factory.mktemp("yoti") / "key.pem")
+    generate_test_key(path, key_size=1024)
+    return path
+
+
+@pytest.fixture
+def connection_factory(key_file_path):
+    """Build yoti connections answering every token with a stub profile."""
+
+    def factory(**config):
+        config.setdefault("yoti_client_sdk_id", "sdk_id")
+        config.setdefault("yoti_key_file_path", key_file_path)
+        config.setdefault("warmup_connections", 0)
+        return make_connection(config, StubYotiClient())
+
+    return factory
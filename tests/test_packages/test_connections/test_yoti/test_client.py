@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the Yoti API clients of the yoti connection."""
+
+from unittest import mock
+
+import pytest
+import yoti_python_sdk
+from yoti_python_sdk.http import SignedRequest
+
+from packages.fetchai.connections.yoti.client import (
+    YOTI_SDK_VERSION,
+    YotiApiError,
+    check_response,
+    check_sdk_version,
+    make_request_handler,
+)
+
+
+def make_request(url: str) -> SignedRequest:
+    """Make an unsigned request to a url."""
+    return SignedRequest(url=url, http_method="GET", headers={}, payload=None)
+
+
+def test_check_response():
+    """Test only the non 2xx statuses raise an API error."""
+    check_response(200, "ok")
+    check_response(204, "")
+    with pytest.raises(YotiApiError) as error:
+        check_response(503, "unavailable")
+    assert error.value.status_code == 503
+    assert error.value.text == "unavailable"
+    assert str(error.value) == "Unsuccessful Yoti API call: 503 unavailable"
+
+
+def test_check_sdk_version(monkeypatch):
+    """Test another version of the SDK than the pinned one is refused."""
+    assert yoti_python_sdk.version.__version__ == YOTI_SDK_VERSION
+    check_sdk_version()
+    monkeypatch.setattr(yoti_python_sdk.version, "__version__", "3.0.0")
+    with pytest.raises(RuntimeError, match="3.0.0"):
+        check_sdk_version()
+
+
+def test_request_handler_redirects_and_raises():
+    """Test the request handler calls the API url and raises on an error status."""
+    session = mock.Mock()
+    session.request.return_value = mock.Mock(
+        status_code=429, text="slow down", headers={}, content=b"slow down"
+    )
+    handler = make_request_handler(
+        timeout=5.0, api_url="http://localhost:8000", session=session
+    )
+    with pytest.raises(YotiApiError) as error:
+        handler.execute(make_request(yoti_python_sdk.YOTI_API_ENDPOINT + "/profile"))
+    assert error.value.status_code == 429
+    kwargs = session.request.call_args[1]
+    assert kwargs["url"] == "http://localhost:8000/profile"
+    assert kwargs["timeout"] == 5.0
+
+    session.request.return_value = mock.Mock(
+        status_code=200, text="{}", headers={}, content=b"{}"
+    )
+    response = handler.execute(make_request("http://elsewhere/profile"))
+    assert response.status_code == 200
+    assert session.request.call_args[1]["url"] == "http://elsewhere/profile"
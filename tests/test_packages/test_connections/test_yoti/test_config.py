@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the configuration of the yoti connection."""
+
+import pytest
+
+from packages.fetchai.connections.yoti.config import (
+    CLIENT_MODE_ASYNC,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_REQUEST_TIMEOUT,
+    YotiConnectionConfig,
+)
+
+
+def make_config(**config):
+    """Make the configuration of a connection with one client."""
+    config.setdefault("yoti_client_sdk_id", "sdk_id")
+    config.setdefault("yoti_key_file_path", "key.pem")
+    return YotiConnectionConfig(config)
+
+
+def test_defaults():
+    """Test the settings not configured take their default."""
+    config = make_config()
+    assert config.max_workers == DEFAULT_MAX_WORKERS
+    assert config.metrics_port is None
+    assert [client.name for client in config.clients] == ["sdk_id"]
+
+
+def test_drain_timeout_defaults_to_the_request_timeout():
+    """Test the requests in progress are waited for on disconnect by default."""
+    assert make_config().drain_timeout == DEFAULT_REQUEST_TIMEOUT
+    assert make_config(request_timeout=5.0).drain_timeout == 5.0
+    assert make_config(request_timeout=None).drain_timeout == DEFAULT_REQUEST_TIMEOUT
+    assert make_config(request_timeout=5.0, drain_timeout=0).drain_timeout == 0
+
+
+def test_missing_client():
+    """Test a connection without a client is refused."""
+    with pytest.raises(ValueError, match="Missing configuration"):
+        YotiConnectionConfig({"yoti_client_sdk_id": "sdk_id"})
+    with pytest.raises(ValueError, match="Missing configuration"):
+        YotiConnectionConfig({"yoti_clients": []})
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("max_workers", 0),
+        ("max_queue_size", -1),
+        ("request_timeout", 0),
+        ("rate_limit", 0.0),
+        ("rate_limit_burst", 0),
+        ("retry_max_attempts", 0),
+        ("retry_base_delay", -0.1),
+        ("blob_prune_interval", 0),
+        ("metrics_port", 65536),
+        ("max_batch_size", 0),
+    ],
+)
+def test_out_of_range(name, value):
+    """Test the values out of range are refused."""
+    with pytest.raises(ValueError, match=name):
+        make_config(**{name: value})
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("max_workers", "10"),
+        ("max_workers", 1.5),
+        ("max_workers", True),
+        ("drain_timeout", "1"),
+        ("stateless_dialogues", 1),
+        ("thread_name_prefix", None),
+    ],
+)
+def test_wrong_type(name, value):
+    """Test the values of the wrong type are refused."""
+    with pytest.raises(ValueError, match=name):
+        make_config(**{name: value})
+
+
+def test_floats_accept_integers():
+    """Test the float settings accept integers, as written in yaml."""
+    assert make_config(request_timeout=5).request_timeout == 5
+
+
+def test_client_mode():
+    """Test the client mode is checked, with its crypto processes."""
+    with pytest.raises(ValueError, match="client_mode"):
+        make_config(client_mode="threads")
+    with pytest.raises(ValueError, match="crypto_processes"):
+        make_config(crypto_processes=2)
+    assert (
+        make_config(client_mode=CLIENT_MODE_ASYNC, crypto_processes=2).crypto_processes
+        == 2
+    )
+
+
+def test_clients_override_the_connection():
+    """Test each client can override the settings of the connection."""
+    config = YotiConnectionConfig(
+        {
+            "yoti_api_url": "http://api",
+            "rate_limit": 10,
+            "yoti_clients": [
+                {
+                    "yoti_client_sdk_id": "a",
+                    "yoti_key_file_path": "a.pem",
+                    "scenarios": ["age"],
+                },
+                {
+                    "yoti_client_sdk_id": "b",
+                    "yoti_key_file_path": "b.pem",
+                    "name": "b_app",
+                    "yoti_api_url": "http://other",
+                    "rate_limit": None,
+                },
+            ],
+        }
+    )
+    first, second = config.clients
+    assert (first.name, first.api_url, first.rate_limit) == ("a", "http://api", 10)
+    assert first.scenarios == ["age"]
+    assert (second.name, second.api_url, second.rate_limit) == (
+        "b_app",
+        "http://other",
+        None,
+    )
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the yoti connection."""
+
+import asyncio
+
+import pytest
+
+from aea.mail.base import Envelope
+
+from packages.fetchai.connections.yoti.client import YotiApiError
+from packages.fetchai.connections.yoti.connection import (
+    CONNECTION_ID,
+    ERROR_CODE_BAD_GATEWAY,
+    ERROR_CODE_INTERNAL,
+    ERROR_CODE_UNAVAILABLE,
+    TrustedYotiMessage,
+    YotiDialogues,
+    YotiRequestDispatcher,
+)
+from packages.fetchai.protocols.yoti.custom_types import ProfileInfo
+from packages.fetchai.protocols.yoti.message import YotiMessage
+
+from benchmark.yoti_connection import AGENT_ADDRESS, AgentDialogues, StubYotiClient
+
+
+def make_envelope(dialogues: AgentDialogues, token: str, **contents) -> Envelope:
+    """Make the envelope of a 'get_profile' request."""
+    message, _ = dialogues.create(
+        counterparty=str(CONNECTION_ID),
+        performative=YotiMessage.Performative.GET_PROFILE,
+        token=token,
+        dotted_path="",
+        args=(),
+        **contents
+    )
+    return Envelope(
+        to=str(CONNECTION_ID),
+        sender=AGENT_ADDRESS,
+        protocol_id=message.protocol_id,
+        message=message,
+    )
+
+
+class FlakyYotiClient(StubYotiClient):
+    """Stub client failing with the given status codes before answering."""
+
+    def __init__(self, *status_codes: int) -> None:
+        """Initialize the client."""
+        super().__init__()
+        self.status_codes = list(status_codes)
+        self.calls = 0
+
+    async def get_activity_details(self, encrypted_request_token: str):
+        """Fail with the next status code, if any, or answer."""
+        self.calls += 1
+        if self.status_codes:
+            raise YotiApiError(self.status_codes.pop(0), "error")
+        return await super().get_activity_details(encrypted_request_token)
+
+
+async def request_profile(connection, token: str = "token", **contents) -> YotiMessage:
+    """Send a 'get_profile' request and receive its reply."""
+    await connection.send(make_envelope(AgentDialogues(), token, **contents))
+    envelope = await asyncio.wait_for(connection.receive(), 5)
+    return envelope.message
+
+
+def run_with_client(connection_factory, client, func, **config):
+    """Run a coroutine function on a connected connection using a client."""
+    config.setdefault("retry_base_delay", 0.0)
+    config.setdefault("token_cache_ttl", 0.0)
+
+    async def run():
+        connection = connection_factory(**config)
+        for member in connection.clients.members:
+            member.client = client
+        await connection.connect()
+        try:
+            return await func(connection)
+        finally:
+            await connection.disconnect()
+
+    return asyncio.run(run())
+
+
+def test_transient_failures_are_retried(connection_factory):
+    """Test throttling and server errors are retried until the call succeeds."""
+    client = FlakyYotiClient(429, 503)
+    reply = run_with_client(
+        connection_factory, client, request_profile, retry_max_attempts=3
+    )
+    assert reply.performative == YotiMessage.Performative.PROFILE
+    assert client.calls == 3
+
+
+def test_retries_are_bounded(connection_factory):
+    """Test a transient failure outlasting the retries is answered with 502."""
+    client = FlakyYotiClient(503, 503, 503)
+    reply = run_with_client(
+        connection_factory, client, request_profile, retry_max_attempts=2
+    )
+    assert reply.performative == YotiMessage.Performative.ERROR
+    assert reply.error_code == ERROR_CODE_BAD_GATEWAY
+    assert client.calls == 2
+
+
+def test_client_errors_are_not_retried(connection_factory):
+    """Test a failure which is not transient is answered straight away."""
+    client = FlakyYotiClient(400)
+    reply = run_with_client(connection_factory, client, request_profile)
+    assert reply.performative == YotiMessage.Performative.ERROR
+    assert reply.error_code == ERROR_CODE_INTERNAL
+    assert client.calls == 1
+
+
+def test_open_circuit_refuses_calls(connection_factory):
+    """Test the requests are refused once the circuit opens."""
+    client = FlakyYotiClient(503, 503)
+
+    async def run(connection):
+        first = await request_profile(connection, "first")
+        second = await request_profile(connection, "second")
+        return first, second
+
+    first, second = run_with_client(
+        connection_factory,
+        client,
+        run,
+        retry_max_attempts=2,
+        circuit_failure_threshold=2,
+    )
+    assert first.error_code == ERROR_CODE_BAD_GATEWAY
+    assert second.error_code == ERROR_CODE_UNAVAILABLE
+    assert client.calls == 2
+
+
+@pytest.mark.parametrize("stateless_dialogues", [False, True])
+def test_failed_task_is_answered(connection_factory, monkeypatch, stateless_dialogues):
+    """Test a request whose task raises is answered with an error reply."""
+
+    async def fail(self, func, message, dialogue):
+        raise KeyError("bug")
+
+    monkeypatch.setattr(YotiRequestDispatcher, "run_async", fail)
+
+    async def run():
+        connection = connection_factory(stateless_dialogues=stateless_dialogues)
+        await connection.connect()
+        try:
+            dialogues = AgentDialogues()
+            await connection.send(make_envelope(dialogues, "token"))
+            envelope = await asyncio.wait_for(connection.receive(), 5)
+            assert connection.pending_requests == 0
+            assert connection.open_dialogues == 0
+            return envelope, dialogues
+        finally:
+            await connection.disconnect()
+
+    envelope, dialogues = asyncio.run(run())
+    reply = envelope.message
+    assert envelope.to == AGENT_ADDRESS
+    assert reply.performative == YotiMessage.Performative.ERROR
+    assert reply.error_code == ERROR_CODE_INTERNAL
+    assert "KeyError" in reply.error_msg
+    assert dialogues.update(reply) is not None
+
+
+def test_dialogues_are_forgotten_once_answered(connection_factory):
+    """Test the connection keeps track of a dialogue only until it replies."""
+    client = StubYotiClient(latency=0.05)
+
+    async def run(connection):
+        dialogues = AgentDialogues()
+        for token in ("first", "second"):
+            await connection.send(make_envelope(dialogues, token))
+        assert connection.open_dialogues == 2
+        for _ in range(2):
+            envelope = await asyncio.wait_for(connection.receive(), 5)
+            assert dialogues.update(envelope.message) is not None
+        return connection.open_dialogues
+
+    assert run_with_client(connection_factory, client, run) == 0
+
+
+def test_disconnect_waits_for_the_requests_in_progress(connection_factory):
+    """Test disconnect lets the requests in progress finish by default."""
+    client = StubYotiClient(latency=0.1)
+
+    async def run():
+        connection = connection_factory(token_cache_ttl=0.0)
+        for member in connection.clients.members:
+            member.client = client
+        await connection.connect()
+        await connection.send(make_envelope(AgentDialogues(), "token"))
+        tasks = list(connection.receiving_tasks)
+        await connection.disconnect()
+        return tasks
+
+    tasks = asyncio.run(run())
+    assert len(tasks) == 1
+    assert not tasks[0].cancelled()
+
+
+def test_drain_delivers_the_replies(connection_factory):
+    """Test the replies of a drained connection are still received."""
+    client = StubYotiClient(latency=0.1)
+
+    async def run(connection):
+        await connection.send(make_envelope(AgentDialogues(), "first"))
+        in_progress = await connection.drain()
+        reply = await asyncio.wait_for(connection.receive(), 5)
+        await connection.send(make_envelope(AgentDialogues(), "second"))
+        refused = await asyncio.wait_for(connection.receive(), 5)
+        return in_progress, reply.message, refused.message
+
+    in_progress, reply, refused = run_with_client(connection_factory, client, run)
+    assert in_progress == 0
+    assert reply.performative == YotiMessage.Performative.PROFILE
+    assert refused.performative == YotiMessage.Performative.ERROR
+    assert refused.error_code == ERROR_CODE_UNAVAILABLE
+
+
+def test_trusted_messages_only_skip_the_info_checks():
+    """Test the replies of the connection skip the checks of the info values only."""
+    info = ProfileInfo({"age": object()})
+    assert YotiDialogues().message_class is TrustedYotiMessage
+    trusted = TrustedYotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=("starter", "responder"),
+        message_id=2,
+        target=1,
+        info=info,
+    )
+    assert trusted._is_consistent()
+    wrong_target = TrustedYotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=("starter", "responder"),
+        message_id=2,
+        target=2,
+        info=info,
+    )
+    assert not wrong_target._is_consistent()
+
+
+def test_reply_compression(connection_factory):
+    """Test the reply sets the first compression accepted and available, with the minimum size configured."""
+
+    async def request(connection):
+        return (
+            await request_profile(connection, accept_compression=("brotli", "zlib")),
+            await request_profile(connection, accept_compression=("brotli",)),
+            await request_profile(connection),
+        )
+
+    accepted, not_available, not_accepted = run_with_client(
+        connection_factory, StubYotiClient(), request, compression_min_size=1024
+    )
+    assert accepted.performative == YotiMessage.Performative.PROFILE
+    assert accepted.compression == "zlib"
+    assert accepted.compression_min_size == 1024
+    for reply in (not_available, not_accepted):
+        assert reply.performative == YotiMessage.Performative.PROFILE
+        assert not reply.is_set("compression")
+        assert not reply.is_set("compression_min_size")
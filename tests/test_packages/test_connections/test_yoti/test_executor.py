@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the bounded worker pool of the yoti connection."""
+
+import threading
+
+import pytest
+
+from packages.fetchai.connections.yoti.executor import (
+    BoundedThreadPoolExecutor,
+    WorkerPoolFullError,
+)
+
+
+def test_invalid_sizes():
+    """Test the pool rejects a size of no workers or a negative queue."""
+    with pytest.raises(ValueError):
+        BoundedThreadPoolExecutor(max_workers=0, max_queue_size=1)
+    with pytest.raises(ValueError):
+        BoundedThreadPoolExecutor(max_workers=1, max_queue_size=-1)
+
+
+def test_full_pool_rejects_calls():
+    """Test the calls beyond the workers and the queue are rejected."""
+    executor = BoundedThreadPoolExecutor(
+        max_workers=1, max_queue_size=1, thread_name_prefix="test_yoti"
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    def block() -> str:
+        started.set()
+        release.wait(5)
+        return threading.current_thread().name
+
+    try:
+        running = executor.submit(block)
+        assert started.wait(5)
+        queued = executor.submit(lambda: 42)
+        assert executor.active == 1
+        assert executor.queued == 1
+        assert executor.saturation == 1.0
+        with pytest.raises(WorkerPoolFullError):
+            executor.submit(lambda: None)
+        release.set()
+        assert running.result(5).startswith("test_yoti")
+        assert queued.result(5) == 42
+    finally:
+        release.set()
+        executor.shutdown(wait=True)
+    assert executor.active == 0
+    assert executor.queued == 0
+    assert executor.saturation == 0.0
+
+
+def test_failed_call_releases_its_slot():
+    """Test a call raising an exception frees its slot."""
+    executor = BoundedThreadPoolExecutor(max_workers=1, max_queue_size=0)
+
+    def fail() -> None:
+        raise RuntimeError("failed")
+
+    try:
+        with pytest.raises(RuntimeError):
+            executor.submit(fail).result(5)
+        assert executor.submit(lambda: 1).result(5) == 1
+    finally:
+        executor.shutdown(wait=True)
+    assert executor.saturation == 0.0
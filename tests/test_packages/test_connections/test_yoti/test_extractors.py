@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the profile extractors of the yoti connection."""
+
+import datetime
+
+import pytest
+from yoti_python_sdk.document_details import DocumentDetails
+from yoti_python_sdk.image import Image
+from yoti_python_sdk.protobuf.protobuf import Protobuf
+
+from packages.fetchai.connections.yoti.extractors import (
+    ExtractorRegistry,
+    UnknownDottedPathError,
+    attribute_value,
+    to_attribute_value,
+)
+
+
+class Anchor:
+    """A source or verifier of a stub attribute."""
+
+    def __init__(self, value: str) -> None:
+        """Initialize the anchor."""
+        self.value = value
+
+
+class Attribute:
+    """An attribute of a stub profile."""
+
+    def __init__(self, name, value) -> None:
+        """Initialize the attribute."""
+        self.name = name
+        self.value = value
+        self.sources = [Anchor("PASSPORT")]
+        self.verifiers = [Anchor("YOTI_ADMIN"), Anchor("PASSPORT_NFC")]
+
+
+class Profile:
+    """A stub profile."""
+
+    def __init__(self, **values) -> None:
+        """Initialize the profile."""
+        self.attributes = {
+            name: Attribute(name, value) for name, value in values.items()
+        }
+
+    def get_attribute(self, name):
+        """Get an attribute."""
+        return self.attributes.get(name)
+
+    @property
+    def given_names(self):
+        """Get the given names."""
+        return self.attributes.get("given_names")
+
+
+def make_profile() -> Profile:
+    """Make a profile with attributes of various types."""
+    return Profile(
+        given_names="Jane",
+        date_of_birth="1990-02-03",
+        **{"age_over:18": "true", "age_under:16": "false"}
+    )
+
+
+def test_attribute_values_are_typed():
+    """Test dates of birth and age verifications become dates and booleans."""
+    profile = make_profile()
+    assert attribute_value(profile.attributes["date_of_birth"]) == datetime.date(
+        1990, 2, 3
+    )
+    assert attribute_value(profile.attributes["age_over:18"]) is True
+    assert attribute_value(profile.attributes["age_under:16"]) is False
+    assert attribute_value(Attribute("date_of_birth", "unknown")) == "unknown"
+
+
+def test_sdk_values_are_converted():
+    """Test images, document details, mappings and sequences are converted."""
+    image = Image(b"\xff\xd8image", Protobuf.CT_JPEG)
+    document = DocumentDetails("PASSPORT GBR 01234567 2030-01-01")
+    assert to_attribute_value(image) == b"\xff\xd8image"
+    assert to_attribute_value([image, "a"]) == (b"\xff\xd8image", "a")
+    assert to_attribute_value({"a": 1, "b": None, 3: {"c": 2.5}}) == {
+        "a": 1,
+        "3": {"c": 2.5},
+    }
+    assert to_attribute_value(document) == {
+        "document_type": "PASSPORT",
+        "issuing_country": "GBR",
+        "document_number": "01234567",
+        "expiration_date": datetime.date(2030, 1, 1),
+    }
+    assert to_attribute_value(None) == "None"
+
+
+def test_empty_dotted_path_extracts_attributes():
+    """Test an empty dotted path extracts all the attributes, or the ones asked for."""
+    registry = ExtractorRegistry()
+    profile = make_profile()
+    assert registry.get("", ())(profile) == {
+        "given_names": "Jane",
+        "date_of_birth": datetime.date(1990, 2, 3),
+        "age_over:18": True,
+        "age_under:16": False,
+    }
+    extract = registry.get("", (), ("age_over:18", "selfie"))
+    assert extract(profile) == {"age_over:18": True}
+
+
+def test_dotted_path_describes_an_attribute():
+    """Test a dotted path, with or without args, describes the attribute it leads to."""
+    registry = ExtractorRegistry()
+    profile = make_profile()
+    expected = {
+        "name": "given_names",
+        "value": "Jane",
+        "sources": "PASSPORT",
+        "verifiers": "YOTI_ADMIN,PASSPORT_NFC",
+    }
+    assert registry.get("given_names", ())(profile) == expected
+    assert registry.get("get_attribute", ("given_names",))(profile) == expected
+
+
+@pytest.mark.parametrize(
+    "dotted_path", ["unknown", "_Profile__attributes", "given_names.__class__", "a b"]
+)
+def test_unknown_dotted_paths_are_rejected(dotted_path):
+    """Test the dotted paths not starting with a public profile member are rejected."""
+    with pytest.raises(UnknownDottedPathError):
+        ExtractorRegistry().get(dotted_path, ())
+
+
+def test_allowed_dotted_paths():
+    """Test only the allowed dotted paths are accepted, when given."""
+    registry = ExtractorRegistry(allowed_dotted_paths=["", "get_attribute"])
+    registry.get("", ())
+    registry.get("get_attribute", ("given_names",))
+    with pytest.raises(UnknownDottedPathError):
+        registry.get("given_names", ())
+
+
+def test_extractors_are_compiled_once_and_bounded():
+    """Test an extractor is reused for the same request and the oldest is dropped."""
+    registry = ExtractorRegistry(max_size=2)
+    first = registry.get("", ())
+    assert registry.get("", ()) is first
+    registry.get("get_attribute", ("given_names",))
+    registry.get("", ())
+    registry.get("given_names", ())
+    assert len(registry) == 2
+    assert registry.get("", ()) is first
+    assert registry.get("get_attribute", ("given_names",)) is not None
+    assert len(registry) == 2
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the metrics of the yoti connection."""
+
+import asyncio
+from urllib.request import urlopen
+
+from tests.test_packages.test_connections.test_yoti.test_connection import (
+    FlakyYotiClient,
+    request_profile,
+    run_with_client,
+)
+
+
+def test_requests_and_errors_are_counted(connection_factory):
+    """Test the metrics of a connection count its requests and errors."""
+    client = FlakyYotiClient(400)
+
+    async def run(connection):
+        await request_profile(connection, "first")
+        await request_profile(connection, "second")
+        return connection.metrics.registry
+
+    registry = run_with_client(connection_factory, client, run)
+    assert (
+        registry.get_sample_value(
+            "yoti_connection_requests_total", {"performative": "get_profile"}
+        )
+        == 2
+    )
+    assert (
+        registry.get_sample_value("yoti_connection_errors_total", {"code": "500"}) == 1
+    )
+    assert (
+        registry.get_sample_value(
+            "yoti_connection_request_duration_seconds_count",
+            {"performative": "get_profile"},
+        )
+        == 2
+    )
+
+
+def test_connections_have_their_own_registry(connection_factory):
+    """Test the metrics of a connection are not shared with the others."""
+    first = connection_factory()
+    second = connection_factory()
+    assert first.metrics.registry is not second.metrics.registry
+
+
+def test_metrics_are_served_over_http(connection_factory):
+    """Test the metrics are served while the connection is connected."""
+    client = FlakyYotiClient()
+
+    async def run(connection):
+        await request_profile(connection)
+        url = f"http://127.0.0.1:{connection.metrics_server.port}/metrics"
+        response = await asyncio.get_event_loop().run_in_executor(
+            None, lambda: urlopen(url, timeout=5).read()
+        )
+        return connection, response.decode("utf-8")
+
+    connection, text = run_with_client(connection_factory, client, run, metrics_port=0)
+    assert 'yoti_connection_requests_total{performative="get_profile"} 1.0' in text
+    assert "yoti_connection_in_flight_requests" in text
+    assert connection.metrics_server.port == 0
+
+
+def test_metrics_are_not_served_by_default(connection_factory):
+    """Test no metrics server is made without a metrics port."""
+    assert connection_factory().metrics_server is None
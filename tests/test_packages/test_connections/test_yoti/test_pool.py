@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the pool of Yoti clients of the yoti connection."""
+
+import pytest
+
+from packages.fetchai.connections.yoti.pool import (
+    PooledClient,
+    UnknownScenarioError,
+    YotiClientPool,
+)
+from packages.fetchai.connections.yoti.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+from benchmark.yoti_connection import StubYotiClient
+
+
+def make_member(name, scenarios=None, failure_threshold=1):
+    """Make a pooled client with a stub client."""
+    return PooledClient(
+        name=name,
+        client=StubYotiClient(),
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=failure_threshold, reset_timeout=60.0
+        ),
+        scenarios=scenarios,
+    )
+
+
+def test_pool_needs_clients():
+    """Test a pool without clients is refused."""
+    with pytest.raises(ValueError):
+        YotiClientPool([])
+
+
+def test_names_are_unique():
+    """Test a pool with two clients of the same name is refused."""
+    with pytest.raises(ValueError):
+        YotiClientPool([make_member("a"), make_member("a")])
+
+
+def test_requests_are_routed_by_scenario():
+    """Test a request goes to the clients listing its scenario."""
+    age = make_member("age", scenarios=["age"])
+    identity = make_member("identity", scenarios=["identity"])
+    default = make_member("default")
+    pool = YotiClientPool([age, identity, default])
+    assert pool.get_candidates("age") == [age]
+    assert pool.get_candidates("identity") == [identity]
+    assert pool.get_candidates("unknown") == [default]
+    assert pool.get_candidates() == [default]
+
+
+def test_unknown_scenario_without_default():
+    """Test a request no client serves is refused."""
+    pool = YotiClientPool([make_member("age", scenarios=["age"])])
+    with pytest.raises(UnknownScenarioError):
+        pool.get_candidates("identity")
+    with pytest.raises(UnknownScenarioError):
+        pool.acquire()
+
+
+def test_least_outstanding_client_is_picked():
+    """Test a call goes to the client with the fewest calls in progress."""
+    first, second = make_member("first"), make_member("second")
+    pool = YotiClientPool([first, second])
+    picked = [pool.acquire() for _ in range(4)]
+    assert first.outstanding == second.outstanding == 2
+    assert pool.outstanding == 4
+    pool.release(picked[0])
+    assert pool.acquire() is picked[0]
+
+
+def test_ties_take_turns():
+    """Test the clients take turns when none has calls in progress."""
+    first, second = make_member("first"), make_member("second")
+    pool = YotiClientPool([first, second])
+    picked = []
+    for _ in range(4):
+        member = pool.acquire()
+        pool.release(member)
+        picked.append(member.name)
+    assert set(picked[:2]) == {"first", "second"}
+    assert picked[2:] == picked[:2]
+
+
+def test_open_circuits_are_skipped():
+    """Test the clients whose circuit is open are skipped."""
+    first, second = make_member("first"), make_member("second")
+    pool = YotiClientPool([first, second])
+    first.circuit_breaker.on_failure()
+    for _ in range(3):
+        member = pool.acquire()
+        assert member is second
+        pool.release(member)
+    second.circuit_breaker.on_failure()
+    with pytest.raises(CircuitOpenError):
+        pool.acquire()
+    assert pool.outstanding == 0
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the rate limiter of the yoti connection."""
+
+import asyncio
+
+import pytest
+
+from packages.fetchai.connections.yoti.rate_limiter import TokenBucket
+
+
+class Clock:
+    """A clock moved by hand."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the time."""
+        return self.now
+
+
+def test_invalid_parameters():
+    """Test the bucket rejects a rate or a burst which cannot hand out tokens."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_burst_then_waits_in_order():
+    """Test the burst is handed out straight away and later callers wait in turn."""
+    bucket = TokenBucket(rate=100.0, burst=2, clock=Clock())
+
+    async def run():
+        return await asyncio.gather(*[bucket.acquire() for _ in range(4)])
+
+    delays = asyncio.run(run())
+    assert delays == pytest.approx([0.0, 0.0, 0.01, 0.02])
+    assert bucket.acquired == 4
+    assert bucket.delayed == 2
+    assert bucket.waiting == 0
+    assert bucket.max_wait_time == pytest.approx(0.02)
+    assert bucket.mean_wait_time == pytest.approx(0.0075)
+
+
+def test_refill_is_capped_at_burst():
+    """Test the bucket refills with time, up to the burst."""
+    clock = Clock()
+    bucket = TokenBucket(rate=1.0, burst=2, clock=clock)
+
+    async def run():
+        await bucket.acquire()
+        await bucket.acquire()
+        clock.now = 100.0
+        return [await bucket.acquire() for _ in range(2)]
+
+    assert asyncio.run(run()) == [0.0, 0.0]
+    assert bucket.delayed == 0
+
+
+def test_cancelled_waiter_gives_its_token_back():
+    """Test a caller cancelled while waiting does not delay the next ones."""
+    bucket = TokenBucket(rate=10.0, burst=1, clock=Clock())
+
+    async def run():
+        await bucket.acquire()
+        waiter = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0)
+        assert bucket.waiting == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await bucket.acquire()
+
+    assert asyncio.run(run()) == pytest.approx(0.1)
+    assert bucket.waiting == 0
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the retry policy and circuit breaker of the yoti connection."""
+
+import asyncio
+
+import pytest
+import requests
+
+from packages.fetchai.connections.yoti.client import YotiApiError
+from packages.fetchai.connections.yoti.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    get_http_status,
+    is_retryable,
+)
+
+
+class Clock:
+    """A clock moved by hand."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the time."""
+        return self.now
+
+
+@pytest.mark.parametrize(
+    "status_code, retryable",
+    [(400, False), (401, False), (404, False), (429, True), (500, True), (503, True)],
+)
+def test_is_retryable_by_status(status_code, retryable):
+    """Test the API errors are classified from their status code."""
+    error = YotiApiError(status_code, "error")
+    assert get_http_status(error) == status_code
+    assert is_retryable(error) is retryable
+
+
+def test_message_text_is_not_a_status():
+    """Test an error only worded like an API error has no status."""
+    error = RuntimeError("Unsuccessful Yoti API call: 503 unavailable")
+    assert get_http_status(error) is None
+    assert not is_retryable(error)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        asyncio.TimeoutError(),
+        ConnectionResetError(),
+        requests.ConnectionError(),
+        requests.Timeout(),
+    ],
+)
+def test_transport_errors_are_retryable(error):
+    """Test connection failures and timeouts are retried."""
+    assert get_http_status(error) is None
+    assert is_retryable(error)
+
+
+def test_other_errors_are_not_retryable():
+    """Test an error unrelated to the transport is not retried."""
+    assert not is_retryable(ValueError("Could not decrypt token."))
+
+
+def test_retry_delays_are_capped_and_jittered():
+    """Test the backoff doubles up to its cap and is scaled by the jitter."""
+    policy = RetryPolicy(
+        max_attempts=5, base_delay=0.1, max_delay=0.3, rand=lambda: 1.0
+    )
+    assert [policy.get_delay(attempt) for attempt in range(1, 5)] == pytest.approx(
+        [0.1, 0.2, 0.3, 0.3]
+    )
+    policy = RetryPolicy(base_delay=0.1, rand=lambda: 0.5)
+    assert policy.get_delay(2) == pytest.approx(0.1)
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_circuit_opens_after_consecutive_failures():
+    """Test the circuit opens after the threshold of consecutive failures."""
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=clock)
+    breaker.on_failure()
+    breaker.on_success()
+    breaker.on_failure()
+    assert breaker.state == CircuitBreaker.State.CLOSED
+    breaker.on_failure()
+    assert breaker.state == CircuitBreaker.State.OPEN
+    clock.now = 4.0
+    assert breaker.retry_after == pytest.approx(6.0)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_circuit_closes_after_trial_calls():
+    """Test the circuit closes once all the trial calls succeed."""
+    clock = Clock()
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=10.0, half_open_max_calls=2, clock=clock
+    )
+    breaker.on_failure()
+    clock.now = 10.0
+    assert breaker.state == CircuitBreaker.State.HALF_OPEN
+    assert breaker.retry_after == 0.0
+    breaker.before_call()
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.on_success()
+    assert breaker.state == CircuitBreaker.State.HALF_OPEN
+    breaker.on_success()
+    assert breaker.state == CircuitBreaker.State.CLOSED
+    breaker.before_call()
+
+
+def test_half_open_circuit_reopens_on_failure():
+    """Test a failed trial call opens the circuit again, and a neutral one frees its slot."""
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+    breaker.on_failure()
+    clock.now = 10.0
+    breaker.before_call()
+    breaker.on_neutral()
+    breaker.before_call()
+    breaker.on_failure()
+    assert breaker.state == CircuitBreaker.State.OPEN
+    assert breaker.retry_after == pytest.approx(10.0)
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the request coalescing of the yoti connection."""
+
+import asyncio
+
+import pytest
+
+from packages.fetchai.connections.yoti.single_flight import SingleFlight
+
+
+class Clock:
+    """A clock moved by hand."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the time."""
+        return self.now
+
+
+class Counter:
+    """A call counting how many times it was made."""
+
+    def __init__(self, result="result", exception=None, delay=0.01) -> None:
+        """Initialize the call."""
+        self.calls = 0
+        self.result = result
+        self.exception = exception
+        self.delay = delay
+
+    async def __call__(self):
+        """Make the call."""
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+
+def test_concurrent_calls_are_coalesced():
+    """Test concurrent calls for the same key make a single call."""
+    single_flight = SingleFlight()
+    call = Counter()
+
+    async def run():
+        results = await asyncio.gather(
+            *[single_flight.do("token", call) for _ in range(5)]
+        )
+        other = await single_flight.do("other", call)
+        return results, other
+
+    results, other = asyncio.run(run())
+    assert results == ["result"] * 5
+    assert other == "result"
+    assert call.calls == 2
+    assert single_flight.in_flight == 0
+    assert single_flight.cached == 0
+
+
+def test_outcome_is_kept_for_ttl():
+    """Test a later call gets the kept outcome until it expires."""
+    clock = Clock()
+    single_flight = SingleFlight(ttl=10.0, max_size=2, clock=clock)
+    call = Counter()
+
+    async def run():
+        await single_flight.do("token", call)
+        clock.now = 9.0
+        await single_flight.do("token", call)
+        assert call.calls == 1
+        clock.now = 10.0
+        await single_flight.do("token", call)
+        assert call.calls == 2
+
+    asyncio.run(run())
+
+
+def test_outcomes_are_bounded():
+    """Test the oldest outcome is dropped beyond the maximum size."""
+    single_flight = SingleFlight(ttl=60.0, max_size=2)
+    call = Counter(delay=0)
+
+    async def run():
+        for key in ("a", "b", "c"):
+            await single_flight.do(key, call)
+        assert single_flight.cached == 2
+        await single_flight.do("a", call)
+        assert call.calls == 4
+        await single_flight.do("c", call)
+        assert call.calls == 4
+
+    asyncio.run(run())
+
+
+def test_kept_failures_are_copies():
+    """Test a kept failure is raised as a copy, unless it is not cacheable."""
+    single_flight = SingleFlight(
+        ttl=60.0, max_size=2, is_cacheable=lambda e: not isinstance(e, KeyError)
+    )
+    failing = Counter(exception=ValueError("used token"), delay=0)
+    transient = Counter(exception=KeyError("transient"), delay=0)
+
+    async def run():
+        raised = []
+        for _ in range(3):
+            with pytest.raises(ValueError) as error:
+                await single_flight.do("used", failing)
+            raised.append(error.value)
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                await single_flight.do("transient", transient)
+        return raised
+
+    raised = asyncio.run(run())
+    assert failing.calls == 1
+    assert transient.calls == 2
+    assert raised[1] is not raised[0]
+    assert raised[1].__traceback__ is not None
+    assert str(raised[2]) == "used token"
+
+
+def test_cancelling_the_last_waiter_cancels_the_call():
+    """Test the call is cancelled only once no caller waits for it."""
+    single_flight = SingleFlight()
+    call = Counter(delay=10.0)
+
+    async def run():
+        first = asyncio.ensure_future(single_flight.do("token", call))
+        second = asyncio.ensure_future(single_flight.do("token", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        assert single_flight.in_flight == 1
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        await asyncio.sleep(0)
+        assert single_flight.in_flight == 0
+
+    asyncio.run(run())
+    assert call.calls == 1
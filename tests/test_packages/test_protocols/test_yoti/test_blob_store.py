@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""This module contains the tests of the blob store of the yoti protocol."""
+
+import os
+import time
+
+import pytest
+
+from packages.fetchai.protocols.yoti.blob_store import (
+    BlobNotFoundError,
+    BlobStore,
+    PINS_DIRECTORY,
+    iter_blob_refs,
+    offload,
+)
+from packages.fetchai.protocols.yoti.custom_types import BlobRef, ProfileInfo
+from packages.fetchai.protocols.yoti.message import YotiMessage
+from packages.fetchai.protocols.yoti.serialization import YotiSerializer
+
+from tests.test_packages.test_protocols.test_yoti.test_serialization import (
+    DIALOGUE_REFERENCE,
+)
+
+
+JPEG = b"\xff\xd8\xff" + b"selfie" * 100
+PNG = b"\x89PNG\r\n\x1a\n" + b"document" * 100
+HOLDER = "agent/fetchai/yoti_org:0.1.0"
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    """Get an empty blob store."""
+    return BlobStore(str(tmp_path / "blobs"))
+
+
+def age(blob_store: BlobStore, blob_ref: BlobRef, seconds: float) -> None:
+    """Make a blob look stored some seconds ago."""
+    path = blob_store._get_path(blob_ref.digest)
+    stored = time.time() - seconds
+    os.utime(path, (stored, stored))
+
+
+def test_put_and_get(blob_store):
+    """Test a stored value is read back through its reference."""
+    blob_ref = blob_store.put(JPEG)
+    assert len(blob_ref.digest) == 64
+    assert blob_ref.size == len(JPEG)
+    assert blob_ref.media_type == "image/jpeg"
+    assert blob_ref.store == blob_store.path
+    assert blob_ref in blob_store
+    assert blob_store.get(blob_ref) == JPEG
+    assert blob_store.put(PNG, "image/x-png").media_type == "image/x-png"
+
+
+def test_put_is_content_addressed(blob_store):
+    """Test storing a value twice writes it once."""
+    assert blob_store.put(JPEG) == blob_store.put(JPEG)
+    file_names = [
+        file_name
+        for _, _, file_names in os.walk(blob_store.path)
+        for file_name in file_names
+    ]
+    assert len(file_names) == 1
+
+
+def test_get_missing_blob(blob_store):
+    """Test reading a value not stored, or not whole, raises BlobNotFoundError."""
+    blob_ref = blob_store.put(JPEG)
+    with pytest.raises(BlobNotFoundError):
+        blob_store.get(BlobRef("ab" * 32, 10, store=blob_store.path))
+    with pytest.raises(BlobNotFoundError):
+        blob_store.get(BlobRef(blob_ref.digest, blob_ref.size + 1))
+
+
+def test_invalid_digest(blob_store):
+    """Test a digest which could name another file is rejected."""
+    with pytest.raises(ValueError, match="Invalid blob digest"):
+        blob_store.get(BlobRef("../../etc/passwd", 10))
+    with pytest.raises(ValueError, match="Invalid blob digest"):
+        blob_store.pin(BlobRef("../../etc/passwd", 10), HOLDER)
+
+
+def test_open_the_store_of_a_reference(blob_store):
+    """Test a reader opens the store from the reference, without being configured with its path."""
+    blob_ref = blob_store.put(JPEG)
+    assert BlobStore.of(blob_ref).path == blob_store.path
+    assert BlobStore.of(blob_ref).get(blob_ref) == JPEG
+    with pytest.raises(BlobNotFoundError):
+        BlobStore.of(BlobRef(blob_ref.digest, blob_ref.size))
+
+
+def test_prune(blob_store):
+    """Test prune removes the values stored more than 'max_age' seconds ago only."""
+    old_ref = blob_store.put(JPEG)
+    new_ref = blob_store.put(PNG)
+    age(blob_store, old_ref, 120)
+    assert blob_store.prune(60) == 1
+    assert old_ref not in blob_store
+    assert new_ref in blob_store
+
+
+def test_put_again_refreshes_the_age(blob_store):
+    """Test storing a value again keeps it from being pruned."""
+    blob_ref = blob_store.put(JPEG)
+    age(blob_store, blob_ref, 120)
+    blob_store.put(JPEG)
+    assert blob_store.prune(60) == 0
+    assert blob_ref in blob_store
+
+
+def test_prune_keeps_pinned_blobs(blob_store):
+    """Test prune keeps the values pinned, until they are unpinned."""
+    blob_ref = blob_store.put(JPEG)
+    blob_store.pin(blob_ref, HOLDER)
+    age(blob_store, blob_ref, 120)
+    assert blob_store.pinned() == {blob_ref.digest}
+    assert blob_store.prune(60) == 0
+    assert blob_store.get(blob_ref) == JPEG
+    blob_store.unpin(blob_ref, HOLDER)
+    assert blob_store.pinned() == set()
+    assert blob_store.prune(60) == 1
+    assert blob_ref not in blob_store
+
+
+def test_pins_by_holder(blob_store):
+    """Test a value stays pinned while a holder pins it."""
+    blob_ref = blob_store.put(JPEG)
+    age(blob_store, blob_ref, 120)
+    blob_store.pin(blob_ref, HOLDER)
+    blob_store.pin(blob_ref, HOLDER)
+    blob_store.pin(blob_ref, "other")
+    blob_store.unpin(blob_ref, HOLDER)
+    assert blob_store.prune(60) == 0
+    blob_store.unpin(blob_ref, "other")
+    blob_store.unpin(blob_ref, "other")
+    assert blob_store.prune(60) == 1
+
+
+def test_release(blob_store):
+    """Test releasing a holder unpins all its values, and only its values."""
+    jpeg_ref = blob_store.put(JPEG)
+    png_ref = blob_store.put(PNG)
+    blob_store.pin(jpeg_ref, HOLDER)
+    blob_store.pin(png_ref, HOLDER)
+    blob_store.pin(png_ref, "other")
+    blob_store.release(HOLDER)
+    blob_store.release("unknown")
+    assert blob_store.pinned() == {png_ref.digest}
+
+
+def test_pins_are_shared_through_the_directory(blob_store):
+    """Test the pins of a reader hold for the owner of the store, through its directory."""
+    blob_ref = blob_store.put(JPEG)
+    BlobStore.of(blob_ref).pin(blob_ref, HOLDER)
+    age(blob_store, blob_ref, 120)
+    assert blob_store.prune(60) == 0
+    assert os.path.isdir(os.path.join(blob_store.path, PINS_DIRECTORY))
+
+
+def test_offload(blob_store):
+    """Test offload replaces the large binary values, nested ones too, by references."""
+    values = {
+        "selfie": JPEG,
+        "thumbnail": b"small",
+        "document_details": {"document_images": (PNG, b"small")},
+        "full_name": "Jane Doe",
+    }
+    offloaded = offload(values, blob_store, 100)
+    assert isinstance(offloaded["selfie"], BlobRef)
+    assert offloaded["thumbnail"] == b"small"
+    assert offloaded["full_name"] == "Jane Doe"
+    document_images = offloaded["document_details"]["document_images"]
+    assert isinstance(document_images[0], BlobRef)
+    assert document_images[1] == b"small"
+    assert list(iter_blob_refs(offloaded)) == [
+        offloaded["selfie"],
+        document_images[0],
+    ]
+    assert blob_store.get(document_images[0]) == PNG
+
+
+def test_references_keep_their_store_when_encoded(blob_store):
+    """Test the references of a 'profile' message still open their store once decoded."""
+    info = ProfileInfo(offload({"selfie": JPEG}, blob_store, 100))
+    message = YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        info=info,
+    )
+    decoded = YotiSerializer.decode(YotiSerializer.encode(message))
+    blob_ref = decoded.info.get_blob("selfie")
+    assert blob_ref == info["selfie"]
+    assert BlobStore.of(blob_ref).get(blob_ref) == JPEG
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""This module contains the tests of the compression of the yoti messages."""
+
+import os
+import zlib
+
+import pytest
+
+from packages.fetchai.protocols.yoti.compression import (
+    COMPRESSED_FLAG,
+    COMPRESSION_ZLIB,
+    available_compressions,
+    choose_compression,
+    compress,
+    decompress,
+)
+from packages.fetchai.protocols.yoti.custom_types import (
+    ProfileInfo,
+    ProfileResult,
+    ProfileResults,
+)
+from packages.fetchai.protocols.yoti.message import YotiMessage
+from packages.fetchai.protocols.yoti.serialization import YotiSerializer
+
+from tests.test_packages.test_protocols.test_yoti.test_serialization import (
+    DIALOGUE_REFERENCE,
+    get_content,
+)
+
+
+# a profile compressing well, over the minimum size
+INFO = {
+    "address_{}".format(index): "1 Main Street, Cambridge, CB1 1AA, United Kingdom"
+    for index in range(500)
+}
+
+
+def make_profile(**contents) -> YotiMessage:
+    """Make a 'profile' message with the given contents besides its info."""
+    return YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        info=ProfileInfo(INFO),
+        **contents
+    )
+
+
+def test_choose_compression():
+    """Test the first compression accepted and available is chosen."""
+    assert choose_compression(None) is None
+    assert choose_compression(()) is None
+    assert choose_compression(("brotli",)) is None
+    assert choose_compression(("brotli", COMPRESSION_ZLIB)) == COMPRESSION_ZLIB
+    assert COMPRESSION_ZLIB in available_compressions()
+
+
+def test_compress_round_trip():
+    """Test a content compressed is flagged and decompresses to itself."""
+    content = b"\x0a" + b"profile" * 5000
+    compressed = compress(content, COMPRESSION_ZLIB, 0)
+    assert compressed[:1] == COMPRESSED_FLAG
+    assert len(compressed) < len(content)
+    assert decompress(compressed) == content
+
+
+@pytest.mark.parametrize(
+    "content, compression, min_size",
+    [
+        (b"\x0a" + b"profile" * 5000, COMPRESSION_ZLIB, 100000),
+        (b"\x0a" + b"profile" * 5000, "brotli", 0),
+        (b"\x0a" + os.urandom(50000), COMPRESSION_ZLIB, 0),
+    ],
+    ids=["under_min_size", "not_available", "not_compressible"],
+)
+def test_content_left_uncompressed(content, compression, min_size):
+    """Test the content is left as is when compressing is not worth it or not possible."""
+    assert compress(content, compression, min_size) == content
+    assert decompress(content) == content
+
+
+def test_decompress_unsupported_compression():
+    """Test a content flagged with an unknown compression is refused."""
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        decompress(COMPRESSED_FLAG + b"\xff" + zlib.compress(b"profile"))
+
+
+def test_profile_with_compression_is_compressed():
+    """Test the content of a 'profile' message with a compression is compressed, and decodes to the message."""
+    message = make_profile(compression=COMPRESSION_ZLIB, compression_min_size=1024)
+    encoded = YotiSerializer.encode(message)
+    assert get_content(encoded)[:1] == COMPRESSED_FLAG
+    assert len(encoded) < len(YotiSerializer.encode(make_profile())) / 2
+    decoded = YotiSerializer.decode(encoded)
+    assert decoded.compression == COMPRESSION_ZLIB
+    assert decoded.compression_min_size == 1024
+    assert not decoded.info.is_parsed
+    assert decoded == message
+
+
+def test_profile_without_compression_is_not_compressed():
+    """Test the content of a 'profile' message is only compressed with a compression, from its minimum size."""
+    for message in (
+        make_profile(),
+        make_profile(compression="brotli"),
+        make_profile(compression=COMPRESSION_ZLIB, compression_min_size=10**9),
+    ):
+        encoded = YotiSerializer.encode(message)
+        assert get_content(encoded)[:1] != COMPRESSED_FLAG
+        assert YotiSerializer.decode(encoded) == message
+
+
+def test_compression_min_size_defaults():
+    """Test a 'profile' message with a compression and no minimum size is compressed from 16384 bytes."""
+    small = YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        info=ProfileInfo({"remember_me_id": "id" * 1000}),
+        compression=COMPRESSION_ZLIB,
+    )
+    assert get_content(YotiSerializer.encode(small))[:1] != COMPRESSED_FLAG
+    message = make_profile(compression=COMPRESSION_ZLIB)
+    assert get_content(YotiSerializer.encode(message))[:1] == COMPRESSED_FLAG
+
+
+def test_profiles_with_compression_are_compressed():
+    """Test the content of a 'profiles' message with a compression is compressed, and decodes to the message."""
+    message = YotiMessage(
+        performative=YotiMessage.Performative.PROFILES,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        results=ProfileResults(
+            [ProfileResult("token-{}".format(index), info=INFO) for index in range(3)]
+        ),
+        compression=COMPRESSION_ZLIB,
+        compression_min_size=1024,
+    )
+    encoded = YotiSerializer.encode(message)
+    assert get_content(encoded)[:1] == COMPRESSED_FLAG
+    decoded = YotiSerializer.decode(encoded)
+    assert decoded == message
+    assert decoded.compression == COMPRESSION_ZLIB
+    assert decoded.compression_min_size == 1024
+
+
+def test_forwarded_info_leaves_the_compression_behind():
+    """Test the info of a decoded 'profile', forwarded unparsed, does not carry the compression of its message."""
+    decoded = YotiSerializer.decode(
+        YotiSerializer.encode(make_profile(compression=COMPRESSION_ZLIB))
+    )
+    forwarded = YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        info=decoded.info,
+    )
+    encoded = YotiSerializer.encode(forwarded)
+    assert not decoded.info.is_parsed
+    assert get_content(encoded) == get_content(YotiSerializer.encode(make_profile()))
+    assert not YotiSerializer.decode(encoded).is_set("compression")
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [{"compression": b"zlib"}, {"compression_min_size": -1}],
+    ids=["compression_not_str", "negative_min_size"],
+)
+def test_invalid_compression_contents(contents):
+    """Test the compression contents are checked."""
+    assert not make_profile(**contents)._is_consistent()
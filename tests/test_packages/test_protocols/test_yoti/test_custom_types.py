@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the lazy decoding of the profile info of the yoti protocol."""
+
+from packages.fetchai.protocols.yoti.custom_types import ProfileInfo
+from packages.fetchai.protocols.yoti.message import YotiMessage
+from packages.fetchai.protocols.yoti.serialization import YotiSerializer
+
+from tests.test_packages.test_protocols.test_yoti.test_serialization import (
+    DIALOGUE_REFERENCE,
+    INFO,
+)
+
+
+def decode_profile() -> ProfileInfo:
+    """Encode a 'profile' message and get the info of its decoding."""
+    message = YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        info=ProfileInfo(INFO),
+    )
+    return YotiSerializer.decode(YotiSerializer.encode(message)).info
+
+
+def test_info_is_not_parsed_on_decode():
+    """Test decoding a message keeps its info encoded."""
+    info = decode_profile()
+    assert not info.is_parsed
+    assert repr(info).endswith("not parsed>)")
+
+
+def test_info_is_parsed_on_first_access():
+    """Test the info is parsed when an attribute is read, and only once."""
+    info = decode_profile()
+    assert info["age"] == 31
+    assert info.is_parsed
+    values = info._values
+    assert info.get_str("remember_me_id") == "id"
+    assert info._values is values
+    assert info._content is None
+    assert dict(info) == INFO
+
+
+def test_iteration_parses_the_info():
+    """Test the attribute names and number are read from the parsed info."""
+    info = decode_profile()
+    assert len(info) == len(INFO)
+    assert info.is_parsed
+    assert set(info) == set(INFO)
+
+
+def test_forwarding_does_not_parse_the_info():
+    """Test a message whose info is never read is encoded again unparsed."""
+    info = decode_profile()
+    forwarded = YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        info=info,
+    )
+    encoded = YotiSerializer.encode(forwarded)
+    assert not info.is_parsed
+    assert dict(YotiSerializer.decode(encoded).info) == INFO
+
+
+def test_info_from_values_is_parsed():
+    """Test an info built from its values needs no parsing."""
+    info = ProfileInfo(INFO)
+    assert info.is_parsed
+    assert info == decode_profile()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the messages of the yoti protocol."""
+
+import pytest
+
+from packages.fetchai.protocols.yoti.custom_types import (
+    ProfileInfo,
+    ProfileResult,
+    ProfileResults,
+)
+from packages.fetchai.protocols.yoti.message import YotiMessage
+from packages.fetchai.protocols.yoti.serialization import YotiSerializer
+
+
+def make_get_profile(**kwargs) -> YotiMessage:
+    """Make a 'get_profile' message."""
+    return YotiMessage(
+        performative=YotiMessage.Performative.GET_PROFILE,
+        token="token",
+        dotted_path="",
+        args=(),
+        **kwargs
+    )
+
+
+@pytest.mark.parametrize("timeout", [5, 0.1, 2.5])
+def test_timeout_accepts_positive_numbers(timeout):
+    """Test the timeout is a positive number of seconds, kept as a double."""
+    message = make_get_profile(timeout=timeout)
+    assert message._is_consistent()
+    decoded = YotiSerializer.decode(YotiSerializer.encode(message))
+    assert decoded.timeout == timeout
+    assert type(decoded.timeout) == float
+
+
+@pytest.mark.parametrize("timeout", [0, 0.0, -1.0, True, "5"])
+def test_timeout_rejects_other_values(timeout):
+    """Test a timeout which is not a positive number is inconsistent."""
+    assert not make_get_profile(timeout=timeout)._is_consistent()
+
+
+def make_profile(info: ProfileInfo) -> YotiMessage:
+    """Make a 'profile' message."""
+    return YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=("starter", "responder"),
+        message_id=2,
+        target=1,
+        info=info,
+    )
+
+
+@pytest.mark.parametrize(
+    "values",
+    [{"age": object()}, {"address": {"lines": [None]}}, {1: "one"}],
+    ids=["object", "nested", "key"],
+)
+def test_info_values_are_checked(values):
+    """Test a profile info with values the protocol cannot carry is inconsistent."""
+    assert make_profile(ProfileInfo({"age": 31}))._is_consistent()
+    assert not make_profile(ProfileInfo(values))._is_consistent()
+    profiles = YotiMessage(
+        performative=YotiMessage.Performative.PROFILES,
+        dialogue_reference=("starter", "responder"),
+        message_id=2,
+        target=1,
+        results=ProfileResults(
+            [ProfileResult("a", info=values), ProfileResult("b", error_code=504)]
+        ),
+    )
+    assert not profiles._is_consistent()
+
+
+def test_decoded_info_is_checked_without_parsing():
+    """Test the info of a decoded message is valid without being parsed."""
+    message = make_profile(ProfileInfo({"age": 31}))
+    decoded = YotiSerializer.decode(YotiSerializer.encode(message))
+    assert decoded._is_consistent()
+    assert not decoded.info.is_parsed
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the serialization of the yoti protocol."""
+
+import datetime
+
+import pytest
+
+from aea.mail.base_pb2 import Message as ProtobufMessage
+
+from packages.fetchai.protocols.yoti import yoti_pb2
+from packages.fetchai.protocols.yoti.custom_types import (
+    BlobRef,
+    ProfileInfo,
+    ProfileResult,
+    ProfileResults,
+)
+from packages.fetchai.protocols.yoti.message import YotiMessage
+from packages.fetchai.protocols.yoti.serialization import YotiSerializer
+
+
+DIALOGUE_REFERENCE = ("starter", "responder")
+INFO = {
+    "remember_me_id": "id",
+    "age": 31,
+    "age_over:18": True,
+    "score": 0.5,
+    "date_of_birth": datetime.date(1990, 2, 3),
+    "selfie": b"\xff\xd8image",
+    "structured_postal_address": {"country": "UK", "lines": ("a", "b")},
+    "document_images": (b"front", BlobRef("ab" * 32, 1024, "image/jpeg")),
+    "document": BlobRef("cd" * 32, 2048),
+}
+
+MESSAGES = [
+    YotiMessage(
+        performative=YotiMessage.Performative.GET_PROFILE,
+        dialogue_reference=("starter", ""),
+        token="token",
+        dotted_path="get_attribute",
+        args=("given_names",),
+    ),
+    YotiMessage(
+        performative=YotiMessage.Performative.GET_PROFILE,
+        dialogue_reference=("starter", ""),
+        token="token",
+        dotted_path="",
+        args=(),
+        timeout=2.5,
+        attributes=("selfie",),
+        scenario="age",
+        accept_compression=("zlib",),
+    ),
+    YotiMessage(
+        performative=YotiMessage.Performative.GET_PROFILES,
+        dialogue_reference=("starter", ""),
+        tokens=("a", "b"),
+        dotted_path="",
+        args=(),
+        timeout=10.0,
+        attributes=("age_over:18",),
+        scenario="age",
+        accept_compression=("zlib",),
+    ),
+    YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        info=ProfileInfo(INFO),
+    ),
+    YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        info=ProfileInfo(INFO),
+        compression="zlib",
+        compression_min_size=0,
+    ),
+    YotiMessage(
+        performative=YotiMessage.Performative.PROFILES,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        results=ProfileResults(
+            [
+                ProfileResult("a", info=INFO),
+                ProfileResult("b", error_code=504, error_msg="Timed out."),
+            ]
+        ),
+    ),
+    YotiMessage(
+        performative=YotiMessage.Performative.PROFILES,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        results=ProfileResults([ProfileResult("a", info=INFO)]),
+        compression="zlib",
+        compression_min_size=16384,
+    ),
+    YotiMessage(
+        performative=YotiMessage.Performative.ERROR,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        error_code=400,
+        error_msg="Dotted path not allowed.",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "message", MESSAGES, ids=[message.performative.value for message in MESSAGES]
+)
+def test_round_trip(message):
+    """Test every performative decodes to the message it was encoded from."""
+    decoded = YotiSerializer.decode(YotiSerializer.encode(message))
+    assert decoded == message
+    assert decoded.performative == message.performative
+    assert decoded.dialogue_reference == message.dialogue_reference
+    for name, value in message._body.items():
+        assert decoded.get(name) == value
+
+
+def test_performative_field_numbers():
+    """Test the performatives keep their field numbers, the new ones coming after."""
+    fields = yoti_pb2.YotiMessage.DESCRIPTOR.fields_by_name
+    assert {name: fields[name].number for name in fields} == {
+        "error": 5,
+        "get_profile": 6,
+        "profile": 7,
+        "get_profiles": 8,
+        "profiles": 9,
+    }
+
+
+def make_profile(info) -> YotiMessage:
+    """Make a 'profile' message."""
+    return YotiMessage(
+        performative=YotiMessage.Performative.PROFILE,
+        dialogue_reference=DIALOGUE_REFERENCE,
+        message_id=2,
+        target=1,
+        info=ProfileInfo(info),
+    )
+
+
+def get_content(message_bytes: bytes) -> bytes:
+    """Get the content of an encoded message."""
+    message_pb = ProtobufMessage()
+    message_pb.ParseFromString(message_bytes)
+    return message_pb.dialogue_message.content
+
+
+def test_profile_field_numbers():
+    """Test the info of a 'profile' is flattened, its strings in the 'info' map of 0.1.0."""
+    fields = yoti_pb2.YotiMessage.Profile_Performative.DESCRIPTOR.fields_by_name
+    assert {name: fields[name].number for name in fields} == {
+        "info": 1,
+        "int_values": 2,
+        "bool_values": 3,
+        "float_values": 4,
+        "date_values": 5,
+        "bytes_values": 6,
+        "struct_values": 7,
+        "list_values": 8,
+        "blob_values": 9,
+        "compression": 10,
+        "compression_is_set": 11,
+        "compression_min_size": 12,
+        "compression_min_size_is_set": 13,
+    }
+    value_fields = fields["info"].message_type.fields_by_name
+    assert value_fields["value"].type == value_fields["value"].TYPE_STRING
+
+
+def test_string_profile_is_encoded_as_in_0_1_0():
+    """Test a profile of strings is encoded to the bytes of 0.1.0."""
+    info = {"remember_me_id": "id"}
+    legacy = yoti_pb2.YotiMessage()
+    legacy.profile.info.update(info)
+    content = get_content(YotiSerializer.encode(make_profile(info)))
+    assert content == legacy.SerializeToString()
+    info = {"remember_me_id": "id", "given_names": "Ada"}
+    legacy.profile.info.update(info)
+    content = get_content(YotiSerializer.encode(make_profile(info)))
+    parsed = yoti_pb2.YotiMessage()
+    parsed.ParseFromString(content)
+    assert parsed == legacy
+    assert dict(ProfileInfo.from_content(legacy.SerializeToString())) == info
+
+
+def test_typed_profile_keeps_its_strings_in_the_legacy_map():
+    """Test a 0.1.0 agent reads the string attributes of a typed profile."""
+    content = get_content(YotiSerializer.encode(make_profile(INFO)))
+    yoti_pb = yoti_pb2.YotiMessage()
+    yoti_pb.ParseFromString(content)
+    assert dict(yoti_pb.profile.info) == {"remember_me_id": "id"}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "text",
+        31,
+        -1,
+        True,
+        0.5,
+        datetime.date(1969, 12, 31),
+        b"\x00bytes",
+        {"country": "UK", "postal_code": 12345},
+        ("a", 1, False, ("nested",), {"key": "value"}),
+        BlobRef("ef" * 32, 4096, "image/png"),
+    ],
+    ids=[
+        "str",
+        "int",
+        "negative",
+        "bool",
+        "float",
+        "date",
+        "bytes",
+        "struct",
+        "list",
+        "blob",
+    ],
+)
+def test_typed_values_round_trip(value):
+    """Test each type of attribute value decodes to its value and type."""
+    decoded = YotiSerializer.decode(YotiSerializer.encode(make_profile({"a": value})))
+    assert decoded.info["a"] == value
+    assert type(decoded.info["a"]) == type(value)
+
+
+def test_unparsed_profile_is_forwarded_as_is():
+    """Test encoding the decoded profile again, unparsed, gives the same content."""
+    encoded = YotiSerializer.encode(make_profile(INFO))
+    decoded = YotiSerializer.decode(encoded)
+    assert not decoded.info.is_parsed
+    assert get_content(YotiSerializer.encode(decoded)) == get_content(encoded)
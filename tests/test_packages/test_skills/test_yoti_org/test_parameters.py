@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""This module contains the tests of the parameters of the yoti_org skill."""
+
+import logging
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from aea.configurations.base import PublicId
+
+from packages.fetchai.protocols.yoti.blob_store import BlobStore
+from packages.fetchai.protocols.yoti.custom_types import BlobRef, ProfileInfo
+from packages.fetchai.skills.yoti_org.parameters import Parameters
+
+
+JPEG = b"\xff\xd8\xff" + b"selfie" * 100
+PNG = b"\x89PNG\r\n\x1a\n" + b"document" * 100
+
+
+def make_parameters() -> Parameters:
+    """Get the parameters of the skill, in a stub skill context."""
+    skill_context = SimpleNamespace(
+        agent_address="agent",
+        skill_id=PublicId.from_str("fetchai/yoti_org:0.1.0"),
+        logger=logging.getLogger("yoti_org"),
+    )
+    return Parameters(
+        name="parameters",
+        skill_context=skill_context,
+        yoti_scenario_id="scenario_id",
+        yoti_client_sdk_id="client_sdk_id",
+        yoti_scenario_name="identity",
+    )
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    """Get the blob store of the yoti connection."""
+    return BlobStore(str(tmp_path / "blobs"))
+
+
+def prune_all(blob_store: BlobStore) -> int:
+    """Prune all the values of a blob store which are not pinned."""
+    for directory, _, file_names in os.walk(blob_store.path):
+        for file_name in file_names:
+            os.utime(os.path.join(directory, file_name), (0, 0))
+    return blob_store.prune(time.time() / 2)
+
+
+def test_get_binary_attribute(blob_store):
+    """Test the binary attributes are read from the message, or from the blob store of their reference."""
+    parameters = make_parameters()
+    info = ProfileInfo(
+        {"selfie": blob_store.put(JPEG), "document": PNG, "full_name": "Jane Doe"}
+    )
+    assert parameters.get_binary_attribute(info, "selfie") == (JPEG, "image/jpeg")
+    assert parameters.get_binary_attribute(info, "document") == (PNG, "image/png")
+    assert parameters.get_binary_attribute(info, "full_name") is None
+    assert parameters.get_binary_attribute(info, "missing") is None
+
+
+def test_get_missing_binary_attribute(blob_store):
+    """Test a binary attribute whose blob is gone, or which has no store, is not found."""
+    parameters = make_parameters()
+    blob_ref = blob_store.put(JPEG)
+    info = ProfileInfo(
+        {
+            "pruned": BlobRef("ab" * 32, 10, store=blob_store.path),
+            "no_store": BlobRef(blob_ref.digest, blob_ref.size),
+        }
+    )
+    assert parameters.get_binary_attribute(info, "pruned") is None
+    assert parameters.get_binary_attribute(info, "no_store") is None
+
+
+def test_set_profile_pins_the_blobs(blob_store):
+    """Test the blobs of the profiles in the db are not pruned, and are once the profiles are replaced."""
+    parameters = make_parameters()
+    selfie = blob_store.put(JPEG)
+    document = blob_store.put(PNG)
+    parameters.set_profile(
+        "address", ProfileInfo({"selfie": selfie, "document": {"images": (document,)}})
+    )
+    assert parameters.db["address"]["selfie"] == selfie
+    assert prune_all(blob_store) == 0
+    parameters.set_profile("address", ProfileInfo({"selfie": selfie}))
+    assert prune_all(blob_store) == 1
+    assert selfie in blob_store
+    assert document not in blob_store
+
+
+def test_blobs_referenced_twice_stay_pinned(blob_store):
+    """Test a blob stays pinned while a profile of the db references it."""
+    parameters = make_parameters()
+    selfie = blob_store.put(JPEG)
+    parameters.set_profile("address", ProfileInfo({"selfie": selfie}))
+    parameters.set_profile("other_address", ProfileInfo({"selfie": selfie}))
+    parameters.set_profile("address", ProfileInfo({}))
+    assert prune_all(blob_store) == 0
+    parameters.set_profile("other_address", ProfileInfo({}))
+    assert prune_all(blob_store) == 1
+
+
+def test_teardown_unpins_the_blobs(blob_store):
+    """Test the blobs are unpinned when the skill is torn down, its db being dropped."""
+    parameters = make_parameters()
+    parameters.set_profile("address", ProfileInfo({"selfie": blob_store.put(JPEG)}))
+    parameters.teardown()
+    assert blob_store.pinned() == set()
+    assert prune_all(blob_store) == 1
+
+
+def test_stale_pins_are_released(blob_store):
+    """Test the pins left by a previous run of the skill are released on first use of the store."""
+    selfie = blob_store.put(JPEG)
+    document = blob_store.put(PNG)
+    make_parameters().set_profile("address", ProfileInfo({"document": document}))
+    parameters = make_parameters()
+    parameters.set_profile("address", ProfileInfo({"selfie": selfie}))
+    assert blob_store.pinned() == {selfie.digest}